@@ -0,0 +1,44 @@
+#! /usr/bin/python3
+
+##--------------------------------------------------------------------\
+#   pso_python
+#   '.src/ackley/func_F.py'
+#   Ackley function, N-dimensional. A nearly flat outer region with many
+#       local minima, and a deep well at the origin.
+#       func_F takes one position, func_F_batch an (N, IN_VARS) array
+#
+#   Author(s): Lauren Linkous, Jonathan Lundquist
+#   Last update: October 18, 2026
+##--------------------------------------------------------------------\
+
+import numpy as np
+
+def func_F(X, NO_OF_OUTS=1):
+    F = np.zeros((NO_OF_OUTS))
+    noErrors = True
+    try:
+        x = np.array(X, dtype=float).reshape(-1)
+        F[0] = -20*np.exp(-0.2*np.sqrt(np.mean(x**2))) - np.exp(np.mean(np.cos(2*np.pi*x))) + 20 + np.e
+    except:
+        noErrors = False
+
+    return F, noErrors
+
+
+def func_F_batch(X, NO_OF_OUTS=1):
+    # vectorized objective. X is (N, IN_VARS), F is (N, NO_OF_OUTS)
+    # noErrors is a per-row flag so one bad row does not discard the batch
+    X = np.atleast_2d(X)
+    F = np.zeros((np.shape(X)[0], NO_OF_OUTS))
+    noErrors = np.zeros(np.shape(X)[0], dtype=bool)
+    try:
+        with np.errstate(all='ignore'):
+            F[:, 0] = -20*np.exp(-0.2*np.sqrt(np.mean(X**2, axis=1))) \
+                - np.exp(np.mean(np.cos(2*np.pi*X), axis=1)) + 20 + np.e
+        noErrors = np.all(np.isfinite(F), axis=1)
+    except:
+        pass
+
+    return F, noErrors
+
+func_F_batch.vectorized = True
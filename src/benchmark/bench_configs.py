@@ -0,0 +1,55 @@
+#! /usr/bin/python3
+
+##--------------------------------------------------------------------\
+#   pso_python
+#   './pso_python/src/benchmark/bench_configs.py'
+#   Case matrix for run_benchmark.py. Every combination of problem,
+#       dimension, mode, particle count, boundary and seed is one
+#       benchmark case.
+#       Change these lists to narrow or widen a run, and keep them
+#       fixed between runs that are compared against a baseline.
+#
+#   Author(s): Jonathan Lundquist, Lauren Linkous
+#   Last update: October 18, 2026
+##--------------------------------------------------------------------\
+
+
+# problems, by name in the PROBLEMS registry of swarm_runner.py.
+# The bundled problems cover 1, 2 and 3 input dimensions. The scalable
+# problems run once for each entry of DIMENSIONS
+PROBLEMS = ['one_dim_x_test', 'himmelblau', 'lundquist_3_var',
+            'rastrigin', 'rosenbrock', 'ackley', 'griewank',
+            'zdt1', 'zdt2', 'zdt3', 'dtlz1', 'dtlz2']
+DIMENSIONS = [10, 30, 100]     # input variables of the scalable problems. None keeps IN_VARS of the package
+
+MODES = ["sequential", "batch"]
+PARTICLE_COUNTS = [10, 100, 1000, 10000]
+BOUNDARIES = [1, 2, 3, 4]      # 1 = random, 2 = reflecting, 3 = absorbing, 4 = invisible
+SEEDS = [1, 2, 3]
+
+MAXIT_SWEEPS = 50              # maxit = MAXIT_SWEEPS*NO_OF_PARTICLES
+SEQUENTIAL_MAX_PARTICLES = 1000  # larger sequential cases are skipped, they only time the driver loop
+USE_BATCH_FUNCS = True         # batch mode uses OBJECTIVE_FUNC_BATCH/CONSTR_FUNC_BATCH
+MEASURE_MEMORY = True          # repeat each case under tracemalloc for the peak memory
+REPEATS = 3                    # timed runs per case, the fastest is kept
+
+# optimizer constants, as in main_test.py
+T_MOD = 0.65
+WEIGHTS = [[0.5, 0.7, 0.78]]
+VLIM = 1
+DECIMAL_LIMIT = 5
+
+# expensive objective functions, such as simulations. Every objective call
+# sleeps EXPENSIVE_DELAY seconds per position on top of the problem function.
+# The 'parallel' mode runs run_parallel() on a pool of PARALLEL_WORKERS threads.
+# These cases use the first boundary and seed. None skips them
+EXPENSIVE_DELAY = 0.001
+EXPENSIVE_PROBLEMS = ['rastrigin', 'zdt1']
+EXPENSIVE_DIMENSIONS = [30]
+EXPENSIVE_MODES = ["sequential", "batch", "parallel"]
+EXPENSIVE_PARTICLE_COUNTS = [10, 100]
+EXPENSIVE_MAXIT_SWEEPS = 10    # maxit = EXPENSIVE_MAXIT_SWEEPS*NO_OF_PARTICLES
+PARALLEL_WORKERS = 8
+
+# comparison against a baseline
+TIME_REGRESSION = 0.10         # flag cases more than 10% slower per iteration
@@ -0,0 +1,237 @@
+#! /usr/bin/python3
+
+##--------------------------------------------------------------------\
+#   pso_python
+#   './pso_python/src/benchmark/run_benchmark.py'
+#   Headless benchmark of the 'swarm' class in particle_swarm.py over the
+#       case matrix in bench_configs.py, including higher dimensional
+#       problems and an expensive objective. Writes one JSON record per case
+#       (wall time per iteration, evaluations to tolerance, final
+#       convergence data, peak memory) and optionally compares the
+#       results against a stored baseline file.
+#
+#       python benchmark/run_benchmark.py --output bench.json
+#       python benchmark/run_benchmark.py --output new.json --baseline bench.json
+#       python benchmark/run_benchmark.py --quick --problems rastrigin zdt1 --dims 30 100
+#
+#   Author(s): Jonathan Lundquist, Lauren Linkous
+#   Last update: October 18, 2026
+##--------------------------------------------------------------------\
+
+
+import os
+import sys
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import argparse
+import itertools
+import json
+import platform
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+import pandas as pd
+import swarm_runner as runner
+import bench_configs as bc
+
+
+def case_key(case):
+    problem = case['problem']
+    if case['dims'] != None:
+        problem = "%s/D%d" % (problem, case['dims'])
+    key = "%s/%s/N%d/B%d/S%d" % (problem, case['mode'], case['particles'],
+                                 case['boundary'], case['seed'])
+    if case['delay'] > 0:
+        key = key + "/T%g" % case['delay']
+    return key
+
+
+def build_cases(problems, modes, particle_counts, boundaries, seeds, dimensions=[None], delay=0):
+    # 'dimensions' applies to the scalable problems, the others keep their inputs.
+    # 'delay' is the sleep added per evaluated position, see delayed_objective
+    cases = []
+    for problem in problems:
+        problem_dims = [None]
+        if runner.PROBLEMS[problem].get('min_dims') != None:
+            problem_dims = dimensions
+        for dims, mode, N, boundary, seed in itertools.product(problem_dims, modes, particle_counts,
+                                                                  boundaries, seeds):
+            if (mode != "batch") and (N > bc.SEQUENTIAL_MAX_PARTICLES):
+                continue
+            cases.append({'problem': problem, 'dims': dims, 'mode': mode, 'particles': N,
+                          'boundary': boundary, 'seed': seed, 'delay': delay})
+    return cases
+
+
+class delayed_objective:
+    # objective function that sleeps 'delay' seconds per evaluated position, a
+    # stand-in for an expensive simulation. Sleeping releases the GIL, as
+    # waiting on an outside program does, so a thread pool overlaps the calls
+    def __init__(self, func, delay):
+        self.func = func
+        self.delay = delay
+        self.vectorized = getattr(func, 'vectorized', False)
+
+    def __call__(self, X, NO_OF_OUTS):
+        rows = 1
+        if self.vectorized == True:
+            rows = np.shape(X)[0]
+        time.sleep(self.delay*rows)
+        return self.func(X, NO_OF_OUTS)
+
+
+def make_swarm(case):
+    # 'parallel' cases are sequential mode swarms driven by run_parallel()
+    params = {'NO_OF_PARTICLES': case['particles'],
+              'T_MOD': bc.T_MOD,
+              'BOUNDARY': case['boundary'],
+              'WEIGHTS': bc.WEIGHTS,
+              'VLIM': bc.VLIM}
+    sweeps = bc.MAXIT_SWEEPS
+    if case['delay'] > 0:
+        sweeps = bc.EXPENSIVE_MAXIT_SWEEPS
+    mode = case['mode']
+    if mode == "parallel":
+        mode = "sequential"
+    myOptimizer = runner.problem_swarm(case['problem'], params, sweeps*case['particles'],
+                                       mode=mode, seed=case['seed'],
+                                       decimal_limit=bc.DECIMAL_LIMIT,
+                                       batch_funcs=bc.USE_BATCH_FUNCS,
+                                       dims=case['dims'])
+    if case['delay'] > 0:
+        myOptimizer.obj_func = delayed_objective(myOptimizer.obj_func, case['delay'])
+    return myOptimizer, runner.load_problem(case['problem'], case['dims']).IN_VARS
+
+
+def drive(myOptimizer, case):
+    if case['mode'] == "parallel":
+        with ThreadPoolExecutor(bc.PARALLEL_WORKERS) as executor:
+            myOptimizer.run_parallel(executor)
+    else:
+        runner.run_swarm(myOptimizer)
+
+
+def run_case(case, measure_memory=True, repeats=bc.REPEATS):
+    # the fastest of 'repeats' identical runs is kept, to reduce timing noise
+    wall_time = None
+    for i in range(0, max(int(repeats), 1)):
+        myOptimizer, dims = make_swarm(case)
+        start = time.perf_counter()
+        drive(myOptimizer, case)
+        elapsed = time.perf_counter() - start
+        if (wall_time == None) or (elapsed < wall_time):
+            wall_time = elapsed
+
+    iterations, evaluation = myOptimizer.get_convergence_data()
+    converged = bool(myOptimizer.converged())
+    result = dict(case)
+    result.update({'key': case_key(case),
+                   'dimensions': int(dims),
+                   'iterations': int(iterations),
+                   'final_eval': float(evaluation),
+                   'converged': converged,
+                   'evals_to_tol': int(iterations) if converged else None,
+                   'wall_time': wall_time,
+                   'time_per_iteration': wall_time/max(int(iterations), 1),
+                   'peak_memory': None})
+
+    if measure_memory:
+        # separate run, tracemalloc slows the timed loop down.
+        # The seed makes it the same run
+        tracemalloc.start()
+        myOptimizer, dims = make_swarm(case)
+        drive(myOptimizer, case)
+        result['peak_memory'] = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    return result
+
+
+def run_suite(cases, measure_memory=True, verbose=True):
+    results = []
+    for i in range(0, len(cases)):
+        result = run_case(cases[i], measure_memory)
+        results.append(result)
+        if verbose:
+            print("[%d/%d] %-40s iter %8d  eval %.3e  %.2f us/iter" % (
+                i + 1, len(cases), result['key'], result['iterations'],
+                result['final_eval'], 1e6*result['time_per_iteration']))
+    return {'meta': {'python': platform.python_version(),
+                     'numpy': np.__version__,
+                     'pandas': pd.__version__,
+                     'platform': platform.platform(),
+                     'date': time.strftime("%Y-%m-%d %H:%M:%S")},
+            'results': results}
+
+
+def compare_to_baseline(report, baseline, time_regression=bc.TIME_REGRESSION):
+    # returns a list of (key, message) for cases that got slower or changed result.
+    # Cases missing from either file are skipped
+    old = {r['key']: r for r in baseline['results']}
+    changes = []
+    for new in report['results']:
+        prev = old.get(new['key'])
+        if prev == None:
+            continue
+        ratio = new['time_per_iteration']/max(prev['time_per_iteration'], 1e-12)
+        if ratio > 1 + time_regression:
+            changes.append((new['key'], "slower: %.2fx time per iteration" % ratio))
+        if (new['iterations'] != prev['iterations']) or (new['final_eval'] != prev['final_eval']):
+            changes.append((new['key'], "result changed: iter %d -> %d, eval %.3e -> %.3e" % (
+                prev['iterations'], new['iterations'], prev['final_eval'], new['final_eval'])))
+    return changes
+
+
+def summarize(report, baseline=None):
+    df = pd.DataFrame(report['results'])
+    groups = ['problem', 'dimensions', 'delay', 'mode', 'particles']
+    summary = df.groupby(groups)[['time_per_iteration', 'iterations']].median()
+    if baseline != None:
+        old = pd.DataFrame(baseline['results']).set_index('key')['time_per_iteration']
+        df['speedup'] = df['key'].map(old)/df['time_per_iteration']
+        summary['speedup'] = df.groupby(groups)['speedup'].median()
+    return summary
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="pso_python benchmark")
+    parser.add_argument('--output', default='benchmark_results.json', help="results file")
+    parser.add_argument('--baseline', default=None, help="results file to compare against")
+    parser.add_argument('--quick', action='store_true', help="10 and 100 particles, first seed and dimension only")
+    parser.add_argument('--problems', nargs='+', default=bc.PROBLEMS, help="problems to run")
+    parser.add_argument('--dims', nargs='+', type=int, default=bc.DIMENSIONS, help="inputs of the scalable problems")
+    parser.add_argument('--no-memory', action='store_true', help="skip the tracemalloc runs")
+    args = parser.parse_args()
+
+    particle_counts = bc.PARTICLE_COUNTS
+    seeds = bc.SEEDS
+    dimensions = args.dims
+    if args.quick:
+        particle_counts = [N for N in bc.PARTICLE_COUNTS if N <= 100]
+        seeds = bc.SEEDS[:1]
+        dimensions = dimensions[:1]
+    cases = build_cases(args.problems, bc.MODES, particle_counts, bc.BOUNDARIES, seeds, dimensions)
+    if bc.EXPENSIVE_DELAY != None:
+        expensive = [problem for problem in bc.EXPENSIVE_PROBLEMS if problem in args.problems]
+        cases = cases + build_cases(expensive, bc.EXPENSIVE_MODES, bc.EXPENSIVE_PARTICLE_COUNTS,
+                                    bc.BOUNDARIES[:1], bc.SEEDS[:1], bc.EXPENSIVE_DIMENSIONS,
+                                    bc.EXPENSIVE_DELAY)
+
+    report = run_suite(cases, bc.MEASURE_MEMORY and not args.no_memory)
+    with open(args.output, 'w') as f:
+        json.dump(report, f, indent=1)
+    print("results written to " + args.output)
+
+    baseline = None
+    if args.baseline != None:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+    print(summarize(report, baseline))
+
+    if baseline != None:
+        changes = compare_to_baseline(report, baseline)
+        for key, msg in changes:
+            print(key + ": " + msg)
+        if len(changes) == 0:
+            print("no regressions against " + args.baseline)
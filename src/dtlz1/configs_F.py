@@ -0,0 +1,37 @@
+#! /usr/bin/python3
+
+##--------------------------------------------------------------------\
+#   pso_python
+#   '.src/dtlz1/configs_F.py'
+#   Constant values for objective function. Formatted for
+#       automating objective function integration
+#
+#   Author(s): Lauren Linkous, Jonathan Lundquist
+#   Last update: October 18, 2026
+##--------------------------------------------------------------------\
+
+
+import sys
+try: # for outside func calls
+    sys.path.insert(0, './pso_python/src/')
+    from dtlz1.func_F import func_F, func_F_batch
+    from dtlz1.constr_F import constr_F, constr_F_batch
+except: # for local
+    from func_F import func_F, func_F_batch
+    from constr_F import constr_F, constr_F_batch
+
+OBJECTIVE_FUNC = func_F
+OBJECTIVE_FUNC_BATCH = func_F_batch   # vectorized, (N, IN_VARS) in, (N, OUT_VARS) out
+CONSTR_FUNC = constr_F
+CONSTR_FUNC_BATCH = constr_F_batch   # vectorized, (N, IN_VARS) in, N booleans out
+OBJECTIVE_FUNC_NAME = "dtlz1.func_F"
+CONSTR_FUNC_NAME = "dtlz1.constr_F"
+
+# problem dependent variables. Change OUT_VARS and K to set the dimensionality
+OUT_VARS = 3                # Number of output variables (y-values), the objectives M
+K = 5                       # Distance variables
+IN_VARS = OUT_VARS + K - 1  # Number of input variables (x-values)
+LB = [[0]*IN_VARS]          # Lower boundaries
+UB = [[1]*IN_VARS]          # Upper boundaries
+TARGETS = [0]*OUT_VARS      # Target values for output
+GLOBAL_MIN = [[0.5]*IN_VARS]  # Pareto optimal sample. The last K variables at 0.5 are on the front
@@ -0,0 +1,25 @@
+#! /usr/bin/python3
+
+##--------------------------------------------------------------------\
+#   pso_python
+#   '.src/dtlz1/constr_F.py'
+#   Function for objective function constraints.
+#       Returns True if x array passes constraints check, False otherwise
+#
+#   Author(s): Lauren Linkous, Jonathan Lundquist
+#   Last update: October 18, 2026
+##--------------------------------------------------------------------\
+
+import numpy as np
+
+def constr_F(X):
+    F = True
+    return F
+
+
+def constr_F_batch(X):
+    # vectorized constraints. X is (N, IN_VARS), returns a boolean array of N.
+    # The problem only has bound constraints, handled by the optimizer
+    return np.ones(np.shape(np.atleast_2d(X))[0], dtype=bool)
+
+constr_F_batch.vectorized = True
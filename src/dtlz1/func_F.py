@@ -0,0 +1,58 @@
+#! /usr/bin/python3
+
+##--------------------------------------------------------------------\
+#   pso_python
+#   '.src/dtlz1/func_F.py'
+#   DTLZ1 test problem, M objectives (NO_OF_OUTS). Linear Pareto front,
+#       sum(f) = 0.5, reached when the last IN_VARS - M + 1 variables are 0.5.
+#       The distance function g has 11**K - 1 local fronts.
+#       func_F takes one position, func_F_batch an (N, IN_VARS) array
+#
+#   Author(s): Lauren Linkous, Jonathan Lundquist
+#   Last update: October 18, 2026
+##--------------------------------------------------------------------\
+
+import numpy as np
+
+def func_F(X, NO_OF_OUTS=3):
+    F = np.zeros((NO_OF_OUTS))
+    noErrors = True
+    try:
+        x = np.array(X, dtype=float).reshape(-1)
+        M = NO_OF_OUTS
+        xm = x[M-1:]
+        g = 100*(len(xm) + np.sum((xm - 0.5)**2 - np.cos(20*np.pi*(xm - 0.5))))
+        for i in range(0, M):
+            f = 0.5*(1 + g)*np.prod(x[:M-1-i])
+            if i > 0:
+                f = f*(1 - x[M-1-i])
+            F[i] = f
+    except:
+        noErrors = False
+
+    return F, noErrors
+
+
+def func_F_batch(X, NO_OF_OUTS=3):
+    # vectorized objective. X is (N, IN_VARS), F is (N, NO_OF_OUTS)
+    # noErrors is a per-row flag so one bad row does not discard the batch
+    X = np.atleast_2d(X)
+    F = np.zeros((np.shape(X)[0], NO_OF_OUTS))
+    noErrors = np.zeros(np.shape(X)[0], dtype=bool)
+    try:
+        with np.errstate(all='ignore'):
+            M = NO_OF_OUTS
+            Xm = X[:, M-1:]
+            g = 100*(np.shape(Xm)[1] + np.sum((Xm - 0.5)**2 - np.cos(20*np.pi*(Xm - 0.5)), axis=1))
+            for i in range(0, M):
+                f = 0.5*(1 + g)*np.prod(X[:, :M-1-i], axis=1)
+                if i > 0:
+                    f = f*(1 - X[:, M-1-i])
+                F[:, i] = f
+        noErrors = np.all(np.isfinite(F), axis=1)
+    except:
+        pass
+
+    return F, noErrors
+
+func_F_batch.vectorized = True
@@ -0,0 +1,55 @@
+#! /usr/bin/python3
+
+##--------------------------------------------------------------------\
+#   pso_python
+#   '.src/dtlz2/func_F.py'
+#   DTLZ2 test problem, M objectives (NO_OF_OUTS). Spherical Pareto front,
+#       sum(f**2) = 1, reached when the last IN_VARS - M + 1 variables are 0.5.
+#       func_F takes one position, func_F_batch an (N, IN_VARS) array
+#
+#   Author(s): Lauren Linkous, Jonathan Lundquist
+#   Last update: October 18, 2026
+##--------------------------------------------------------------------\
+
+import numpy as np
+
+def func_F(X, NO_OF_OUTS=3):
+    F = np.zeros((NO_OF_OUTS))
+    noErrors = True
+    try:
+        x = np.array(X, dtype=float).reshape(-1)
+        M = NO_OF_OUTS
+        g = np.sum((x[M-1:] - 0.5)**2)
+        for i in range(0, M):
+            f = (1 + g)*np.prod(np.cos(x[:M-1-i]*np.pi/2))
+            if i > 0:
+                f = f*np.sin(x[M-1-i]*np.pi/2)
+            F[i] = f
+    except:
+        noErrors = False
+
+    return F, noErrors
+
+
+def func_F_batch(X, NO_OF_OUTS=3):
+    # vectorized objective. X is (N, IN_VARS), F is (N, NO_OF_OUTS)
+    # noErrors is a per-row flag so one bad row does not discard the batch
+    X = np.atleast_2d(X)
+    F = np.zeros((np.shape(X)[0], NO_OF_OUTS))
+    noErrors = np.zeros(np.shape(X)[0], dtype=bool)
+    try:
+        with np.errstate(all='ignore'):
+            M = NO_OF_OUTS
+            g = np.sum((X[:, M-1:] - 0.5)**2, axis=1)
+            for i in range(0, M):
+                f = (1 + g)*np.prod(np.cos(X[:, :M-1-i]*np.pi/2), axis=1)
+                if i > 0:
+                    f = f*np.sin(X[:, M-1-i]*np.pi/2)
+                F[:, i] = f
+        noErrors = np.all(np.isfinite(F), axis=1)
+    except:
+        pass
+
+    return F, noErrors
+
+func_F_batch.vectorized = True
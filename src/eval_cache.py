@@ -0,0 +1,131 @@
+#! /usr/bin/python3
+
+##--------------------------------------------------------------------\
+#   pso_python
+#   './pso_python/src/eval_cache.py'
+#   Memoization layer for objective function calls. Positions are
+#       rounded to a fixed number of decimals (the swarm already limits
+#       positions to 'decimal_limit' decimals), so particles that revisit
+#       a point reuse the stored outputs instead of re-running the
+#       objective function. Least recently used entries are evicted
+#       from memory, and an optional sqlite file keeps every entry
+#       between runs.
+#
+#   Author(s): Jonathan Lundquist, Lauren Linkous
+#   Last update: October 18, 2026
+##--------------------------------------------------------------------\
+
+
+import numpy as np
+from collections import OrderedDict
+import sqlite3
+
+
+class eval_cache:
+    # arguments should take the form:
+    # eval_cache(int, int, str, int)
+    #
+    # max_size: int. max number of entries held in memory
+    # decimals: int. rounding used for the keys. None uses the swarm 'decimal_limit'
+    # path: str. optional sqlite file for a persistent store.
+    #       Use one file per problem, the key does not include the objective function.
+    # commit_every: int. disk writes are committed in groups of this size
+
+    def __init__(self, max_size=100000, decimals=None, path=None, commit_every=100):
+        self.max_size = int(max_size)
+        self.decimals = decimals
+        self.path = path
+        self.commit_every = int(commit_every)
+
+        '''
+        self.entries                : In-memory store, ordered from least to most recently used.
+        self.hits                   : Number of lookups answered from the cache.
+        self.misses                 : Number of lookups that need an objective call.
+        self.evictions              : Number of entries dropped from memory.
+        self.uncommitted            : Disk writes since the last commit.
+        self.db                     : sqlite connection, or None for a memory-only cache.
+        '''
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.uncommitted = 0
+        self.db = None
+
+        if self.path != None:
+            self.db = sqlite3.connect(self.path)
+            self.db.execute("CREATE TABLE IF NOT EXISTS cache (key BLOB PRIMARY KEY, fvals BLOB)")
+            self.db.commit()
+
+    def key(self, X):
+        # adding 0.0 turns -0.0 into 0.0 so both round to the same key.
+        # A cache used outside of a swarm may have no rounding set
+        X = np.array(X, dtype=float).reshape(-1)
+        if self.decimals != None:
+            X = np.round(X, self.decimals)
+        X = X + 0.0
+        return X.tobytes()
+
+    def lookup(self, X):
+        # returns the stored outputs for position X, or None on a miss
+        key = self.key(X)
+        Fvals = self.entries.get(key)
+        if Fvals is not None:
+            self.entries.move_to_end(key)
+            self.hits = self.hits + 1
+            return np.array(Fvals)
+
+        if self.db != None:
+            row = self.db.execute("SELECT fvals FROM cache WHERE key = ?", (key,)).fetchone()
+            if row != None:
+                Fvals = np.frombuffer(row[0], dtype=float)
+                self.remember(key, Fvals)
+                self.hits = self.hits + 1
+                return np.array(Fvals)
+
+        self.misses = self.misses + 1
+        return None
+
+    def store(self, X, Fvals):
+        # only successful objective calls should be stored
+        key = self.key(X)
+        if key in self.entries:
+            self.entries.move_to_end(key)
+            return
+        Fvals = np.array(Fvals, dtype=float).reshape(-1)
+        self.remember(key, Fvals)
+
+        if self.db != None:
+            self.db.execute("INSERT OR REPLACE INTO cache (key, fvals) VALUES (?, ?)",
+                            (key, Fvals.tobytes()))
+            self.uncommitted = self.uncommitted + 1
+            if self.uncommitted >= self.commit_every:
+                self.flush()
+
+    def remember(self, key, Fvals):
+        self.entries[key] = Fvals
+        while len(self.entries) > self.max_size:
+            self.entries.popitem(last=False)
+            self.evictions = self.evictions + 1
+
+    def flush(self):
+        if self.db != None:
+            self.db.commit()
+            self.uncommitted = 0
+
+    def close(self):
+        if self.db != None:
+            self.flush()
+            self.db.close()
+            self.db = None
+
+    def get_stats(self):
+        lookups = self.hits + self.misses
+        hit_rate = 0.0
+        if lookups > 0:
+            hit_rate = self.hits/lookups
+        return {'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': hit_rate,
+                'size': len(self.entries),
+                'evictions': self.evictions}
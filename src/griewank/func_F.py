@@ -0,0 +1,45 @@
+#! /usr/bin/python3
+
+##--------------------------------------------------------------------\
+#   pso_python
+#   '.src/griewank/func_F.py'
+#   Griewank function, N-dimensional. Many shallow local minima on a
+#       quadratic bowl, with the global minimum at the origin.
+#       func_F takes one position, func_F_batch an (N, IN_VARS) array
+#
+#   Author(s): Lauren Linkous, Jonathan Lundquist
+#   Last update: October 18, 2026
+##--------------------------------------------------------------------\
+
+import numpy as np
+
+def func_F(X, NO_OF_OUTS=1):
+    F = np.zeros((NO_OF_OUTS))
+    noErrors = True
+    try:
+        x = np.array(X, dtype=float).reshape(-1)
+        i = np.arange(1, len(x) + 1)
+        F[0] = 1 + np.sum(x**2)/4000 - np.prod(np.cos(x/np.sqrt(i)))
+    except:
+        noErrors = False
+
+    return F, noErrors
+
+
+def func_F_batch(X, NO_OF_OUTS=1):
+    # vectorized objective. X is (N, IN_VARS), F is (N, NO_OF_OUTS)
+    # noErrors is a per-row flag so one bad row does not discard the batch
+    X = np.atleast_2d(X)
+    F = np.zeros((np.shape(X)[0], NO_OF_OUTS))
+    noErrors = np.zeros(np.shape(X)[0], dtype=bool)
+    try:
+        with np.errstate(all='ignore'):
+            i = np.arange(1, np.shape(X)[1] + 1)
+            F[:, 0] = 1 + np.sum(X**2, axis=1)/4000 - np.prod(np.cos(X/np.sqrt(i)), axis=1)
+        noErrors = np.all(np.isfinite(F), axis=1)
+    except:
+        pass
+
+    return F, noErrors
+
+func_F_batch.vectorized = True
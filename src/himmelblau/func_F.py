@@ -6,7 +6,7 @@
 #   objective function for function compatable with project optimizers
 #
 #   Author(s): Lauren Linkous (LINKOUSLC@vcu.edu)
-#   Last update: May 28, 2024
+#   Last update: October 18, 2026
 ##-------------------------------------------------------------------------------\
 
 import numpy as np
@@ -22,3 +22,23 @@ def func_F(X, NO_OF_OUTS=1):
         noErrors = False
 
     return F, noErrors
+
+
+def func_F_batch(X, NO_OF_OUTS=1):
+    # vectorized objective. X is (N, IN_VARS), F is (N, NO_OF_OUTS)
+    # noErrors is a per-row flag so one bad row does not discard the batch
+    X = np.atleast_2d(X)
+    F = np.zeros((np.shape(X)[0], NO_OF_OUTS))
+    noErrors = np.zeros(np.shape(X)[0], dtype=bool)
+    try:
+        with np.errstate(all='ignore'):
+            x = X[:, 0]
+            y = X[:, 1]
+            F[:, 0] = (x**2 + y - 11)**2 + (x + y**2 - 7)**2
+        noErrors = np.all(np.isfinite(F), axis=1)
+    except:
+        pass
+
+    return F, noErrors
+
+func_F_batch.vectorized = True
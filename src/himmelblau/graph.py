@@ -6,14 +6,18 @@
 #   generates graphs for function based on constraints and configurations
 #
 #   Author(s): Lauren Linkous (LINKOUSLC@vcu.edu)
-#   Last update: May 30, 2024
+#   Last update: October 18, 2026
 ##-------------------------------------------------------------------------------\
 
 
+import os
+import sys
 import numpy as np
 import matplotlib.pyplot as plt
 
 import configs_F as f_c
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from reference_grid import cached_grid
 # problem constraints - pulled from the function configs for the optimizers
 LOWER_BOUNDS = f_c.LB[0]
 UPPER_BOUNDS = f_c.UB[0]
@@ -21,39 +25,25 @@ LB_x = LOWER_BOUNDS[0]
 LB_y = LOWER_BOUNDS[1]
 UB_x = UPPER_BOUNDS[0]
 UB_y = UPPER_BOUNDS[1]
-FUNC_F = f_c.OBJECTIVE_FUNC
+OUT_VARS = f_c.OUT_VARS
+FUNC_F = f_c.OBJECTIVE_FUNC_BATCH     # vectorized versions, the whole grid is evaluated in chunks
+CONSTR_F = f_c.CONSTR_FUNC_BATCH
 GLOBAL_MIN = f_c.GLOBAL_MIN
+RESOLUTION = 600                      # grid points per input variable
 
 
 #write out plot
 plotname = "himmelblau_plots.png"
 
 
-# Define range and step size
-x = np.linspace(LB_x, UB_x, 600)
-y = np.linspace(LB_y, UB_y, 600)
-X, Y = np.meshgrid(x, y)
+# Evaluate function over the grid. The results are cached in ./grid_cache,
+# and reused while the function, bounds and resolution stay the same
+axes, F, valid = cached_grid('himmelblau', FUNC_F, CONSTR_F,
+                             LOWER_BOUNDS, UPPER_BOUNDS, RESOLUTION, OUT_VARS)
+X, Y = np.meshgrid(axes[0], axes[1], indexing='ij')
 
-# Reshape X and Y to 1D arrays
-X_flat = X.flatten()
-Y_flat = Y.flatten()
-
-# Stack X and Y to create coords as a 2D array
-coords = np.stack((X_flat, Y_flat), axis=-1)
-
-# Evaluate function
-
-Z = []
-for c in coords:
-    z, noErr = FUNC_F(c)
-    if noErr == True:
-        Z.append(z)
-
-# Convert Z to a NumPy array
-Z = np.array(Z)
-
-# Reshape Z to ensure it's 2-dimensional
-Z = Z.reshape(X.shape)
+# Reshape Z to the grid. Points that failed evaluation are NaN
+Z = F[:, 0].reshape(X.shape)
 
 # Create figure and subplots
 fig = plt.figure(figsize=(14, 7))
@@ -0,0 +1,236 @@
+#! /usr/bin/python3
+
+##--------------------------------------------------------------------\
+#   pso_python
+#   './pso_python/src/island_model.py'
+#   Island model runner for the 'swarm' class in particle_swarm.py.
+#       K independent swarms, one per process and each with its own
+#       seed, run in epochs of 'migration_interval' evaluations. Between
+#       epochs the best solutions of each island are sent to its
+#       neighbors on the chosen topology. Epochs are synchronized, so a
+#       run is repeatable for fixed seeds whatever the process timing.
+#
+#   Author(s): Jonathan Lundquist, Lauren Linkous
+#   Last update: October 18, 2026
+##--------------------------------------------------------------------\
+
+
+import numpy as np
+import multiprocessing
+import traceback
+from particle_swarm import swarm
+from swarm_runner import quiet_parent, run_swarm
+
+
+class island:
+    # one swarm and the epoch the runner requests on it. Used in the worker
+    # processes, or directly when the runner is started with processes=False
+
+    def __init__(self, index, seed, swarm_args, swarm_kwargs):
+        kwargs = dict(swarm_kwargs)
+        kwargs['seed'] = seed
+        if 'parent' not in kwargs:
+            kwargs['parent'] = quiet_parent
+        self.index = index
+        self.seed = seed
+        self.swarm = swarm(*swarm_args, **kwargs)
+
+    def epoch(self, until_iter, migrants, incoming=None):
+        # one round trip per epoch: take in the migrants sent after the last
+        # epoch, run until 'until_iter' evaluations are made, and report
+        if incoming != None:
+            self.swarm.inject_migrants(*incoming)
+        run_swarm(self.swarm, until_iter)
+        return self.report(migrants)
+
+    def report(self, migrants):
+        X, Flist, Fvals = self.swarm.get_emigrants(migrants)
+        return {'island': self.index,
+                'seed': self.seed,
+                'iter': self.swarm.iter,
+                'complete': bool(self.swarm.complete()) or not np.any(self.swarm.Active),
+                'converged': bool(self.swarm.converged()),
+                'stop_reason': self.swarm.get_stop_reason(),
+                'Gb': np.array(self.swarm.Gb),
+                'F_Gb': np.array(self.swarm.F_Gb),
+                'emigrants': (X, Flist, Fvals)}
+
+
+def island_worker(conn, index, seed, swarm_args, swarm_kwargs):
+    # message loop of a worker process. Every request gets one reply,
+    # ('ok', result) or ('error', traceback)
+    try:
+        local = island(index, seed, swarm_args, swarm_kwargs)
+        conn.send(('ok', None))
+    except Exception:
+        conn.send(('error', traceback.format_exc()))
+        return
+    while True:
+        request = conn.recv()
+        if request[0] == 'stop':
+            break
+        try:
+            method = getattr(local, request[0])
+            conn.send(('ok', method(*request[1:])))
+        except Exception:
+            conn.send(('error', traceback.format_exc()))
+    conn.close()
+
+
+class island_model:
+    # arguments should take the form:
+    # island_model(tuple, dict, int, int, str, str, int, list, bool)
+    #
+    # swarm_args: positional swarm arguments, (LB, UB, TARGETS, TOL, MAXIT, obj_func,
+    #       constr_func, opt_df). MAXIT is per island. With processes, the functions
+    #       must be picklable (module level functions, e.g. from a configs_F file)
+    # swarm_kwargs: dict of swarm keyword arguments, shared by every island.
+    #       'seed' is the base seed, island i uses seed + i
+    # islands: int. number of swarms
+    # migration_interval: int. evaluations per island between migrations
+    # topology: 'ring' (from the previous island) or 'full' (from every other island)
+    # migration: 'particles' moves the worst particles of the receiver to the
+    #       migrants, 'best' only shares the global best
+    # migrants: int. solutions sent by each island per migration
+    # seeds: list of int or None. one seed per island, overrides the base seed
+    # processes: bool. False runs the islands one after the other in this process
+
+    def __init__(self, swarm_args, swarm_kwargs=None, islands=4, migration_interval=100,
+                 topology="ring", migration="particles", migrants=1, seeds=None, processes=True):
+        if swarm_kwargs == None:
+            swarm_kwargs = {}
+        self.swarm_args = tuple(swarm_args)
+        self.swarm_kwargs = dict(swarm_kwargs)
+        self.islands = max(int(islands), 1)
+        self.migration_interval = max(int(migration_interval), 1)
+        self.migrants = max(int(migrants), 1)
+        self.processes = processes
+
+        if topology in ["ring", "full"]:
+            self.topology = topology
+        else:
+            print("WARNING: unrecognized topology '" + str(topology) + "'. Defaulting to ring.")
+            self.topology = "ring"
+        if migration in ["particles", "best"]:
+            self.migration = migration
+        else:
+            print("WARNING: unrecognized migration '" + str(migration) + "'. Defaulting to particles.")
+            self.migration = "particles"
+
+        if seeds == None:
+            base = self.swarm_kwargs.get('seed')
+            if base == None:
+                seeds = [None]*self.islands
+            else:
+                seeds = [int(base) + i for i in range(0, self.islands)]
+        self.seeds = list(seeds)
+
+        '''
+        self.reports                : Last report of each island.
+        self.epochs                 : Migration epochs run.
+        '''
+        self.reports = []
+        self.epochs = 0
+
+    def sources(self, index):
+        # islands that send migrants to island 'index'
+        if self.topology == "full":
+            return [i for i in range(0, self.islands) if i != index]
+        return [(index - 1) % self.islands]
+
+    def run(self):
+        # runs every island until all of them are complete, or one converges.
+        # Returns the results, see results()
+        if not self.processes:
+            local = [island(i, self.seeds[i], self.swarm_args, self.swarm_kwargs)
+                     for i in range(0, self.islands)]
+            def call(method, args_list):
+                return [getattr(local[i], method)(*args_list[i]) for i in range(0, self.islands)]
+            self.drive(call)
+            return self.results()
+
+        workers = []
+        try:
+            for i in range(0, self.islands):
+                conn, child_conn = multiprocessing.Pipe()
+                process = multiprocessing.Process(target=island_worker,
+                                                  args=(child_conn, i, self.seeds[i],
+                                                        self.swarm_args, self.swarm_kwargs),
+                                                  daemon=True)
+                process.start()
+                child_conn.close()
+                workers.append((process, conn))
+            for process, conn in workers:
+                self.reply(conn)
+
+            def call(method, args_list):
+                # requests go out to every island before any reply is read,
+                # so the islands run concurrently
+                for i in range(0, self.islands):
+                    workers[i][1].send((method,) + tuple(args_list[i]))
+                return [self.reply(conn) for process, conn in workers]
+            self.drive(call)
+        finally:
+            for process, conn in workers:
+                try:
+                    conn.send(('stop',))
+                except (BrokenPipeError, OSError):
+                    pass
+                conn.close()
+            for process, conn in workers:
+                process.join(5)
+                if process.is_alive():
+                    process.terminate()
+        return self.results()
+
+    def reply(self, conn):
+        status, result = conn.recv()
+        if status == 'error':
+            raise RuntimeError("island worker failed:\n" + result)
+        return result
+
+    def drive(self, call):
+        # synchronized epochs: every island takes in the emigrants of its sources
+        # from the last epoch, runs to the same evaluation count, and reports.
+        # Only the reports and the migrants cross the process boundary
+        self.epochs = 0
+        incoming = [None]*self.islands
+        while True:
+            until = (self.epochs + 1)*self.migration_interval
+            self.reports = call('epoch', [(until, self.migrants, incoming[i]) for i in range(0, self.islands)])
+            self.epochs = self.epochs + 1
+            if all(r['complete'] for r in self.reports) or any(r['converged'] for r in self.reports):
+                break
+            incoming = [self.gather(i) for i in range(0, self.islands)]
+
+    def gather(self, index):
+        # (X, Flist, Fvals, replace) sent to island 'index' by its sources
+        X, Flist, Fvals = [], [], []
+        for j in self.sources(index):
+            eX, eFlist, eFvals = self.reports[j]['emigrants']
+            if self.migration == "best":
+                eX, eFlist, eFvals = self.reports[j]['Gb'], self.reports[j]['F_Gb'], None
+            X.append(np.reshape(eX, (-1, np.shape(eX)[-1])))
+            Flist.append(np.reshape(eFlist, (np.shape(X[-1])[0], -1)))
+            if eFvals is not None:
+                Fvals.append(eFvals)
+        Fvals = np.vstack(Fvals) if len(Fvals) == len(X) else None
+        return (np.vstack(X), np.vstack(Flist), Fvals, self.migration == "particles")
+
+    def results(self):
+        # Gb/F_Gb: best solution over all islands, by norm. 'island' is its index.
+        # evaluations: total over all islands.
+        # islands: per island iter, norm of F_Gb, convergence and stop reason
+        norms = [np.linalg.norm(r['F_Gb']) for r in self.reports]
+        best = int(np.argmin(norms))
+        return {'Gb': self.reports[best]['Gb'],
+                'F_Gb': self.reports[best]['F_Gb'],
+                'island': best,
+                'evaluations': int(sum(r['iter'] for r in self.reports)),
+                'epochs': self.epochs,
+                'islands': [{'island': r['island'],
+                             'seed': r['seed'],
+                             'iter': r['iter'],
+                             'best_eval': float(norms[i]),
+                             'converged': r['converged'],
+                             'stop_reason': r['stop_reason']} for i, r in enumerate(self.reports)]}
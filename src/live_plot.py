@@ -0,0 +1,168 @@
+#! /usr/bin/python3
+
+##--------------------------------------------------------------------\
+#   pso_python
+#   './pso_python/src/live_plot.py'
+#   Real-time particle and fitness plot for main_test_graph.py, drawn
+#       in a separate process. The optimizer loop hands over snapshots
+#       (M, F_Gb, iteration) through a small bounded queue, at most one
+#       per frame, and never waits on it: when the renderer falls behind,
+#       snapshots are dropped. The renderer redraws at a fixed frame rate
+#       by updating the data of artists made once, instead of clearing
+#       and re-plotting the axes.
+#
+#   Author(s): Lauren Linkous, Jonathan Lundquist
+#   Last update: October 18, 2026
+##--------------------------------------------------------------------\
+
+
+import numpy as np
+import multiprocessing
+import queue
+import time
+
+
+def coords_3d(X):
+    # (n, 1..3) array to three coordinate arrays. Missing axes are filled with zeros
+    X = np.atleast_2d(np.array(X, dtype=float))
+    filler = np.zeros(np.shape(X)[0])
+    columns = [X[:, i] if i < np.shape(X)[1] else filler for i in range(0, 3)]
+    return columns[0], columns[1], columns[2]
+
+
+def axis_labels(name, size):
+    labels = ["$" + name + "_{" + str(i + 1) + "}$" for i in range(0, min(size, 3))]
+    return labels + ["filler coords"]*(3 - len(labels))
+
+
+def render_loop(snapshots, lbound, ubound, targets, fps, hold):
+    # runs in the renderer process until the None sentinel arrives, then keeps
+    # the window open for 'hold' seconds or until it is closed
+    import matplotlib.pyplot as plt
+
+    lbound = np.array(lbound, dtype=float).reshape(-1)
+    ubound = np.array(ubound, dtype=float).reshape(-1)
+    targets = np.array(targets, dtype=float).reshape(-1)
+
+    fig = plt.figure(figsize=(10, 5))
+    ax1 = fig.add_subplot(121, projection='3d')
+    ax2 = fig.add_subplot(122, projection='3d')
+    for ax, labels in [(ax1, axis_labels("x", len(lbound))), (ax2, axis_labels("F", len(targets)))]:
+        ax.set_xlabel(labels[0])
+        ax.set_ylabel(labels[1])
+        ax.set_zlabel(labels[2])
+    ax1.set_title("Search Locations, Iteration: 0")
+    ax2.set_title("Global Best Fitness Relation to Target")
+
+    # the position axes are fixed to the bounds
+    low = np.zeros(3)
+    high = np.zeros(3)
+    low[:len(lbound)] = lbound[:3]
+    high[:len(ubound)] = ubound[:3]
+    high[high == low] = low[high == low] + 1
+    ax1.set_xlim(low[0], high[0])
+    ax1.set_ylim(low[1], high[1])
+    ax1.set_zlim(low[2], high[2])
+
+    # artists, updated in place every frame
+    particles, = ax1.plot([], [], [], linestyle='', marker='o', markerfacecolor='none', markeredgecolor='b')
+    best, = ax2.plot([], [], [], linestyle='', marker='o', markersize=7, markerfacecolor='none', markeredgecolor='k')
+    tx, ty, tz = coords_3d(targets[np.newaxis, :])
+    ax2.plot(tx, ty, tz, linestyle='', marker='*', color='r')
+    plt.show(block=False)
+
+    interval = 1.0/fps
+    snapshot = None
+    finished = False
+    while not finished:
+        frame_start = time.monotonic()
+        # keep only the newest snapshot, older ones are dropped
+        latest = None
+        try:
+            while True:
+                item = snapshots.get_nowait()
+                if item is None:
+                    finished = True
+                    break
+                latest = item
+        except queue.Empty:
+            pass
+        if latest is not None:
+            snapshot = latest
+            M, F_Gb, iteration = snapshot
+            particles.set_data_3d(*coords_3d(M))
+            F = np.reshape(F_Gb, (1, -1))
+            best.set_data_3d(*coords_3d(F))
+            ax1.set_title("Search Locations, Iteration: " + str(iteration))
+            # fitness axes follow the global best and the target
+            points = np.vstack((F, targets[np.newaxis, :]))
+            points = points[np.all(np.isfinite(points) & (np.abs(points) < 1e100), axis=1)]
+            if len(points) > 0:
+                flow = np.zeros(3)
+                fhigh = np.zeros(3)
+                flow[:np.shape(points)[1]] = np.min(points, axis=0)[:3]
+                fhigh[:np.shape(points)[1]] = np.max(points, axis=0)[:3]
+                pad = np.maximum(0.1*(fhigh - flow), 1e-12)
+                ax2.set_xlim(flow[0] - pad[0], fhigh[0] + pad[0])
+                ax2.set_ylim(flow[1] - pad[1], fhigh[1] + pad[1])
+                ax2.set_zlim(flow[2] - pad[2], fhigh[2] + pad[2])
+            fig.canvas.draw_idle()
+        if not plt.fignum_exists(fig.number): # closed by the user, drain and ignore the rest
+            while not finished:
+                finished = snapshots.get() is None
+            return
+        plt.pause(max(interval - (time.monotonic() - frame_start), 0.001))
+
+    end = time.monotonic() + hold
+    while plt.fignum_exists(fig.number) and (time.monotonic() < end):
+        plt.pause(0.1)
+    plt.close(fig)
+
+
+class live_plot:
+    # arguments should take the form:
+    # live_plot([[float, ...]], [[float, ...]], [[float, ...]], float, float)
+    #
+    # lbound, ubound: position bounds, fix the position axes
+    # targets: objective targets, plotted as a red star
+    # fps: float. frames per second drawn, and snapshots sent at most
+    # hold: float. seconds the window stays open after close()
+
+    def __init__(self, lbound, ubound, targets, fps=10, hold=15):
+        self.interval = 1.0/float(fps)
+        self.last_push = None
+        self.dropped = 0
+        self.snapshots = multiprocessing.Queue(maxsize=2)
+        self.process = multiprocessing.Process(target=render_loop,
+                                               args=(self.snapshots, lbound, ubound, targets, float(fps), hold),
+                                               daemon=True)
+        self.process.start()
+
+    def push(self, M, F_Gb, iteration):
+        # called from the optimizer loop. Returns right away: snapshots within
+        # one frame of the last one are skipped, and a full queue drops the snapshot.
+        # Returns True when the snapshot was queued
+        now = time.monotonic()
+        if (self.last_push != None) and (now - self.last_push < self.interval):
+            return False
+        self.last_push = now
+        try:
+            self.snapshots.put_nowait((np.array(M), np.array(F_Gb), int(iteration)))
+        except queue.Full:
+            self.dropped = self.dropped + 1
+            return False
+        return True
+
+    def close(self, M=None, F_Gb=None, iteration=None, wait=True):
+        # sends the final snapshot, which is never dropped, and the end sentinel.
+        # With wait, returns once the renderer is done, after its 'hold' time
+        if not self.process.is_alive():
+            return
+        try:
+            if M is not None:
+                self.snapshots.put((np.array(M), np.array(F_Gb), int(iteration)), timeout=5)
+            self.snapshots.put(None, timeout=5)
+        except queue.Full: # the renderer stopped reading
+            return
+        if wait:
+            self.process.join()
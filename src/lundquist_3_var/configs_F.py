@@ -13,14 +13,16 @@
 import sys
 try: # for outside func calls
     sys.path.insert(0, './pso_python/src/')
-    from lundquist_3_var.func_F import func_F
-    from lundquist_3_var.constr_F import constr_F
+    from lundquist_3_var.func_F import func_F, func_F_batch
+    from lundquist_3_var.constr_F import constr_F, constr_F_batch
 except: # for local
-    from func_F import func_F
-    from constr_F import constr_F
+    from func_F import func_F, func_F_batch
+    from constr_F import constr_F, constr_F_batch
 
 OBJECTIVE_FUNC = func_F
+OBJECTIVE_FUNC_BATCH = func_F_batch   # vectorized, (N, IN_VARS) in, (N, OUT_VARS) out
 CONSTR_FUNC = constr_F
+CONSTR_FUNC_BATCH = constr_F_batch   # vectorized, (N, IN_VARS) in, N booleans out
 OBJECTIVE_FUNC_NAME = "lundquist_3_var.func_F"
 CONSTR_FUNC_NAME = "lundquist_3_var.constr_F"
 
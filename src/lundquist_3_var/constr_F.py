@@ -8,9 +8,10 @@
 #   Returns True if x array passes constraints check, False otherwise   
 #
 #   Author(s): Jonathan Lundquist, Lauren Linkous
-#   Last update: May 28, 2024
+#   Last update: October 18, 2026
 ##--------------------------------------------------------------------\
 
+import numpy as np
 
 def constr_F(X):
     F = True
@@ -18,4 +19,13 @@ def constr_F(X):
     if (X[2] > X[0]/2) or (X[2] < 0.1):
         F = False
 
-    return F
\ No newline at end of file
+    return F
+
+
+def constr_F_batch(X):
+    # vectorized constraints. X is (N, IN_VARS), returns a boolean array of N
+    X = np.atleast_2d(X)
+    F = np.logical_not((X[:, 2] > X[:, 0]/2) | (X[:, 2] < 0.1))
+    return F
+
+constr_F_batch.vectorized = True
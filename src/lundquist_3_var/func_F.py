@@ -8,7 +8,7 @@
 #       if constraints have been properly applied.
 #
 #   Author(s): Lauren Linkous, Jonathan Lundquist
-#   Last update: May 28, 2024
+#   Last update: October 18, 2026
 ##-------------------------------------------------------------------------------\
 
 import numpy as np
@@ -25,3 +25,21 @@ def func_F(X, NO_OF_OUTS=2):
     
     return F, noErrors
 
+
+def func_F_batch(X, NO_OF_OUTS=2):
+    # vectorized objective. X is (N, IN_VARS), F is (N, NO_OF_OUTS)
+    # noErrors is a per-row flag so one bad row does not discard the batch
+    X = np.atleast_2d(X)
+    F = np.zeros((np.shape(X)[0], NO_OF_OUTS))
+    noErrors = np.zeros(np.shape(X)[0], dtype=bool)
+    try:
+        with np.errstate(all='ignore'):
+            F[:, 0] = (X[:, 0]-0.5) ** 2 + (X[:, 1]-0.1) ** 2
+            F[:, 1] = (X[:, 2]-0.2) ** 4
+        noErrors = np.all(np.isfinite(F), axis=1)
+    except:
+        pass
+
+    return F, noErrors
+
+func_F_batch.vectorized = True
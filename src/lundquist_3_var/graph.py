@@ -7,14 +7,18 @@
 #   in-package demo for graphing the pareto front
 #
 #   Author(s): Lauren Linkous (LINKOUSLC@vcu.edu)
-#   Last update: May 25, 2024
+#   Last update: October 18, 2026
 ##-------------------------------------------------------------------------------\
 
+import os
+import sys
 import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
 
 import configs_F as f_c
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from reference_grid import cached_grid, grid_coords, pareto_front
 # problem constraints - pulled from the function configs for the optimizers
 LOWER_BOUNDS = f_c.LB[0]
 UPPER_BOUNDS = f_c.UB[0]
@@ -25,74 +29,36 @@ UB_y = UPPER_BOUNDS[1]
 LB_z = LOWER_BOUNDS[2]
 UB_z = UPPER_BOUNDS[2]
 IN_VARS = f_c.IN_VARS
-FUNC_F = f_c.OBJECTIVE_FUNC
-CONSTR_F = f_c.CONSTR_FUNC
+OUT_VARS = f_c.OUT_VARS
+FUNC_F = f_c.OBJECTIVE_FUNC_BATCH     # vectorized versions, the whole grid is evaluated in chunks
+CONSTR_F = f_c.CONSTR_FUNC_BATCH
+RESOLUTION = 100                      # grid points per input variable
 
 # for exporting df to csv
 filename = 'lundquist_3var_pareto_coords_output.csv'
 plotname ='lundquist_3var_plots.png'
 
-def pareto_front(X, Y, minimize=True):
-    pareto_front_X = []
-    pareto_front_Y = []
-
-    if minimize:
-        # Find Pareto front for minimizing objectives
-        pareto_front_Y_max = float('inf')
-        for x, y in sorted(zip(X, Y)):
-            if y < pareto_front_Y_max:
-                pareto_front_X.append(x)
-                pareto_front_Y.append(y)
-                pareto_front_Y_max = y
-    else:
-        # Find Pareto front for maximizing objectives
-        pareto_front_Y_min = float('-inf')
-        for x, y in sorted(zip(X, Y), reverse=True):
-            if y > pareto_front_Y_min:
-                pareto_front_X.append(x)
-                pareto_front_Y.append(y)
-                pareto_front_Y_min = y
-
-    return pareto_front_X, pareto_front_Y
-
-
-# Define range and step size
-x = np.linspace(LB_x, UB_x, 100)
-y = np.linspace(LB_y, UB_y, 100)
-z = np.linspace(LB_z, UB_z, 100)
-
-x_grid = np.array(np.meshgrid(x, y, z)).T.reshape(-1, IN_VARS) 
-
-# Evaluate function + apply constraints
-# this is the same function used by the optimizers, so the format reflects that
-validCoords = [] # the valid x,y coordinates
-paretoCoords = [] #col1: f1, col2: f2
-for c in x_grid:
-    # check if point is in the constraints.
-    point_is_valid = CONSTR_F(c)
-    if point_is_valid == True:
-        # add point to validCoords
-        validCoords.append(c)
-        # pass point to the function to get the minimized F set
-        objective_space, noErr = FUNC_F(c)
-        if noErr == True:
-            paretoCoords.append(objective_space)
-
-
-# Convert validCoords to a NumPy array
-validCoords = np.array(validCoords)
+# Evaluate function + apply constraints over the grid
+# this is the same function used by the optimizers, so the format reflects that.
+# The results are cached in ./grid_cache, and reused while the function,
+# bounds and resolution stay the same
+axes, F, valid = cached_grid('lundquist_3_var', FUNC_F, CONSTR_F,
+                             LOWER_BOUNDS, UPPER_BOUNDS, RESOLUTION, OUT_VARS)
+
+# the valid x,y,z coordinates
+validCoords = grid_coords(axes)[valid]
 valid_x = validCoords[:,0]
 valid_y = validCoords[:,1]
 valid_z = validCoords[:,2]
 
-# Convert paretoCoords to a NumPy array
-paretoCoords = np.array(paretoCoords)
-
-# Get the feasible objective space
+# the feasible objective space. col1: f1, col2: f2
+paretoCoords = F[valid]
 objective_x = paretoCoords[:,0]
 objective_y = paretoCoords[:,1]
 # Get the Pareto front from the feasible objective space
-pareto_x, pareto_y = pareto_front(objective_x,objective_y)
+front = pareto_front(paretoCoords)
+pareto_x = objective_x[front]
+pareto_y = objective_y[front]
 
 # Create figure and subplots
 fig = plt.figure(figsize=(14, 7))
@@ -35,7 +35,9 @@ if __name__ == "__main__":
 
     # Objective function dependent variables
     func_F = func_configs.OBJECTIVE_FUNC  # objective function
+    #func_F = func_configs.OBJECTIVE_FUNC_BATCH  # vectorized objective function, best with mode="batch"
     constr_F = func_configs.CONSTR_FUNC   # constraint function
+    #constr_F = func_configs.CONSTR_FUNC_BATCH  # vectorized constraint function
 
     LB = func_configs.LB              # Lower boundaries, [[0.21, 0, 0.1]]
     UB = func_configs.UB              # Upper boundaries, [[1, 1, 0.5]]   
@@ -9,18 +9,19 @@
 #       error messages directly from the 'swarm' class. Format updates are 
 #       for integration in the AntennaCAT GUI.
 #       This version builds from 'pso_test_details.py' to include a 
-#       matplotlib plot of particle location
+#       matplotlib plot of particle location. The plot is drawn in a
+#       separate process (live_plot.py), so it does not slow the optimizer
 #
 #   Author(s): Lauren Linkous, Jonathan Lundquist,
-#   Last update: March 12, 2025
+#   Last update: October 18, 2026
 ##--------------------------------------------------------------------\
 
 
 import numpy as np
 import pandas as pd
 import time
-import matplotlib.pyplot as plt
 from particle_swarm import swarm
+from live_plot import live_plot
 
 
 
@@ -33,7 +34,6 @@ import lundquist_3_var.configs_F as func_configs     # multi objective function
 
 class TestGraph():
     def __init__(self):
-        self.ctr = 0
 
         # Constant variables
         NO_OF_PARTICLES = 11         # Number of particles in swarm
@@ -93,23 +93,10 @@ class TestGraph():
                             evaluate_threshold=evaluate_threshold, obj_threshold=THRESHOLD)  
 
 
-        # Matplotlib setup
-        self.targets = TARGETS
-        self.fig = plt.figure(figsize=(10, 5))#(figsize=(14, 7))
-        # position
-        self.ax1 = self.fig.add_subplot(121, projection='3d')
-        self.ax1.set_title("Particle Location, Iteration: " + str(self.ctr))
-        self.ax1.set_xlabel('x_1')
-        self.ax1.set_ylabel('x_2')
-        self.ax1.set_zlabel('x_3')
-        self.scatter1 = None
-        # fitness
-        self.ax2 = self.fig.add_subplot(122, projection='3d')
-        self.ax2.set_title("Fitness Relation to Target")
-        self.ax1.set_xlabel('x_1')
-        self.ax1.set_ylabel('x_2')
-        self.ax1.set_zlabel('x_3')
-        self.scatter2 = None
+        # live plot, drawn in its own process. Snapshots are sent at most FPS
+        # times per second, and dropped if the plot falls behind
+        FPS = 10                           # plot frames per second
+        self.plot = live_plot(LB, UB, TARGETS, fps=FPS, hold=15)
 
     def debug_message_printout(self, txt):
         if txt is None:
@@ -126,80 +113,6 @@ class TestGraph():
         pass
          
 
-    def update_plot(self, x_coords, y_coords, targets, showTarget=True, clearAx=True):
-        
-        # check if any points. first call might not have anythign set yet.
-        if len(x_coords) < 1:
-            return 
-
-
-        if clearAx == True:
-            self.ax1.clear() #use this to git rid of the 'ant tunnel' trails
-            self.ax2.clear()
-
-        # MOVEMENT PLOT
-        if np.shape(x_coords)[1]==1: # 1 dim function
-            x_plot_coords = np.array(x_coords[:,0])*0.0
-            self.ax1.set_title("Search Locations, Iteration: " + str(self.ctr))
-            self.ax1.set_xlabel("$x_1$")
-            self.ax1.set_ylabel("filler coords")
-            self.ax1.set_zlabel("filler coords")
-            self.scatter = self.ax1.scatter(x_coords, x_plot_coords, edgecolors='b')   
-        
-        elif np.shape(x_coords)[1] == 2: #2-dim func
-            self.ax1.set_title("Search Locations, Iteration: " + str(self.ctr))
-            self.ax1.set_xlabel("$x_1$")
-            self.ax1.set_ylabel("$x_2$")
-            self.ax1.set_zlabel("filler coords")            
-            self.scatter = self.ax1.scatter(x_coords[:,0], x_coords[:,1], edgecolors='b')
-
-        elif np.shape(x_coords)[1] == 3: #3-dim func
-            self.ax1.set_title("Search Locations, Iteration: " + str(self.ctr))
-            self.ax1.set_xlabel("$x_1$")
-            self.ax1.set_ylabel("$x_2$")
-            self.ax1.set_zlabel("$x_3$")
-            self.scatter = self.ax1.scatter(x_coords[:,0], x_coords[:,1], x_coords[:,2], edgecolors='b')
-
-
-        # FITNESS PLOT
-        if np.shape(y_coords)[1] == 1: #1-dim obj func
-            y_plot_filler = np.array(y_coords[:,0])*0.0
-            self.ax2.set_title("Global Best Fitness Relation to Target")
-            self.ax2.set_xlabel("$F_{1}(x_1,x_2)$")
-            self.ax2.set_ylabel("filler coords")
-            self.ax2.set_zlabel("filler coords")
-            self.scatter = self.ax2.scatter(y_coords, y_plot_filler,  marker='o', s=40, facecolor="none", edgecolors="k")
-
-        elif np.shape(y_coords)[1] == 2: #2-dim obj func
-            self.ax2.set_title("Global Best Fitness Relation to Target")
-            self.ax2.set_xlabel("$F_{1}(x_1,x_2)$")
-            self.ax2.set_ylabel("$F_{2}(x_1,x_2)$")
-            self.ax2.set_zlabel("filler coords")
-            self.scatter = self.ax2.scatter(y_coords[:,0], y_coords[:,1], marker='o', s=40, facecolor="none", edgecolors="k")
-
-        elif np.shape(y_coords)[1] == 3: #3-dim obj fun
-            self.ax2.set_title("Global Best Fitness Relation to Target")
-            self.ax2.set_xlabel("$F_{1}(x_1,x_2)$")
-            self.ax2.set_ylabel("$F_{2}(x_1,x_2)$")
-            self.ax2.set_zlabel("$F_{3}(x_1,x_2)$")
-            self.scatter = self.ax2.scatter(y_coords[:,0], y_coords[:,1], y_coords[:,2], marker='o', s=40, facecolor="none", edgecolors="k")
-
-
-        if showTarget == True: # plot the target point
-            if len(targets) == 1:
-                self.scatter = self.ax2.scatter(targets[0], 0, marker='*', edgecolors='r')
-            if len(targets) == 2:
-                self.scatter = self.ax2.scatter(targets[0], targets[1], marker='*', edgecolors='r')
-            elif len(targets) == 3:
-                self.scatter = self.ax2.scatter(targets[0], targets[1], targets[2], marker='*', edgecolors='r')
-
-
-        plt.pause(0.0001)  # Pause to update the plot
-        if self.ctr == 0:
-            time.sleep(2)
-
-        self.ctr = self.ctr + 1
-
     def run(self):
         # instantiation of particle swarm optimizer 
         while not self.myOptimizer.complete():
@@ -222,7 +135,7 @@ class TestGraph():
                     print(self.best_eval)
             m_coords = self.myOptimizer.M  #get x,y,z coordinate locations
             f_coords = self.myOptimizer.F_Gb # global best of set
-            self.update_plot(m_coords, f_coords, self.targets, showTarget=True, clearAx=True) #update matplot
+            self.plot.push(m_coords, f_coords, iter) # returns right away, the plot updates on its own
 
         print("Optimized Solution")
         print(self.myOptimizer.get_optimized_soln())
@@ -231,7 +144,8 @@ class TestGraph():
 
 
         print("Optimization ended. Figure closing in 15 seconds.")
-        time.sleep(15) #keep the window open for 15 seconds before ending program
+        iter, eval = self.myOptimizer.get_convergence_data()
+        self.plot.close(self.myOptimizer.M, self.myOptimizer.F_Gb, iter) # keeps the window open for 15 seconds
 
 if __name__ == "__main__":
     pso = TestGraph()
@@ -0,0 +1,375 @@
+#! /usr/bin/python3
+
+##--------------------------------------------------------------------\
+#   pso_python
+#   './pso_python/src/many_swarm.py'
+#   Many independent swarms on one problem, held as stacked
+#       (swarm, particle, dimension) arrays and advanced in lock-step.
+#       Each row of opt_df is one swarm with its own NO_OF_PARTICLES,
+#       T_MOD, BOUNDARY, WEIGHTS and VLIM. Every sweep evaluates the
+#       active particles of all swarms in one objective call, then
+#       updates the bests, velocities, positions and bounds of all
+#       swarms at once, as the 'swarm' class does in batch mode. Used
+#       for parameter sweeps, see get_results() and get_curves().
+#
+#   Author(s): Jonathan Lundquist, Lauren Linkous
+#   Last update: October 18, 2026
+##--------------------------------------------------------------------\
+
+
+import numpy as np
+import pandas as pd
+from numpy.random import Generator, MT19937
+import sys
+
+
+class many_swarm:
+    # arguments should take the form:
+    # many_swarm([[float, float, ...]], [[float, float, ...]], [[float, ...]], float, int,
+    # func, func,
+    # dataFrame,
+    # class obj,
+    # bool, [int, int, ...],
+    # int, int, int)
+    #
+    # opt_df contains one row per swarm:
+    # NO_OF_PARTICLES: int
+    # T_MOD: float
+    # BOUNDARY: int (1 = random, 2 = reflecting, 3 = absorbing, 4 = invisible)
+    # WEIGHTS: [[float, float, float]]
+    # VLIM: float
+    #
+    # E_TOL and maxit apply to each swarm, iterations are counted per swarm.
+    # obj_func and constr_func follow the swarm class. Functions flagged with
+    # 'vectorized = True' get all the particles of all the swarms in one call.
+    # Positions still out of bounds or infeasible after repair_attempts random
+    # draws are clipped to the bounds and given the worst fitness until they
+    # move, as the swarm repair_mode 'penalty'.
+
+    def __init__(self, lbound, ubound, targets, E_TOL, maxit,
+                 obj_func, constr_func,
+                 opt_df,
+                 parent=None,
+                 evaluate_threshold=False, obj_threshold=None,
+                 decimal_limit=4,
+                 seed=None,
+                 repair_attempts=100):
+
+        self.parent = parent
+        self.number_decimals = int(decimal_limit)
+        self.rng = Generator(MT19937(seed))
+        self.repair_attempts = max(int(repair_attempts), 1)
+
+        self.lbound = np.array(lbound, dtype=float).reshape(-1)
+        self.ubound = np.array(ubound, dtype=float).reshape(-1)
+        self.targets = np.array(targets, dtype=float).reshape(1, -1)
+        self.output_size = np.shape(self.targets)[1]
+        self.evaluate_threshold = False
+        self.obj_threshold = None
+        if evaluate_threshold == True:
+            if (obj_threshold is None) or (len(obj_threshold) != self.output_size):
+                self.debug_message_printout("WARNING: THRESHOLD option selected.  +\
+                Dimensions for THRESHOLD do not match TARGET array. Defaulting to TARGET search.")
+            else:
+                self.evaluate_threshold = True
+                self.obj_threshold = np.array(obj_threshold).reshape(-1)
+        self.E_TOL = E_TOL
+        self.maxit = maxit
+        self.obj_func = obj_func
+        self.constr_func = constr_func
+
+        #unpack the opt_df rows, one swarm each
+        self.opt_df = opt_df.reset_index(drop=True)
+        S = len(self.opt_df)
+        D = len(self.lbound)
+        self.N = np.array([int(n) for n in self.opt_df['NO_OF_PARTICLES']])
+        self.T_MOD = np.array([float(t) for t in self.opt_df['T_MOD']])
+        self.boundary = np.array([int(b) for b in self.opt_df['BOUNDARY']])
+        self.weights = np.array([np.array(w, dtype=float).reshape(-1)[:3] for w in self.opt_df['WEIGHTS']])
+        vlimit = np.array([np.broadcast_to(np.array(v, dtype=float).reshape(-1), (D,)) for v in self.opt_df['VLIM']])
+        Nmax = int(np.max(self.N))
+
+        '''
+        self.M                      : Particle locations, (swarms, particles, dimensions).
+        self.V                      : Particle velocities.
+        self.Mlast                  : Last location of each particle.
+        self.Pb                     : Personal best positions.
+        self.F_Pb                   : Personal best Flist values, (swarms, particles, outputs).
+        self.Gb                     : Global best position of each swarm, (swarms, dimensions).
+        self.F_Gb                   : Global best Flist of each swarm, (swarms, outputs).
+        self.Real                   : Particles that exist. Swarms with fewer than the
+                                      largest NO_OF_PARTICLES are padded.
+        self.Active                 : Particles that are moved and evaluated.
+        self.Penalized              : Particles left infeasible by the repair.
+        self.iter                   : Objective evaluations of each swarm.
+        self.done                   : Swarms that converged, reached maxit, or have no active particle.
+        self.InitDeviation          : Initial deviation of each swarm.
+        self.deviation              : Deviation of each swarm at the end of the last sweep.
+        self.delta_t                : Adaptive time modulation of each swarm.
+        self.sweeps                 : Sweeps run.
+        self.history                : Per sweep (iter, norm of F_Gb) of every swarm.
+        '''
+        self.Real = np.arange(Nmax)[np.newaxis, :] < self.N[:, np.newaxis]
+        self.Active = self.Real.copy()
+        self.Penalized = np.zeros((S, Nmax), dtype=bool)
+        variation = self.ubound - self.lbound
+        self.M = np.round(self.rng.random((S, Nmax, D))*variation + self.lbound, self.number_decimals)
+        self.M[np.logical_not(self.Real)] = self.lbound
+        self.V = np.round(self.rng.random((S, Nmax, D))*vlimit[:, np.newaxis, :], self.number_decimals)
+        self.V[np.logical_not(self.Real)] = 0
+        self.Mlast = 1*self.M
+        self.Pb = sys.maxsize*np.ones((S, Nmax, D))
+        self.F_Pb = sys.maxsize*np.ones((S, Nmax, self.output_size))
+        self.Gb = sys.maxsize*np.ones((S, D))
+        self.F_Gb = sys.maxsize*np.ones((S, self.output_size))
+        self.iter = np.zeros(S, dtype=int)
+        self.done = np.zeros(S, dtype=bool)
+        self.InitDeviation = self.absolute_mean_deviation_of_particles()
+        # a swarm with no spread (one particle) uses that of a uniform spread over
+        # the bounds, as swarm.initial_deviation()
+        fallback = np.linalg.norm((self.ubound - self.lbound)/4)
+        if fallback == 0:
+            fallback = 1.0
+        self.InitDeviation = np.where(self.InitDeviation > 0, self.InitDeviation, fallback)
+        self.deviation = 1*self.InitDeviation
+        self.delta_t = self.deviation/(self.T_MOD*self.InitDeviation)
+        self.sweeps = 0
+        self.history = []
+
+        self.debug_message_printout(str(S) + " swarms successfully initialized")
+
+
+    # EVALUATION
+
+    def call_obj_func(self, X):
+        # (rows, D) positions. Returns (rows, outputs) values and a per-row noError array
+        num_rows = np.shape(X)[0]
+        if getattr(self.obj_func, 'vectorized', False) == True:
+            Fvals, noErrors = self.obj_func(X, self.output_size)
+            Fvals = np.reshape(np.array(Fvals, dtype=float), (num_rows, self.output_size))
+            noErrors = np.broadcast_to(np.array(noErrors, dtype=bool).reshape(-1), (num_rows,)).copy()
+            return Fvals, noErrors
+        Fvals = np.zeros((num_rows, self.output_size))
+        noErrors = np.zeros(num_rows, dtype=bool)
+        for i in range(0, num_rows):
+            newFVals, noError = self.obj_func(X[i], self.output_size)
+            if noError == True:
+                Fvals[i] = np.reshape(newFVals, -1)
+                noErrors[i] = True
+        return Fvals, noErrors
+
+    def constraint_mask(self, X):
+        num_rows = np.shape(X)[0]
+        if getattr(self.constr_func, 'vectorized', False) == True:
+            feasible = np.array(self.constr_func(X), dtype=bool).reshape(-1)
+            return np.broadcast_to(feasible, (num_rows,)).copy()
+        return np.array([bool(self.constr_func(X[i])) for i in range(0, num_rows)], dtype=bool)
+
+    def objective_function_evaluation_batch(self, Fvals):
+        # the swarm target/threshold rule, row-wise
+        epsilon = np.finfo(float).eps
+        Flist = np.abs(self.targets - Fvals)
+        if self.evaluate_threshold == True:
+            for ctr in range(0, self.output_size):
+                o_thres = int(self.obj_threshold[ctr])
+                if o_thres == 1: #LESS THAN OR EQUAL
+                    Flist[Fvals[:, ctr] <= self.targets[0, ctr], ctr] = epsilon
+                elif o_thres == 2: #GREATER THAN OR EQUAL
+                    Flist[Fvals[:, ctr] >= self.targets[0, ctr], ctr] = epsilon
+        return Flist
+
+
+    # STATE MACHINE
+
+    # per swarm state, gathered for the running swarms before each sweep
+    SWARM_FIELDS = ['M', 'V', 'Mlast', 'Pb', 'F_Pb', 'Gb', 'F_Gb', 'Real', 'Active', 'Penalized',
+                    'iter', 'done', 'InitDeviation', 'deviation', 'delta_t',
+                    'N', 'T_MOD', 'boundary', 'weights']
+
+    def complete(self):
+        return bool(np.all(self.done))
+
+    def step(self):
+        # one sweep of every swarm that is not done. Finished swarms are left out
+        # of the array work, so long tails of a few slow swarms stay cheap
+        running = np.flatnonzero(np.logical_not(self.done))
+        if len(running) == len(self.done):
+            self.sweep()
+        elif len(running) > 0:
+            full = {}
+            for name in self.SWARM_FIELDS:
+                full[name] = getattr(self, name)
+                setattr(self, name, full[name][running])
+            try:
+                self.sweep()
+            finally:
+                for name in self.SWARM_FIELDS:
+                    full[name][running] = getattr(self, name)
+                    setattr(self, name, full[name])
+        self.sweeps = self.sweeps + 1
+        self.history.append((self.iter.copy(), np.linalg.norm(self.F_Gb, axis=1)))
+
+    def sweep(self):
+        # evaluate, update the bests, then move and bound the particles
+        # cap each swarm at its remaining budget, in particle order
+        candidates = self.Active.copy()
+        budget = (self.maxit - self.iter)[:, np.newaxis]
+        candidates = candidates & (np.cumsum(candidates, axis=1) <= budget)
+        evaluate = candidates & np.logical_not(self.Penalized)
+
+        Fvals, noErrors = self.call_obj_func(self.M[evaluate])
+        Flist = sys.maxsize*np.ones(np.shape(self.F_Pb))
+        ok = np.zeros(np.shape(evaluate), dtype=bool)
+        ok[evaluate] = noErrors
+        Flist[ok] = self.objective_function_evaluation_batch(Fvals[noErrors])
+        evaluated = ok | (candidates & self.Penalized) # penalized particles count as an iteration
+        self.iter = self.iter + np.sum(evaluated, axis=1)
+
+        self.check_global_local(Flist, evaluated)
+        moving = np.any(evaluated, axis=1) # as in batch mode, a sweep with no result does not move
+        self.update_done()
+        move = self.Active & (moving & np.logical_not(self.done))[:, np.newaxis]
+        if np.any(move):
+            self.update_velocity(move)
+            self.update_point(move)
+            self.handle_bounds(move)
+        self.deviation = self.absolute_mean_deviation_of_particles()
+        self.delta_t = np.where(move.any(axis=1), self.deviation/(self.T_MOD*self.InitDeviation), self.delta_t)
+        self.update_done()
+
+    def run(self, suppress_output=True, report_every=100):
+        # step until every swarm is done. Returns get_results()
+        while not self.complete():
+            self.step()
+            if (not suppress_output) and (self.sweeps % report_every == 0):
+                self.debug_message_printout("SWEEP #" + str(self.sweeps) + ": " + \
+                                            str(int(np.sum(self.done))) + " of " + \
+                                            str(len(self.done)) + " swarms done")
+        return self.get_results()
+
+    def update_done(self):
+        converged = np.linalg.norm(self.F_Gb, axis=1) < self.E_TOL
+        self.done = self.done | converged | (self.iter >= self.maxit) | np.logical_not(np.any(self.Active, axis=1))
+
+    def check_global_local(self, Flist, evaluated):
+        norms = np.where(evaluated, np.linalg.norm(Flist, axis=2), np.inf)
+        improved = norms < np.linalg.norm(self.F_Pb, axis=2)
+        self.F_Pb[improved] = Flist[improved]
+        self.Pb[improved] = self.M[improved]
+
+        best = np.argmin(norms, axis=1)
+        swarms = np.arange(len(best))
+        better = norms[swarms, best] < np.linalg.norm(self.F_Gb, axis=1)
+        self.F_Gb[better] = Flist[swarms[better], best[better]]
+        self.Gb[better] = self.M[swarms[better], best[better]]
+
+    def update_velocity(self, move):
+        # same rule as swarm.update_velocity_batch(), with per-swarm weights
+        r = self.rng.random((3,) + np.shape(self.M))
+        w = self.weights[:, :, np.newaxis, np.newaxis]
+        V = np.round(w[:, 0]*r[0]*self.V \
+                     + w[:, 1]*r[1]*(self.Pb - self.M) \
+                     + w[:, 2]*r[2]*(self.Gb[:, np.newaxis, :] - self.M),
+                     self.number_decimals)
+        self.V[move] = V[move]
+
+    def update_point(self, move):
+        self.Mlast[move] = self.M[move]
+        delta_t = np.round(self.delta_t, self.number_decimals)[:, np.newaxis, np.newaxis]
+        M = np.round(self.M + delta_t*self.V, self.number_decimals)
+        self.M[move] = M[move]
+
+
+    # BOUNDS
+
+    def bound_violations(self, mask):
+        # out of bounds (particles, dimensions) and constraint (particles) masks of
+        # the particles selected by 'mask', in the order of self.M[mask]
+        M = self.M[mask]
+        out_of_bounds = (M < self.lbound) | (M > self.ubound)
+        feasible = self.constraint_mask(M)
+        return out_of_bounds, feasible
+
+    def handle_bounds(self, move):
+        out_of_bounds, feasible = self.bound_violations(move)
+        outside = np.zeros(np.shape(move), dtype=bool)
+        outside[move] = np.any(out_of_bounds, axis=1)
+        infeasible = np.zeros(np.shape(move), dtype=bool)
+        infeasible[move] = np.logical_not(feasible)
+        kind = self.boundary[:, np.newaxis]
+
+        # invisible: leave the search
+        self.Active[(kind == 4) & (outside | infeasible)] = False
+        # reflecting and absorbing: back to the last position, velocity flipped or zeroed
+        hit = ((kind == 2) | (kind == 3)) & outside & np.logical_not(infeasible)
+        if np.any(hit):
+            dims = np.zeros(np.shape(self.M), dtype=bool)
+            dims[move] = out_of_bounds
+            self.M[hit] = self.Mlast[hit]
+            flip = hit[:, :, np.newaxis] & dims
+            self.V = np.where(flip & (kind == 2)[:, :, np.newaxis], -1*self.V, self.V)
+            self.V = np.where(flip & (kind == 3)[:, :, np.newaxis], 0, self.V)
+        # random, and constraint violations of reflecting and absorbing: resample
+        resample = ((kind == 1) & (outside | infeasible)) | (((kind == 2) | (kind == 3)) & infeasible)
+        self.Penalized[move & np.logical_not(resample)] = False
+        self.resample_positions(resample)
+
+    def resample_positions(self, mask):
+        # redraw until in bounds and feasible, capped at repair_attempts rounds.
+        # The rest are clipped to the bounds and penalized
+        variation = self.ubound - self.lbound
+        attempted = np.clip(self.M, self.lbound, self.ubound)
+        attempts = 0
+        while np.any(mask) and (attempts < self.repair_attempts):
+            self.M[mask] = np.round(self.rng.random((int(np.sum(mask)), len(self.lbound)))*variation + self.lbound,
+                                    self.number_decimals)
+            attempts = attempts + 1
+            out_of_bounds, feasible = self.bound_violations(mask)
+            failed = np.zeros(np.shape(mask), dtype=bool)
+            failed[mask] = np.any(out_of_bounds, axis=1) | np.logical_not(feasible)
+            self.Penalized[mask & np.logical_not(failed)] = False
+            mask = failed
+        self.M[mask] = np.round(attempted[mask], self.number_decimals)
+        self.Penalized[mask] = True
+
+    def absolute_mean_deviation_of_particles(self):
+        # per swarm, over the particles that exist (as swarm, inactive particles included)
+        real = self.Real[:, :, np.newaxis]
+        count = self.N[:, np.newaxis]
+        mean_data = np.sum(self.M*real, axis=1)/count
+        deviation = np.sum(np.abs(self.M - mean_data[:, np.newaxis, :])*real, axis=1)/count
+        return np.linalg.norm(deviation, axis=1)
+
+
+    # RESULTS
+
+    def get_results(self):
+        # opt_df with one column per result: iterations, best_eval (norm of F_Gb),
+        # converged, Gb and F_Gb
+        results = self.opt_df.copy()
+        results['iterations'] = self.iter
+        results['best_eval'] = np.linalg.norm(self.F_Gb, axis=1)
+        results['converged'] = np.linalg.norm(self.F_Gb, axis=1) < self.E_TOL
+        results['Gb'] = [list(g) for g in self.Gb]
+        results['F_Gb'] = [list(f) for f in self.F_Gb]
+        return results
+
+    def get_curves(self):
+        # convergence curves, one row per swarm and sweep: swarm (row of opt_df),
+        # sweep, iterations and best_eval after the sweep
+        S = len(self.N)
+        if len(self.history) == 0:
+            return pd.DataFrame(columns=['swarm', 'sweep', 'iterations', 'best_eval'])
+        iterations = np.array([h[0] for h in self.history])
+        best_eval = np.array([h[1] for h in self.history])
+        sweeps = len(self.history)
+        return pd.DataFrame({'swarm': np.tile(np.arange(S), sweeps),
+                             'sweep': np.repeat(np.arange(1, sweeps + 1), S),
+                             'iterations': iterations.reshape(-1),
+                             'best_eval': best_eval.reshape(-1)})
+
+    def debug_message_printout(self, msg):
+        if self.parent == None:
+            print(msg)
+        else:
+            self.parent.debug_message_printout(msg)
@@ -14,14 +14,16 @@ import sys
 
 try: # for outside func calls
     sys.path.insert(0, './pso_python/src/')
-    from one_dim_x_test.func_F import func_F
-    from one_dim_x_test.constr_F import constr_F
+    from one_dim_x_test.func_F import func_F, func_F_batch
+    from one_dim_x_test.constr_F import constr_F, constr_F_batch
 except: # for local
-    from func_F import func_F
-    from constr_F import constr_F
+    from func_F import func_F, func_F_batch
+    from constr_F import constr_F, constr_F_batch
 
 OBJECTIVE_FUNC = func_F
+OBJECTIVE_FUNC_BATCH = func_F_batch   # vectorized, (N, IN_VARS) in, (N, OUT_VARS) out
 CONSTR_FUNC = constr_F
+CONSTR_FUNC_BATCH = constr_F_batch   # vectorized, (N, IN_VARS) in, N booleans out
 OBJECTIVE_FUNC_NAME = "one_dim_x_test.func_F"
 CONSTR_FUNC_NAME = "one_dim_x_test.constr_F"
 
@@ -6,9 +6,18 @@
 #   constraints function for function compatable with project optimizers
 #
 #   Author(s): Lauren Linkous (LINKOUSLC@vcu.edu)
-#   Last update: March 30, 2024
+#   Last update: October 18, 2026
 ##-------------------------------------------------------------------------------\
 
+import numpy as np
+
 def constr_F(x):
     F = True
-    return F
\ No newline at end of file
+    return F
+
+
+def constr_F_batch(X):
+    # vectorized constraints. X is (N, IN_VARS), returns a boolean array of N
+    return np.ones(np.shape(np.atleast_2d(X))[0], dtype=bool)
+
+constr_F_batch.vectorized = True
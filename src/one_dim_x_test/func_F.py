@@ -6,7 +6,7 @@
 #   objective function for function compatable with project optimizers
 #
 #   Author(s): Lauren Linkous (LINKOUSLC@vcu.edu)
-#   Last update: May 28, 2024
+#   Last update: October 18, 2026
 ##-------------------------------------------------------------------------------\
 
 import numpy as np
@@ -25,3 +25,22 @@ def func_F(X, NO_OF_OUTS=1):
         noErrors = False
 
     return [F], noErrors
+
+
+def func_F_batch(X, NO_OF_OUTS=1):
+    # vectorized objective. X is (N, IN_VARS), F is (N, NO_OF_OUTS)
+    # noErrors is a per-row flag so one bad row does not discard the batch
+    X = np.atleast_2d(X)
+    F = np.zeros((np.shape(X)[0], NO_OF_OUTS))
+    noErrors = np.zeros(np.shape(X)[0], dtype=bool)
+    try:
+        with np.errstate(all='ignore'):
+            x = X[:, 0]
+            F[:, 0] = np.sin(5 * x**3) + np.cos(5 * x) * (1 - np.tanh(x ** 2))
+        noErrors = np.all(np.isfinite(F), axis=1)
+    except Exception as e:
+        print(e)
+
+    return F, noErrors
+
+func_F_batch.vectorized = True
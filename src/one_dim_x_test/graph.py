@@ -6,38 +6,38 @@
 #   generates graphs for function based on constraints and configurations
 #
 #   Author(s): Lauren Linkous (LINKOUSLC@vcu.edu)
-#   Last update: June 24, 2024
+#   Last update: October 18, 2026
 ##-------------------------------------------------------------------------------\
 
 
+import os
+import sys
 import numpy as np
 import matplotlib.pyplot as plt
 
 import configs_F as f_c
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from reference_grid import cached_grid
 # problem constraints - pulled from the function configs for the optimizers
 LOWER_BOUNDS = f_c.LB[0]
 UPPER_BOUNDS = f_c.UB[0]
 LB_x = LOWER_BOUNDS[0] 
 UB_x = UPPER_BOUNDS[0]
-FUNC_F = f_c.OBJECTIVE_FUNC
+OUT_VARS = f_c.OUT_VARS
+FUNC_F = f_c.OBJECTIVE_FUNC_BATCH     # vectorized versions, the whole grid is evaluated at once
+CONSTR_F = f_c.CONSTR_FUNC_BATCH
 GLOBAL_MIN = f_c.GLOBAL_MIN
+RESOLUTION = 1000                     # grid points
 
 #write out plot
 plotname = "1D_test_plots.png"
 
-# Define range and step size
-X = np.vstack(np.linspace(LB_x, UB_x, 1000))
-# Reshape X to 1D array
-X_flat = X.flatten()
-
-# Evaluate function
-
-Y = []
-for c in X:
-    y, noErr = FUNC_F(c)
-    if noErr == True:
-        Y.append(y)
-
+# Evaluate function over the grid. The results are cached in ./grid_cache,
+# and reused while the function, bounds and resolution stay the same
+axes, F, valid = cached_grid('one_dim_x_test', FUNC_F, CONSTR_F,
+                             LOWER_BOUNDS, UPPER_BOUNDS, RESOLUTION, OUT_VARS)
+X = axes[0][valid]
+Y = F[valid, 0]
 
 # Create figure and subplots
 fig = plt.figure(figsize=(10, 5))
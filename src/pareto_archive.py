@@ -0,0 +1,176 @@
+#! /usr/bin/python3
+
+##--------------------------------------------------------------------\
+#   pso_python
+#   './pso_python/src/pareto_archive.py'
+#   External archive of non-dominated solutions for the multi-objective
+#       mode of the 'swarm' class in particle_swarm.py. All outputs of
+#       Flist are minimized. The archive is bounded, and the most crowded
+#       members are pruned first (crowding distance), so the stored front
+#       stays spread out. Leaders for the velocity update are drawn from
+#       the archive by binary tournament on crowding distance.
+#
+#   Author(s): Jonathan Lundquist, Lauren Linkous
+#   Last update: October 18, 2026
+##--------------------------------------------------------------------\
+
+
+import numpy as np
+
+
+def dominates(A, B):
+    # row-wise. True where A dominates B: no worse in every output, better in at least one.
+    # A and B are (n, outputs), or broadcastable to it
+    return np.all(A <= B, axis=-1) & np.any(A < B, axis=-1)
+
+
+def nondominated_mask(F, chunk_size=1024):
+    # mask of the rows of F (n, outputs) that no other row dominates.
+    # A dominating row always has a smaller sum of outputs, so rows are visited
+    # in order of their sum and only compared with the front found so far,
+    # chunk_size rows at a time. Two outputs use a sort and a running minimum
+    F = np.asarray(F, dtype=float)
+    n, m = np.shape(F)
+    mask = np.zeros(n, dtype=bool)
+    if n == 0:
+        return mask
+
+    if m == 2:
+        # rows sorted by the first output, then the second. Among distinct rows, a row
+        # is dominated when an earlier one has a second output no larger than its own.
+        # Repeated rows share the result of their first copy
+        order = np.lexsort((F[:, 1], F[:, 0]))
+        S = F[order]
+        first = np.ones(n, dtype=bool)
+        first[1:] = np.any(S[1:] != S[:-1], axis=1)
+        unique = S[first]
+        running_min = np.minimum.accumulate(unique[:, 1])
+        front = np.ones(len(unique), dtype=bool)
+        front[1:] = unique[1:, 1] < running_min[:-1]
+        mask[order] = front[np.cumsum(first) - 1]
+        return mask
+
+    order = np.argsort(np.sum(F, axis=1), kind='stable')
+    front = np.zeros((0, m))
+    for start in range(0, n, chunk_size):
+        rows = order[start:start + chunk_size]
+        # drop the rows the front dominates first, usually most of the chunk
+        keep = np.logical_not(np.any(dominates(front[:, np.newaxis, :], F[rows][np.newaxis, :, :]), axis=0))
+        rows = rows[keep]
+        chunk = F[rows]
+        keep = np.logical_not(np.any(dominates(chunk[:, np.newaxis, :], chunk[np.newaxis, :, :]), axis=0))
+        mask[rows[keep]] = True
+        front = np.vstack((front, chunk[keep]))
+    return mask
+
+
+def crowding_distance(F):
+    # NSGA-II crowding distance of the rows of F (n, outputs). The extremes of
+    # each output get an infinite distance so they are never pruned
+    n, m = np.shape(F)
+    distance = np.zeros(n)
+    if n <= 2:
+        distance[:] = np.inf
+        return distance
+    for k in range(0, m):
+        order = np.argsort(F[:, k], kind='stable')
+        values = F[order, k]
+        span = values[-1] - values[0]
+        distance[order[0]] = np.inf
+        distance[order[-1]] = np.inf
+        if span > 0:
+            distance[order[1:-1]] = distance[order[1:-1]] + (values[2:] - values[:-2])/span
+    return distance
+
+
+class pareto_archive:
+    # arguments should take the form:
+    # pareto_archive(int)
+    #
+    # max_size: int. max number of archived solutions
+
+    def __init__(self, max_size=100):
+        self.max_size = int(max_size)
+
+        '''
+        self.X                      : Archived positions, (n, D).
+        self.Flist                  : Archived Flist values, minimized, (n, outputs).
+        self.Fvals                  : Archived raw objective outputs, (n, outputs).
+        self.crowding               : Crowding distance of the archived solutions.
+        '''
+        self.X = None
+        self.Flist = None
+        self.Fvals = None
+        self.crowding = None
+
+    def __len__(self):
+        if self.X is None:
+            return 0
+        return np.shape(self.X)[0]
+
+    def add(self, X, Flist, Fvals):
+        # X is (n, D), Flist and Fvals are (n, outputs).
+        # Returns the number of candidates that entered the archive
+        X = np.atleast_2d(X)
+        Flist = np.atleast_2d(Flist)
+        Fvals = np.atleast_2d(Fvals)
+        if self.X is None:
+            self.X = np.zeros((0, np.shape(X)[1]))
+            self.Flist = np.zeros((0, np.shape(Flist)[1]))
+            self.Fvals = np.zeros((0, np.shape(Fvals)[1]))
+
+        if np.shape(X)[0] == 1:
+            # single candidate, one pass over the archive
+            if np.any(dominates(self.Flist, Flist)) or np.any(np.all(self.X == X, axis=1)):
+                return 0
+            keep = np.logical_not(dominates(Flist, self.Flist))
+            self.X = np.vstack((self.X[keep], X))
+            self.Flist = np.vstack((self.Flist[keep], Flist))
+            self.Fvals = np.vstack((self.Fvals[keep], Fvals))
+            added = 1
+        else:
+            size = len(self)
+            allX = np.vstack((self.X, X))
+            allFlist = np.vstack((self.Flist, Flist))
+            allFvals = np.vstack((self.Fvals, Fvals))
+            # drop repeated positions, keeping archived members first
+            unique = np.zeros(len(allX), dtype=bool)
+            unique[np.unique(allX, axis=0, return_index=True)[1]] = True
+            keep = unique & nondominated_mask(allFlist)
+            added = int(np.sum(keep[size:]))
+            self.X = allX[keep]
+            self.Flist = allFlist[keep]
+            self.Fvals = allFvals[keep]
+
+        self.prune()
+        return added
+
+    def prune(self):
+        # drop the most crowded members until the archive fits. Large overflows
+        # are first cut down in one pass, then one member at a time
+        if len(self) > 2*self.max_size:
+            self.keep(np.argsort(-crowding_distance(self.Flist), kind='stable')[:2*self.max_size])
+        while len(self) > self.max_size:
+            remove = np.argmin(crowding_distance(self.Flist))
+            self.keep(np.delete(np.arange(len(self)), remove))
+        self.crowding = crowding_distance(self.Flist)
+
+    def keep(self, index):
+        self.X = self.X[index]
+        self.Flist = self.Flist[index]
+        self.Fvals = self.Fvals[index]
+
+    def select_leaders(self, rng, n):
+        # binary tournament on crowding distance. Returns n archived positions
+        size = len(self)
+        pairs = rng.integers(0, size, (n, 2))
+        first_wins = self.crowding[pairs[:, 0]] >= self.crowding[pairs[:, 1]]
+        winners = np.where(first_wins, pairs[:, 0], pairs[:, 1])
+        return self.X[winners]
+
+    def get_front(self):
+        # archived solutions ordered by the first output
+        if len(self) == 0:
+            return self.X, self.Fvals, self.Flist
+        order = np.argsort(self.Flist[:, 0], kind='stable')
+        return self.X[order], self.Fvals[order], self.Flist[order]
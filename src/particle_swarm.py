@@ -11,13 +11,20 @@
 #       
 #
 #   Author(s): Jonathan Lundquist, Lauren Linkous
-#   Last update: June 18, 2025
+#   Last update: October 18, 2026
 ##--------------------------------------------------------------------\
 
 
 import numpy as np
 from numpy.random import Generator, MT19937
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from collections import deque
+from swarm_events import evaluation_event, step_event, best_event, sweep_event, complete_event
+from pareto_archive import pareto_archive, dominates
+import warnings
+import time
 import sys
+import os
 np.seterr(all='raise')
 
 class swarm:
@@ -35,13 +42,69 @@ class swarm:
     # boundary: int. 1 = random, 2 = reflecting, 3 = absorbing,   4 = invisible
     # vlim: float
     # 
+    # mode: 'sequential' (default) advances one particle per step()/call_objective() pair
+    #       'batch' advances every active particle per step()/call_objective() pair
+    # cache: eval_cache object or None. Memoizes objective calls on rounded positions
+    # initial_design: 'uniform', 'lhs', 'halton', 'sobol', or an (N, D) array of starting positions
+    # seed: int or None. Seed for the random number generator
+    # repair_attempts: int. max rounds of resampling when a particle violates bounds or constraints
+    # repair_mode: 'project' or 'penalty'. what to do with particles still infeasible after repair_attempts
+    # checkpoint_path: str or None. '.npz' file for automatic checkpoints (see save_checkpoint())
+    # checkpoint_every: int or None. save a checkpoint every this many objective evaluations
+    # checkpoint_seconds: float or None. save a checkpoint when this many seconds have passed since the last one
+    # recorder: trajectory_recorder object or None. Records every ingested evaluation
+    # profiler: swarm_profiler object or None. Times each phase of the state machine
+    # multi_objective: bool. keep an archive of non-dominated solutions and draw the
+    #       social term of the velocity update from it (see pareto_archive.py)
+    # archive_size: int. max number of solutions in the multi-objective archive
+    # stagnation_sweeps: int or None. stop after this many sweeps without a relative
+    #       improvement of norm(F_Gb) larger than stagnation_tol
+    # stagnation_tol: float. relative improvement that resets the stagnation count
+    # min_deviation: float or None. stop when the mean absolute deviation of the particles
+    #       falls below this fraction of its initial value
+    # max_time: float or None. wall-clock budget in seconds
+    # max_evals: int or None. budget of objective function calls (cache hits are free)
+    # surrogate: object or None. e.g. rbf_surrogate from surrogate_model.py. Moved particles
+    #       predicted not to improve their personal best skip the objective call
+    # surrogate_max_skips: int. consecutive skips allowed per particle before a real call
+    # surrogate_margin: float. relative slack on the predicted improvement, 0.1 also
+    #       evaluates points predicted up to 10% worse than the personal best
+    # topology: 'global' (default), 'ring', 'von_neumann' or 'random'. The social term of
+    #       the velocity update pulls toward the best personal best in each particle's
+    #       neighborhood instead of Gb (see TOPOLOGIES)
+    # topology_k: int. 'random' topology, other particles in each neighborhood
+    # topology_switch: float or None. fraction of maxit after which the global best is used
    
     def __init__(self,  lbound, ubound, targets, E_TOL, maxit,
                  obj_func, constr_func, 
                  opt_df,
                  parent=None, 
                  evaluate_threshold=False, obj_threshold=None,
-                 decimal_limit = 4): 
+                 decimal_limit = 4,
+                 mode="sequential",
+                 cache=None,
+                 initial_design="uniform",
+                 seed=None,
+                 repair_attempts=100,
+                 repair_mode="project",
+                 checkpoint_path=None,
+                 checkpoint_every=None,
+                 checkpoint_seconds=None,
+                 recorder=None,
+                 profiler=None,
+                 multi_objective=False,
+                 archive_size=100,
+                 stagnation_sweeps=None,
+                 stagnation_tol=10 ** -6,
+                 min_deviation=None,
+                 max_time=None,
+                 max_evals=None,
+                 surrogate=None,
+                 surrogate_max_skips=3,
+                 surrogate_margin=0.1,
+                 topology="global",
+                 topology_k=3,
+                 topology_switch=None): 
 
         # Optional parent class func call to write out values that trigger constraint issues
         self.parent = parent 
@@ -49,6 +112,93 @@ class swarm:
         self.number_decimals = int(decimal_limit)  # limit the number of decimals
                                               # used in cases where real life has limitations on resolution
 
+        # state machine mode. 'batch' is a synchronous swarm update where one
+        # step/call_objective pair moves and evaluates all active particles
+        if mode in ["sequential", "batch"]:
+            self.mode = mode
+        else:
+            self.debug_message_printout("WARNING: unrecognized mode '" + str(mode) + \
+                                        "'. Defaulting to sequential.")
+            self.mode = "sequential"
+
+        # constraint repair. resampling is capped at repair_attempts rounds, then
+        # 'project' moves the particle back toward its last feasible position and
+        # 'penalty' leaves it in place with the worst fitness until it moves out
+        self.repair_attempts = max(int(repair_attempts), 1)
+        if repair_mode in ["project", "penalty"]:
+            self.repair_mode = repair_mode
+        else:
+            self.debug_message_printout("WARNING: unrecognized repair mode '" + str(repair_mode) + \
+                                        "'. Defaulting to project.")
+            self.repair_mode = "project"
+
+        # automatic checkpoints. Written after an evaluation is ingested, when
+        # either the evaluation count or the time since the last save is reached
+        self.checkpoint_path = checkpoint_path
+        self.checkpoint_every = checkpoint_every
+        self.checkpoint_seconds = checkpoint_seconds
+        self.checkpoint_iter = 0
+        self.checkpoint_time = time.monotonic()
+
+        # optional evaluation history (see trajectory_recorder.py)
+        self.recorder = recorder
+
+        # optional per-phase timing (see swarm_profiler.py). Instrumented at
+        # the end of the initialization
+        self.profiler = profiler
+
+        # multi-objective mode. Personal bests are replaced unless the new point is
+        # dominated, and leaders come from the archive instead of Gb. Gb is still
+        # the smallest norm point, and is used for the convergence check
+        self.multi_objective = bool(multi_objective)
+        self.archive = None
+        if self.multi_objective:
+            self.archive = pareto_archive(archive_size)
+
+        # termination rules beyond E_TOL and maxit. The sweep based rules are
+        # checked in end_of_sweep(), the budgets in complete()
+        self.stagnation_sweeps = stagnation_sweeps
+        self.stagnation_tol = float(stagnation_tol)
+        self.min_deviation = min_deviation
+        self.max_time = max_time
+        self.max_evals = max_evals
+        self.start_time = time.monotonic()
+        self.evaluations = 0
+        self.stall_best = np.inf
+        self.stall_sweeps = 0
+        self.sweep_stop = None
+        self.stop_reason = None
+
+        # optional surrogate pre-screening. Skipped particles move on without an
+        # objective call, and without updating the bests, as after a failed call
+        self.surrogateOptimizer = surrogate
+        self.useSurrogateModel = surrogate != None
+        self.surrogate_max_skips = max(int(surrogate_max_skips), 0)
+        self.surrogate_margin = float(surrogate_margin)
+
+        # communication topology. Neighborhoods are built once, after the initial
+        # positions and velocities, and are fixed for the run
+        if topology in ["global", "ring", "von_neumann", "random"]:
+            self.topology = topology
+        else:
+            self.debug_message_printout("WARNING: unrecognized topology '" + str(topology) + \
+                                        "'. Defaulting to global.")
+            self.topology = "global"
+        self.topology_k = max(int(topology_k), 1)
+        self.topology_switch = topology_switch
+        self.neighbors = None
+
+        # structured event subscribers, see subscribe(). Records are only built
+        # for the event types in self.listening
+        self.subscribers = []
+        self.listening = set()
+        self.completion_emitted = False
+
+        # optional objective call memoization (see eval_cache.py)
+        self.cache = cache
+        if (self.cache != None) and (self.cache.decimals == None):
+            self.cache.decimals = self.number_decimals
+
 
         #evaluation method for targets
         # True: Evaluate as true targets
@@ -84,7 +234,7 @@ class swarm:
         lbound = np.array(lbound[0])
         ubound = np.array(ubound[0])
 
-        self.rng = Generator(MT19937())
+        self.rng = Generator(MT19937(seed))
 
         if ((heightl > 1) and (widthl > 1)) \
            or ((heightu > 1) and (widthu > 1)) \
@@ -109,28 +259,13 @@ class swarm:
             self.lbound = lbound
             self.ubound = ubound
             variation = ubound-lbound
+            num_dims = np.max([heightl, widthl])
 
             # position
-            self.M = np.round(np.array(np.multiply(self.rng.random((1,np.max([heightl, widthl]))), variation)+lbound), self.number_decimals)   
+            self.M = self.initial_positions(initial_design, NO_OF_PARTICLES, num_dims)
 
             # velocity
-            self.V = np.round(np.array(np.multiply(self.rng.random((1,np.max([heightl,widthl]))), vlimit)), self.number_decimals)
-
-
-
-            for i in range(2,int(NO_OF_PARTICLES)+1):
-
-                M = np.round(np.array(np.multiply(self.rng.random((1,np.max([heightl, widthl]))), variation)+lbound), self.number_decimals)
-
-                V = np.round(np.array(np.multiply(self.rng.random((1,np.max([heightl,widthl]))), vlimit)), self.number_decimals)
-
-                self.M = \
-                    np.vstack([self.M, 
-                               M])
-
-                self.V = \
-                    np.vstack([self.V,
-                               V])               
+            self.V = np.round(np.multiply(self.rng.random((NO_OF_PARTICLES, num_dims)), vlimit), self.number_decimals)
  
  
             '''
@@ -157,8 +292,29 @@ class swarm:
             self.Flist                  : List to store fitness values.
             self.Fvals                  : List to store fitness values.
             self.vlimit                 : Velocity limits for the particles.
-            self.Mlast                  : Last location of particle.
+            self.Mlast                  : Last location of each particle.
+            self.evaluated              : Batch mode. Particles with a valid objective call this sweep.
+            self.evaluations            : Objective function calls made (cache hits not included).
+            self.stall_best             : norm(F_Gb) at the last improvement larger than stagnation_tol.
+            self.stall_sweeps           : Sweeps since the last such improvement.
+            self.sweep_stop             : Stop reason set by the sweep based termination rules.
+            self.stop_reason            : Rule that completed the run, see get_stop_reason().
+            self.ask_queue              : Ask/tell. Particles that are not waiting on a result.
+            self.tickets                : Ask/tell. Outstanding ticket ids and their particle.
+            self.next_ticket            : Ask/tell. Next ticket id to hand out.
+            self.tell_count             : Ask/tell. Results received since the last sweep ended.
+            self.Mfeasible              : Last position of each particle that met the bounds and constraints.
+            self.has_feasible           : Whether self.Mfeasible has been set for each particle.
+            self.Penalized              : Particles left infeasible by the constraint repair.
+            self.repair_stats           : Constraint repair counters.
+            self.surrogate_skips        : Consecutive objective calls skipped by each particle.
+            self.surrogate_stats        : Surrogate pre-screening counters.
+            self.neighbors              : Local topology. Particle indices of each neighborhood, one row per particle.
+            self.informs                : Local topology. Neighborhoods each particle belongs to, indexed by self.informs_ptr.
+            self.Nb                     : Local topology. Best personal best position in each neighborhood.
+            self.F_Nb                   : Fitness value corresponding to each neighborhood best position.
             self.InitDeviation          : Initial deviation of particles.
+            self.deviation              : Deviation of particles at the end of the last sweep.
             self.delta_t                : Adaptive time modulation.
             '''
             self.output_size = len(targets)
@@ -182,28 +338,239 @@ class swarm:
             self.Flist = []
             self.Fvals = []
             self.vlimit = vlimit
-            self.Mlast = 1*self.ubound
-            self.InitDeviation = self.absolute_mean_deviation_of_particles() 
-            self.delta_t = self.absolute_mean_deviation_of_particles()/(T_MOD*self.InitDeviation)
+            self.Mlast = 1*self.M
+            self.evaluated = np.zeros(NO_OF_PARTICLES, dtype=bool)
+            self.ask_queue = deque(range(0, NO_OF_PARTICLES))
+            self.tickets = {}
+            self.next_ticket = 0
+            self.tell_count = 0
+            self.Mfeasible = 1*self.M
+            self.has_feasible = np.zeros(NO_OF_PARTICLES, dtype=bool)
+            self.Penalized = np.zeros(NO_OF_PARTICLES, dtype=bool)
+            self.repair_stats = {'calls': 0, 'draws': 0, 'fallbacks': 0, 'projected': 0, 'penalized': 0}
+            self.surrogate_skips = np.zeros(NO_OF_PARTICLES, dtype=int)
+            self.surrogate_stats = {'screened': 0, 'skipped': 0, 'forced': 0}
+            if self.topology != "global":
+                self.set_neighbors(self.neighbor_index(self.topology, NO_OF_PARTICLES, self.topology_k))
+            self.InitDeviation = self.initial_deviation() 
+            self.deviation = 1*self.InitDeviation
+            self.delta_t = self.deviation/(T_MOD*self.InitDeviation)
+
+            if self.profiler != None:
+                self.profiler.instrument(self)
 
             self.debug_message_printout("swarm successfully initialized")
 
 
+    # INITIAL DESIGNS
+
+    def initial_positions(self, design, num_particles, num_dims):
+        # starting positions for the swarm, scaled to the bounds and rounded
+        if not isinstance(design, str):
+            try:
+                M = np.array(design, dtype=float)
+            except (TypeError, ValueError):
+                M = None
+            if (M is not None) and (np.shape(M) == (num_particles, num_dims)) and np.all(np.isfinite(M)):
+                clipped = np.clip(M, self.lbound, self.ubound)
+                if np.any(clipped != M):
+                    self.debug_message_printout("WARNING: initial design has positions outside the bounds. Clipping to the bounds.")
+                return np.round(clipped, self.number_decimals)
+            self.debug_message_printout("WARNING: initial design array must be NO_OF_PARTICLES x N with finite values. Defaulting to uniform.")
+            design = "uniform"
+
+        if design == "lhs":
+            # latin hypercube. one sample in each of num_particles strata per dimension
+            strata = np.argsort(self.rng.random((num_particles, num_dims)), axis=0)
+            samples = (strata + self.rng.random((num_particles, num_dims)))/num_particles
+        elif design == "halton":
+            samples = self.halton_samples(num_particles, num_dims)
+        elif design == "sobol":
+            samples = self.sobol_samples(num_particles, num_dims)
+        else:
+            if design != "uniform":
+                self.debug_message_printout("WARNING: unrecognized initial design '" + str(design) + \
+                                            "'. Defaulting to uniform.")
+            samples = self.rng.random((num_particles, num_dims))
+
+        return np.round(np.multiply(samples, self.ubound-self.lbound)+self.lbound, self.number_decimals)
+
+    def halton_samples(self, num_particles, num_dims):
+        # halton sequence with a random shift (mod 1) so seeds give different designs
+        primes = []
+        candidate = 2
+        while len(primes) < num_dims:
+            if all(candidate % p != 0 for p in primes):
+                primes.append(candidate)
+            candidate = candidate + 1
+
+        samples = np.zeros((num_particles, num_dims))
+        for d in range(0, num_dims):
+            base = primes[d]
+            n = np.arange(1, num_particles+1)
+            f = 1.0
+            while np.any(n > 0):
+                f = f/base
+                samples[:, d] = samples[:, d] + f*(n % base)
+                n = n // base
+        return np.mod(samples + self.rng.random((1, num_dims)), 1.0)
+
+    def sobol_samples(self, num_particles, num_dims):
+        # scrambled sobol sequence. scipy is optional, halton is used without it
+        try:
+            from scipy.stats import qmc
+        except ImportError:
+            self.debug_message_printout("WARNING: sobol initial design requires scipy. Using halton.")
+            return self.halton_samples(num_particles, num_dims)
+        with warnings.catch_warnings(): # non power of 2 sample counts are fine here
+            warnings.simplefilter("ignore")
+            return qmc.Sobol(d=num_dims, scramble=True, seed=self.rng).random(num_particles)
+
+
     def call_objective(self, allow_update):
+        if self.mode == "batch":
+            return self.call_objective_batch(allow_update)
         if self.Active[self.current_particle]:
+            if self.Penalized[self.current_particle]:
+                return self.call_penalty(allow_update)
+            if self.useSurrogateModel and \
+                    (len(self.surrogate_screen(np.array([self.current_particle]))) == 0):
+                return self.call_skipped(allow_update)
             # call the objective function. If there's an issue with the function execution, 'noError' returns False
-            newFVals, noError = self.obj_func(self.M[self.current_particle], self.output_size)
+            if (self.cache == None) and (not self.useSurrogateModel) and (self.profiler == None) \
+                    and (getattr(self.obj_func, 'vectorized', False) != True):
+                # plain objective function, called directly
+                self.evaluations = self.evaluations + 1
+                newFVals, noError = self.obj_func(self.M[self.current_particle], self.output_size)
+            else:
+                newFVals, noErrors = self.evaluate_positions(self.M[[self.current_particle]])
+                newFVals, noError = newFVals[0], bool(noErrors[0])
             if noError == True:
                 self.Fvals = np.array(newFVals).reshape(-1, 1)
                 if allow_update:
                     # EVALUATE OBJECTIVE FUNCTION - TARGET OR THRESHOLD
                     self.Flist = self.objective_function_evaluation(self.Fvals, self.targets)# abs(self.targets - self.Fvals)
                     self.iter = self.iter + 1
+                    self.record_evaluations([self.current_particle], self.Fvals, self.Flist)
                     self.allow_update = 1
+                    self.auto_checkpoint()
                 else:
                     self.allow_update = 0
             return noError# return is for error reporting purposes only
 
+    def call_penalty(self, allow_update):
+        # positions left infeasible by the constraint repair are not evaluated. 
+        # They get the worst possible fitness, and still count as an iteration
+        # so that maxit bounds the run
+        self.Fvals = np.zeros((self.output_size, 1))
+        if allow_update:
+            self.Flist = sys.maxsize*np.ones((self.output_size, 1))
+            self.iter = self.iter + 1
+            self.record_evaluations([self.current_particle], self.Fvals, self.Flist)
+            self.allow_update = 1
+            self.auto_checkpoint()
+        else:
+            self.allow_update = 0
+        return True
+
+    def call_skipped(self, allow_update):
+        # the surrogate predicts no improvement. The particle moves on as after a
+        # failed call, and no iteration is counted
+        self.Fvals = np.zeros((self.output_size, 1))
+        if allow_update:
+            self.Flist = sys.maxsize*np.ones((self.output_size, 1))
+            self.allow_update = 1
+        else:
+            self.allow_update = 0
+        return True
+
+    def surrogate_screen(self, particles):
+        # returns the particles that need a real objective call: those predicted to
+        # improve their personal best (a global best improvement is also a personal
+        # one), and those that reached surrogate_max_skips. Until the surrogate has
+        # enough training points every particle is evaluated
+        if (len(particles) == 0) or not self.surrogateOptimizer.ready():
+            return particles
+        Fvals = self.surrogateOptimizer.predict(self.M[particles])
+        Flist = self.objective_function_evaluation_batch(Fvals, self.targets)
+        if self.multi_objective:
+            F_Pb = self.F_Pb[particles]
+            F_Pb = np.where(F_Pb < sys.maxsize, F_Pb*(1 + self.surrogate_margin), F_Pb)
+            promising = np.logical_not(dominates(F_Pb, Flist))
+        else:
+            promising = np.linalg.norm(Flist, axis=1) < \
+                (1 + self.surrogate_margin)*np.linalg.norm(self.F_Pb[particles], axis=1)
+        forced = np.logical_not(promising) & (self.surrogate_skips[particles] >= self.surrogate_max_skips)
+        evaluate = promising | forced
+        self.surrogate_skips[particles[evaluate]] = 0
+        self.surrogate_skips[particles[np.logical_not(evaluate)]] += 1
+        self.surrogate_stats['screened'] = self.surrogate_stats['screened'] + len(particles)
+        self.surrogate_stats['skipped'] = self.surrogate_stats['skipped'] + int(np.sum(np.logical_not(evaluate)))
+        self.surrogate_stats['forced'] = self.surrogate_stats['forced'] + int(np.sum(forced))
+        return particles[evaluate]
+
+    def record_evaluations(self, particles, Fvals, Flist):
+        # pass ingested evaluations to the optional trajectory recorder and subscribers.
+        # Must be called after self.iter is incremented, while self.M still
+        # holds the evaluated positions
+        if self.recorder != None:
+            n = len(particles)
+            self.recorder.record(self.iter, particles, self.M[particles],
+                                 np.reshape(Fvals, (n, -1)), np.reshape(Flist, (n, -1)))
+        if evaluation_event in self.listening:
+            n = len(particles)
+            self.emit(evaluation_event(self.iter, np.array(particles), self.M[particles],
+                                       np.reshape(Fvals, (n, -1)).copy(), np.reshape(Flist, (n, -1)).copy()))
+        if complete_event in self.listening: # drivers stop as soon as maxit is reached
+            self.emit_complete()
+
+    def evaluate_positions(self, X):
+        # evaluate an (N, D) array of positions, answering from the cache where possible.
+        # returns an (N, output_size) array and a per-row noError array
+        num_rows = np.shape(X)[0]
+        if self.cache == None:
+            Fvals, noErrors = self.call_obj_func(X)
+            if self.useSurrogateModel:
+                self.surrogateOptimizer.add(X[noErrors], Fvals[noErrors])
+            return Fvals, noErrors
+
+        Fvals = np.zeros((num_rows, self.output_size))
+        noErrors = np.zeros(num_rows, dtype=bool)
+        for i in range(0, num_rows):
+            cached = self.cache.lookup(X[i])
+            if cached is not None:
+                Fvals[i] = cached
+                noErrors[i] = True
+
+        misses = np.flatnonzero(np.logical_not(noErrors))
+        if len(misses) > 0:
+            Fvals[misses], noErrors[misses] = self.call_obj_func(X[misses])
+            for i in misses[noErrors[misses]]:
+                self.cache.store(X[i], Fvals[i])
+        if self.useSurrogateModel:
+            self.surrogateOptimizer.add(X[noErrors], Fvals[noErrors])
+        return Fvals, noErrors
+
+    def call_obj_func(self, X):
+        # objective functions flagged with 'vectorized = True' take the whole array
+        # and return an (N, output_size) array and a per-row noError array.
+        # any other objective function is called once per row.
+        num_rows = np.shape(X)[0]
+        self.evaluations = self.evaluations + num_rows
+        if getattr(self.obj_func, 'vectorized', False) == True:
+            Fvals, noErrors = self.obj_func(X, self.output_size)
+            Fvals = np.reshape(np.array(Fvals, dtype=float), (num_rows, self.output_size))
+            noErrors = np.broadcast_to(np.array(noErrors, dtype=bool).reshape(-1), (num_rows,)).copy()
+        else:
+            Fvals = np.zeros((num_rows, self.output_size))
+            noErrors = np.zeros(num_rows, dtype=bool)
+            for i in range(0, num_rows):
+                newFVals, noError = self.obj_func(X[i], self.output_size)
+                if noError == True:
+                    Fvals[i] = np.reshape(newFVals, -1)
+                    noErrors[i] = True
+        return Fvals, noErrors
+
     def objective_function_evaluation(self, Fvals, targets):
         #pass in the Fvals & targets so that it's easier to track bugs
 
@@ -268,17 +635,166 @@ class swarm:
             Flist = abs(targets - Fvals)
 
         return Flist
+
+    def call_objective_batch(self, allow_update):
+        # evaluate every active particle. Particles are capped at the remaining
+        # iteration budget so that self.iter never passes maxit.
+        # returns the per-particle noError array, for error reporting purposes only
+        candidates = np.flatnonzero(self.Active)
+        candidates = candidates[:max(int(self.maxit - self.iter), 0)]
+        particles = candidates[np.logical_not(self.Penalized[candidates])]
+        if self.useSurrogateModel:
+            screened = len(particles)
+            particles = self.surrogate_screen(particles)
+        Fvals, noErrors = self.evaluate_positions(self.M[particles])
+        self.set_batch_evaluations(particles, Fvals, noErrors, allow_update,
+                                   penalized=candidates[self.Penalized[candidates]])
+        if self.useSurrogateModel and allow_update and (len(particles) < screened):
+            self.allow_update = 1 # skipped particles still move
+        return self.evaluated[candidates]
+
+    def set_batch_evaluations(self, particles, Fvals, noErrors, allow_update, penalized=None):
+        # store the results of a batch evaluation for the next step_swarm().
+        # penalized particles get the worst fitness, as in call_penalty()
+        if penalized is None:
+            penalized = np.array([], dtype=int)
+        self.Fvals = np.zeros((self.number_of_particles, self.output_size))
+        self.evaluated = np.zeros(self.number_of_particles, dtype=bool)
+        self.Fvals[particles] = Fvals
+        self.evaluated[particles] = noErrors
+        self.evaluated[penalized] = True
+
+        if allow_update and np.any(self.evaluated):
+            # EVALUATE OBJECTIVE FUNCTION - TARGET OR THRESHOLD
+            self.Flist = self.objective_function_evaluation_batch(self.Fvals, self.targets)
+            self.Flist[penalized] = sys.maxsize
+            self.iter = self.iter + int(np.sum(self.evaluated))
+            if (self.recorder != None) or (evaluation_event in self.listening):
+                rows = np.flatnonzero(self.evaluated)
+                self.record_evaluations(rows, self.Fvals[rows], self.Flist[rows])
+            self.allow_update = 1
+            self.auto_checkpoint()
+        else:
+            self.allow_update = 0
+
+    def objective_function_evaluation_batch(self, Fvals, targets):
+        # row-wise version of objective_function_evaluation.
+        # Fvals is (particles, outputs), the returned Flist has the same shape
+        epsilon = np.finfo(float).eps
+        targets = np.reshape(targets, (1, -1))
+        Flist = np.abs(targets - Fvals)
+
+        if self.evaluate_threshold == True: #THRESHOLD
+            for ctr in range(0, self.output_size):
+                o_thres = int(self.obj_threshold[ctr]) #force type as err check
+                if o_thres == 0: #TARGET. default
+                    continue
+                elif o_thres == 1: #LESS THAN OR EQUAL 
+                    met = Fvals[:, ctr] <= targets[0, ctr]
+                elif o_thres == 2: #GREATER THAN OR EQUAL
+                    met = Fvals[:, ctr] >= targets[0, ctr]
+                else:
+                    self.debug_message_printout("ERROR: unrecognized threshold value. Evaluating as TARGET")
+                    continue
+                Flist[met, ctr] = epsilon
+
+        return Flist
         
  
     def update_velocity(self,particle):
-        for i in range(0,np.shape(self.V)[1]):                      
-            self.V[particle,i] = \
-                np.round(self.weights[0][0]* self.rng.random()*self.V[particle,i] \
-                + self.weights[0][1]*self.rng.random()*(self.Pb[particle,i]-self.M[particle,i]) \
-                + self.weights[0][2]*self.rng.random()*(self.Gb[i]-self.M[particle,i])
-                , self.number_decimals)
+        # one particle form of update_velocity_batch(), with the same random draws
+        r = self.rng.random((3, np.shape(self.V)[1]))
+        leader = self.Gb
+        if self.neighbors is not None:
+            leader = self.social_leaders(np.array([particle]))[0]
+        if self.multi_objective and (len(self.archive) > 0):
+            leader = self.archive.select_leaders(self.rng, 1)[0]
+        self.V[particle] = \
+            np.round(self.weights[0][0]*r[0]*self.V[particle] \
+            + self.weights[0][1]*r[1]*(self.Pb[particle]-self.M[particle]) \
+            + self.weights[0][2]*r[2]*(leader-self.M[particle])
+            , self.number_decimals)
+
+    # TOPOLOGIES
+    # each row of self.neighbors lists a particle and its neighbors. Nb/F_Nb hold
+    # the best personal best of each neighborhood, and are refreshed only for the
+    # neighborhoods that contain a particle whose personal best changed
+
+    def neighbor_index(self, topology, num_particles, k):
+        # (N, K) integer array of neighborhoods, each row starting with the particle itself.
+        # ring: the particles before and after. von_neumann: left, right, up and down on a
+        # wrapped grid of ceil(sqrt(N)) columns. random: k other particles drawn once
+        particles = np.arange(0, num_particles)
+        if topology == "ring":
+            offsets = np.array([0, -1, 1])
+        elif topology == "von_neumann":
+            cols = int(np.ceil(np.sqrt(num_particles)))
+            offsets = np.array([0, -1, 1, -cols, cols])
+        else:
+            k = min(k, num_particles - 1)
+            others = self.rng.integers(0, num_particles - 1, (num_particles, k))
+            others = others + (others >= particles[:, np.newaxis]) # skip the particle itself
+            for i in np.flatnonzero([len(np.unique(row)) < k for row in others]):
+                pool = np.delete(particles, i)
+                others[i] = self.rng.choice(pool, k, replace=False)
+            return np.hstack((particles[:, np.newaxis], others))
+        return (particles[:, np.newaxis] + offsets) % num_particles
+
+    def set_neighbors(self, neighbors):
+        # also builds the reverse index, and Nb/F_Nb from the current personal bests
+        self.neighbors = np.array(neighbors, dtype=int)
+        flat = self.neighbors.ravel()
+        rows = np.repeat(np.arange(0, np.shape(self.neighbors)[0]), np.shape(self.neighbors)[1])
+        self.informs = rows[np.argsort(flat, kind='stable')]
+        self.informs_ptr = np.concatenate(([0], np.cumsum(np.bincount(flat, minlength=np.shape(self.neighbors)[0]))))
+        self.Nb = 1*self.Pb
+        self.F_Nb = 1*self.F_Pb
+        self.update_neighborhoods(np.arange(0, np.shape(self.neighbors)[0]))
+
+    def update_neighborhoods(self, particles):
+        # particles: index array of particles whose personal best changed
+        if (self.neighbors is None) or (len(particles) == 0):
+            return
+        if len(particles) == 1:
+            p = particles[0]
+            affected = self.informs[self.informs_ptr[p]:self.informs_ptr[p + 1]]
+        else:
+            affected = np.flatnonzero(np.any(np.isin(self.neighbors, particles), axis=1))
+        candidates = self.neighbors[affected]
+        norms = np.linalg.norm(self.F_Pb[candidates], axis=2)
+        best = candidates[np.arange(0, len(affected)), np.argmin(norms, axis=1)]
+        self.Nb[affected] = self.Pb[best]
+        self.F_Nb[affected] = self.F_Pb[best]
+
+    def social_leaders(self, particles):
+        # leader of each particle for the social term: Gb, or with a local topology the
+        # neighborhood best, until topology_switch*maxit evaluations. A neighborhood
+        # with no successful evaluation yet follows Gb
+        leaders = np.reshape(self.Gb, (1, -1))
+        if self.neighbors is None:
+            return leaders
+        if (self.topology_switch != None) and (self.iter >= self.topology_switch*self.maxit):
+            return leaders
+        unset = np.any(self.F_Nb[particles] >= sys.maxsize, axis=1)
+        return np.where(unset[:, np.newaxis], leaders, self.Nb[particles])
             
+    # BOUNDS
+    # the bound functions take one particle index, as in the sequential loop.
+    # The _batch versions further down take an index array of particles, find
+    # violations as (particles, dimensions) masks, and apply each rule per dimension.
+    # Both apply the rules to every out of bounds dimension
+
+    def constraint_mask(self, X):
+        # constraint functions flagged with 'vectorized = True' take an (N, D) array
+        # and return a boolean array of N. Any other constraint function is called once per row
+        num_rows = np.shape(X)[0]
+        if getattr(self.constr_func, 'vectorized', False) == True:
+            feasible = np.array(self.constr_func(X), dtype=bool).reshape(-1)
+            return np.broadcast_to(feasible, (num_rows,)).copy()
+        return np.array([bool(self.constr_func(X[i])) for i in range(0, num_rows)], dtype=bool)
+
     def check_bounds(self, particle):
+        # returns the last out of bounds dimension + 1, or 0 if the particle is in bounds
         update = 0
         for i in range(0,(np.shape(self.M)[1])):
             if (self.lbound[i] > self.M[particle,i]) \
@@ -286,48 +802,59 @@ class swarm:
                 update = i+1        
         return update
 
+    def check_constraints(self, particle):
+        # one particle form of constraint_mask(). A plain constraint function is
+        # called directly unless the swarm is profiled, so that every check is
+        # counted by the instrumented constraint_mask(), as in call_objective()
+        if (self.profiler == None) and (getattr(self.constr_func, 'vectorized', False) != True):
+            return bool(self.constr_func(self.M[particle]))
+        return bool(self.constraint_mask(self.M[[particle]])[0])
+
+    def bound_violation(self, particle):
+        # one particle form of bound_violations(). Returns check_bounds() and the
+        # constraint check, and remembers a position that passes both
+        update = self.check_bounds(particle)
+        constr = self.check_constraints(particle)
+        if constr and (update == 0):
+            self.Mfeasible[particle] = self.M[particle]
+            self.has_feasible[particle] = True
+            self.Penalized[particle] = False
+        return update, constr
+
+    def out_of_bounds_mask(self, particle):
+        return (self.M[particle] < self.lbound) | (self.M[particle] > self.ubound)
+
     def random_bound(self, particle):
         # If particle is out of bounds, bring the particle back in bounds
         # The first condition checks if constraints are met, 
         # and the second determines if the values are to large (positive or negative)
         # and may cause a buffer overflow with large exponents (a bug that was found experimentally)
-        update = self.check_bounds(particle) or not self.constr_func(self.M[particle])
-        if update > 0:
-            while (self.check_bounds(particle) > 0) or (self.constr_func(self.M[particle]) == False):
-                variation = self.ubound - self.lbound
-                self.M[particle] = np.round(
-                    np.squeeze(
-                        self.rng.random() *
-                        np.multiply(np.ones((1, np.shape(self.M)[1])), variation) +
-                        self.lbound
-                    ), self.number_decimals)
-                
-            
+        update, constr = self.bound_violation(particle)
+        if (update > 0) or not constr:
+            self.resample_positions(np.array([particle]))
+
     def reflecting_bound(self, particle):        
-        update = self.check_bounds(particle)
-        constr = self.constr_func(self.M[particle])
+        update, constr = self.bound_violation(particle)
         if (update > 0) and constr:
-            self.M[particle] = 1*self.Mlast
-            NewV = np.multiply(-1,self.V[update-1,particle])
-            self.V[update-1,particle] = NewV
+            out_of_bounds = self.out_of_bounds_mask(particle)
+            self.M[particle] = 1*self.Mlast[particle]
+            self.V[particle, out_of_bounds] = -1*self.V[particle, out_of_bounds]
         if not constr:
-            self.random_bound(particle)
+            self.resample_positions(np.array([particle]))
 
     def absorbing_bound(self, particle):
-        update = self.check_bounds(particle)
-        constr = self.constr_func(self.M[particle])
+        update, constr = self.bound_violation(particle)
         if (update > 0) and constr:
-            self.M[particle] = 1*self.Mlast
-            self.V[particle,update-1] = 0
+            out_of_bounds = self.out_of_bounds_mask(particle)
+            self.M[particle] = 1*self.Mlast[particle]
+            self.V[particle, out_of_bounds] = 0
         if not constr:
-            self.random_bound(particle)
+            self.resample_positions(np.array([particle]))
 
     def invisible_bound(self, particle):
-        update = self.check_bounds(particle) or not self.constr_func(self.M[particle])
-        if update > 0:
+        update, constr = self.bound_violation(particle)
+        if (update > 0) or not constr:
             self.Active[particle] = 0  
-        else:
-            pass            
 
     def handle_bounds(self, particle):
         if self.boundary == 1:
@@ -341,18 +868,88 @@ class swarm:
         else:
             self.debug_message_printout("Error: No boundary is set!")
 
+    # constraint repair, shared by the one particle and the batch bound functions
+
+    def resample_positions(self, particles):
+        # draw new positions for all listed particles at once, and redraw for
+        # the ones that still violate the bounds or constraints.
+        # Capped at repair_attempts rounds, the rest go to repair_fallback()
+        if len(particles) == 0:
+            return
+        self.repair_stats['calls'] = self.repair_stats['calls'] + len(particles)
+        attempted = np.array(self.M[particles])
+        variation = self.ubound - self.lbound
+        attempts = 0
+        while (len(particles) > 0) and (attempts < self.repair_attempts):
+            self.M[particles] = np.round(
+                self.rng.random((len(particles), np.shape(self.M)[1])) * variation + self.lbound,
+                self.number_decimals)
+            self.repair_stats['draws'] = self.repair_stats['draws'] + len(particles)
+            attempts = attempts + 1
+            out_of_bounds, feasible = self.bound_violations(particles)
+            failed = np.any(out_of_bounds, axis=1) | np.logical_not(feasible)
+            particles = particles[failed]
+            attempted = attempted[failed]
+
+        if len(particles) > 0:
+            self.repair_stats['fallbacks'] = self.repair_stats['fallbacks'] + len(particles)
+            self.repair_fallback(particles, attempted)
+
+    def repair_fallback(self, particles, attempted):
+        # 'project': bisect on the segment from the last feasible position to the
+        # position the particle tried to move to (clipped to the bounds), keeping the
+        # feasible point closest to the attempted one.
+        # 'penalty', or no feasible position known: clip to the bounds and penalize
+        # the particle until it moves somewhere feasible
+        attempted = np.clip(attempted, self.lbound, self.ubound)
+        if self.repair_mode == "project":
+            known = self.has_feasible[particles]
+            projected = particles[known]
+            lo = self.Mfeasible[projected]
+            hi = attempted[known]
+            for i in range(0, 16):
+                mid = np.round((lo + hi)/2, self.number_decimals)
+                ok = self.constraint_mask(mid)[:, np.newaxis]
+                lo = np.where(ok, mid, lo)
+                hi = np.where(ok, hi, mid)
+            self.M[projected] = lo
+            self.repair_stats['projected'] = self.repair_stats['projected'] + len(projected)
+            particles = particles[np.logical_not(known)]
+            attempted = attempted[np.logical_not(known)]
+
+        self.M[particles] = np.round(attempted, self.number_decimals)
+        self.Penalized[particles] = True
+        self.repair_stats['penalized'] = self.repair_stats['penalized'] + len(particles)
+
     def check_global_local(self, Flist, particle):
 
         if np.linalg.norm(Flist) < np.linalg.norm(self.F_Gb):
             self.F_Gb = np.array([Flist])
             self.Gb = np.array(self.M[particle])
+            if best_event in self.listening:
+                self.emit(best_event(self.iter, particle, np.array(self.Gb), np.array(self.F_Gb)))
         
-        if np.linalg.norm(Flist) < np.linalg.norm(self.F_Pb[particle]):
+        if self.multi_objective:
+            Flist = np.reshape(Flist, -1)
+            self.archive_update(np.array([particle]), np.reshape(Flist, (1, -1)), np.reshape(self.Fvals, (1, -1)))
+            if not dominates(self.F_Pb[particle], Flist):
+                self.F_Pb[particle] = Flist
+                self.Pb[particle] = self.M[particle]
+                self.update_neighborhoods(np.array([particle]))
+
+        elif np.linalg.norm(Flist) < np.linalg.norm(self.F_Pb[particle]):
             self.F_Pb[particle] = np.squeeze(Flist)
             self.Pb[particle] = self.M[particle]
+            self.update_neighborhoods(np.array([particle]))
+
+    def archive_update(self, particles, Flist, Fvals):
+        # rows with the worst-case fitness (failed or penalized calls) are not archived
+        valid = np.all(Flist < sys.maxsize, axis=1)
+        if np.any(valid):
+            self.archive.add(self.M[particles[valid]], Flist[valid], Fvals[valid])
 
     def update_point(self,particle):
-        self.Mlast = 1*self.M[particle]
+        self.Mlast[particle] = 1*self.M[particle]
 
         # For some input values, self.delta_t causes buffer over- or underflows
         # Check if there is a risk, and use the max/min cap if needed
@@ -363,7 +960,33 @@ class swarm:
         self.M[particle] = np.round(self.M[particle] + self.delta_t*self.V[particle], self.number_decimals)
 
     def update_delta_t(self):
-        self.delta_t = self.absolute_mean_deviation_of_particles()/(self.T_MOD*self.InitDeviation)
+        self.deviation = self.absolute_mean_deviation_of_particles()
+        self.delta_t = self.deviation/(self.T_MOD*self.InitDeviation)
+
+    def end_of_sweep(self):
+        # called once every particle has been moved
+        self.update_delta_t()
+        self.check_sweep_rules()
+        if sweep_event in self.listening:
+            self.emit(sweep_event(self.iter, self.delta_t, self.deviation))
+
+    def check_sweep_rules(self):
+        # stagnation: norm(F_Gb) has not improved by more than stagnation_tol
+        # (relative) for stagnation_sweeps sweeps.
+        # diversity: the mean absolute deviation of the particles collapsed
+        # below min_deviation times its initial value
+        if self.stagnation_sweeps != None:
+            best = np.linalg.norm(self.F_Gb)
+            # stall_best starts at inf, and inf - inf is nan. The first sweep sets it
+            if np.isinf(self.stall_best) or (best < self.stall_best - self.stagnation_tol*abs(self.stall_best)):
+                self.stall_best = best
+                self.stall_sweeps = 0
+            else:
+                self.stall_sweeps = self.stall_sweeps + 1
+                if self.stall_sweeps >= self.stagnation_sweeps:
+                    self.sweep_stop = "stagnation"
+        if (self.min_deviation != None) and (self.deviation < self.min_deviation*self.InitDeviation):
+            self.sweep_stop = "diversity"
 
     def converged(self):
         convergence = np.linalg.norm(self.F_Gb) < self.E_TOL
@@ -374,10 +997,31 @@ class swarm:
         return max_iter
     
     def complete(self):
-        done = self.converged() or self.maxed()
+        # the rule that fired is kept in self.stop_reason, see get_stop_reason()
+        if self.converged():
+            self.stop_reason = "converged"
+        elif self.maxed():
+            self.stop_reason = "maxit"
+        elif self.sweep_stop != None:
+            self.stop_reason = self.sweep_stop
+        elif (self.max_evals != None) and (self.evaluations >= self.max_evals):
+            self.stop_reason = "max_evals"
+        elif (self.max_time != None) and (time.monotonic() - self.start_time >= self.max_time):
+            self.stop_reason = "max_time"
+        else:
+            self.stop_reason = None
+        done = self.stop_reason != None
         return done
+
+    def get_stop_reason(self):
+        # 'converged', 'maxit', 'stagnation', 'diversity', 'max_evals', 'max_time',
+        # or None while the run is not complete
+        self.complete()
+        return self.stop_reason
     
     def step(self, suppress_output):
+        if self.mode == "batch":
+            return self.step_swarm(suppress_output)
         if not suppress_output:
             msg = "\n-----------------------------\n" + \
                 "STEP #" + str(self.iter) +"\n" + \
@@ -391,7 +1035,7 @@ class swarm:
                 "Delta T\n" + \
                 str(self.delta_t) +"\n" + \
                 "Absolute mean deviation\n" + \
-                str(self.absolute_mean_deviation_of_particles()) +"\n" + \
+                str(self.deviation) +"\n" + \
                 "-----------------------------"
             self.debug_message_printout(msg)
             
@@ -402,10 +1046,140 @@ class swarm:
                 self.update_velocity(self.current_particle)
                 self.update_point(self.current_particle)
                 self.handle_bounds(self.current_particle)
+                if step_event in self.listening:
+                    self.emit_step(np.array([self.current_particle]))
             self.current_particle = self.current_particle + 1
             if self.current_particle == self.number_of_particles:
                 self.current_particle = 0
-                self.update_delta_t()
+                self.end_of_sweep()
+            if complete_event in self.listening:
+                self.emit_complete()
+            if self.complete() and not suppress_output:
+                msg =  "\nPoints: \n" + str(self.Gb) + "\n" + \
+                    "Iterations: \n" + str(self.iter) + "\n" + \
+                    "Flist: \n" + str(self.F_Gb) + "\n" + \
+                    "Norm Flist: \n" + str(np.linalg.norm(self.F_Gb)) + "\n"
+                self.debug_message_printout(msg)
+
+
+    # BATCH MODE
+    # the functions below mirror the per-particle functions above, but operate
+    # on an index array of particles so a whole sweep is a handful of array ops
+
+    def check_global_local_batch(self, Flist, particles):
+        norms = np.linalg.norm(Flist[particles], axis=1)
+
+        best = np.argmin(norms)
+        if norms[best] < np.linalg.norm(self.F_Gb):
+            self.F_Gb = np.array([Flist[particles[best]]])
+            self.Gb = np.array(self.M[particles[best]])
+            if best_event in self.listening:
+                self.emit(best_event(self.iter, particles[best], np.array(self.Gb), np.array(self.F_Gb)))
+
+        if self.multi_objective:
+            self.archive_update(particles, Flist[particles], self.Fvals[particles])
+            improved = np.logical_not(dominates(self.F_Pb[particles], Flist[particles]))
+        else:
+            improved = norms < np.linalg.norm(self.F_Pb[particles], axis=1)
+        self.F_Pb[particles[improved]] = Flist[particles[improved]]
+        self.Pb[particles[improved]] = self.M[particles[improved]]
+        self.update_neighborhoods(particles[improved])
+
+    def update_velocity_batch(self, particles):
+        # inertia, cognitive and social random coefficients for every particle 
+        # and dimension come from a single generator call
+        r = self.rng.random((3, len(particles), np.shape(self.V)[1]))
+        M = self.M[particles]
+        leaders = self.social_leaders(particles)
+        if self.multi_objective and (len(self.archive) > 0):
+            leaders = self.archive.select_leaders(self.rng, len(particles))
+        self.V[particles] = \
+            np.round(self.weights[0][0]*r[0]*self.V[particles] \
+            + self.weights[0][1]*r[1]*(self.Pb[particles]-M) \
+            + self.weights[0][2]*r[2]*(leaders-M)
+            , self.number_decimals)
+
+    def update_point_batch(self, particles):
+        self.Mlast[particles] = 1*self.M[particles]
+        self.delta_t = np.round(self.delta_t, self.number_decimals) 
+        self.M[particles] = np.round(self.M[particles] + self.delta_t*self.V[particles], self.number_decimals)
+
+    def bound_violations(self, particles):
+        # returns the out of bounds mask (particles, dimensions) and the constraint mask (particles).
+        # particles that pass both are remembered as the last feasible position
+        M = self.M[particles]
+        out_of_bounds = (M < self.lbound) | (M > self.ubound)
+        feasible = self.constraint_mask(M)
+        valid = particles[feasible & np.logical_not(np.any(out_of_bounds, axis=1))]
+        self.Mfeasible[valid] = self.M[valid]
+        self.has_feasible[valid] = True
+        self.Penalized[valid] = False
+        return out_of_bounds, feasible
+
+    def random_bound_batch(self, particles):
+        out_of_bounds, feasible = self.bound_violations(particles)
+        self.resample_positions(particles[np.any(out_of_bounds, axis=1) | np.logical_not(feasible)])
+
+    def reflecting_bound_batch(self, particles):        
+        out_of_bounds, feasible = self.bound_violations(particles)
+        hit = np.any(out_of_bounds, axis=1) & feasible
+        hit_particles = particles[hit]
+        self.M[hit_particles] = 1*self.Mlast[hit_particles]
+        self.V[hit_particles] = np.where(out_of_bounds[hit], -1*self.V[hit_particles], self.V[hit_particles])
+        self.resample_positions(particles[np.logical_not(feasible)])
+
+    def absorbing_bound_batch(self, particles):
+        out_of_bounds, feasible = self.bound_violations(particles)
+        hit = np.any(out_of_bounds, axis=1) & feasible
+        hit_particles = particles[hit]
+        self.M[hit_particles] = 1*self.Mlast[hit_particles]
+        self.V[hit_particles] = np.where(out_of_bounds[hit], 0, self.V[hit_particles])
+        self.resample_positions(particles[np.logical_not(feasible)])
+
+    def invisible_bound_batch(self, particles):
+        out_of_bounds, feasible = self.bound_violations(particles)
+        self.Active[particles[np.any(out_of_bounds, axis=1) | np.logical_not(feasible)]] = 0
+
+    def handle_bounds_batch(self, particles):
+        if self.boundary == 1:
+            self.random_bound_batch(particles)
+        elif self.boundary == 2:
+            self.reflecting_bound_batch(particles)
+        elif self.boundary == 3:
+            self.absorbing_bound_batch(particles)
+        elif self.boundary == 4:
+            self.invisible_bound_batch(particles)
+        else:
+            self.debug_message_printout("Error: No boundary is set!")
+
+    def step_swarm(self, suppress_output):
+        if not suppress_output:
+            msg = "\n-----------------------------\n" + \
+                "STEP #" + str(self.iter) +"\n" + \
+                "-----------------------------\n" + \
+                "Active Particles:\n" + \
+                str(int(np.sum(self.Active))) +"\n" + \
+                "Delta T\n" + \
+                str(self.delta_t) +"\n" + \
+                "Absolute mean deviation\n" + \
+                str(self.deviation) +"\n" + \
+                "-----------------------------"
+            self.debug_message_printout(msg)
+
+        if self.allow_update:
+            evaluated = np.flatnonzero(self.evaluated & (self.Active > 0))
+            if len(evaluated) > 0:
+                self.check_global_local_batch(self.Flist, evaluated)
+            particles = np.flatnonzero(self.Active)
+            self.update_velocity_batch(particles)
+            self.update_point_batch(particles)
+            self.handle_bounds_batch(particles)
+            if step_event in self.listening:
+                self.emit_step(particles)
+            self.end_of_sweep()
+            self.allow_update = 0
+            if complete_event in self.listening:
+                self.emit_complete()
             if self.complete() and not suppress_output:
                 msg =  "\nPoints: \n" + str(self.Gb) + "\n" + \
                     "Iterations: \n" + str(self.iter) + "\n" + \
@@ -414,6 +1188,453 @@ class swarm:
                 self.debug_message_printout(msg)
 
 
+    # PARALLEL EVALUATION
+
+    def evaluate_parallel(self, executor, particles):
+        # submit one objective call per particle to the executor and collect the 
+        # results as they finish. Results are returned in the order of 'particles'
+        Fvals = np.zeros((len(particles), self.output_size))
+        noErrors = np.zeros(len(particles), dtype=bool)
+        vectorized = getattr(self.obj_func, 'vectorized', False) == True
+        futures = {}
+        for i in range(0, len(particles)):
+            if self.cache != None:
+                cached = self.cache.lookup(self.M[particles[i]])
+                if cached is not None:
+                    Fvals[i] = cached
+                    noErrors[i] = True
+                    continue
+            if vectorized:
+                X = self.M[[particles[i]]].copy()
+            else:
+                X = self.M[particles[i]].copy()
+            futures[executor.submit(self.obj_func, X, self.output_size)] = i
+        self.evaluations = self.evaluations + len(futures)
+
+        for future in as_completed(futures):
+            i = futures[future]
+            try:
+                newFVals, noError = future.result()
+            except Exception as e:
+                self.debug_message_printout("ERROR: objective call for particle " + \
+                                            str(particles[i]) + " failed. " + str(e))
+                continue
+            if np.all(noError) == True:
+                Fvals[i] = np.reshape(newFVals, -1)
+                noErrors[i] = True
+                if self.cache != None:
+                    self.cache.store(self.M[particles[i]], Fvals[i])
+        if self.useSurrogateModel:
+            self.surrogateOptimizer.add(self.M[particles[noErrors]], Fvals[noErrors])
+        return Fvals, noErrors
+
+    def run_parallel(self, executor=None, suppress_output=True):
+        # run the optimizer to completion, evaluating the active particles of each
+        # sweep concurrently on 'executor' (e.g. concurrent.futures.ProcessPoolExecutor).
+        # Results are applied in particle order once the sweep is collected, so the
+        # outcome does not depend on the number of workers.
+        # obj_func must be picklable (a module level function) for process pools.
+        if executor == None:
+            with ProcessPoolExecutor() as executor:
+                return self.run_parallel(executor, suppress_output)
+
+        if self.allow_update: # finish a step started by call_objective()
+            self.step(suppress_output)
+
+        while not self.complete():
+            if not np.any(self.Active):
+                self.debug_message_printout("ERROR: no active particles left to evaluate")
+                break
+
+            budget = max(int(self.maxit - self.iter), 0)
+            if self.mode == "batch":
+                candidates = np.flatnonzero(self.Active)[:budget]
+                particles = candidates[np.logical_not(self.Penalized[candidates])]
+                if self.useSurrogateModel:
+                    particles = self.surrogate_screen(particles)
+                Fvals, noErrors = self.evaluate_parallel(executor, particles)
+                self.set_batch_evaluations(particles, Fvals, noErrors, True,
+                                           penalized=candidates[self.Penalized[candidates]])
+                if self.useSurrogateModel: # skipped particles still move
+                    self.allow_update = 1
+                self.step_swarm(suppress_output)
+                continue
+
+            # one sweep, starting at the current particle
+            sweep = np.arange(self.current_particle, self.number_of_particles)
+            candidates = sweep[self.Active[sweep] > 0][:budget]
+            particles = candidates[np.logical_not(self.Penalized[candidates])]
+            if self.useSurrogateModel: # skipped particles are handled as failed calls below
+                particles = self.surrogate_screen(particles)
+            Fvals, noErrors = self.evaluate_parallel(executor, particles)
+            results = dict(zip(particles, range(0, len(particles))))
+            penalized = set(candidates[self.Penalized[candidates]])
+            for particle in sweep:
+                if self.complete():
+                    break
+                i = results.get(particle)
+                if particle in penalized:
+                    self.call_penalty(True)
+                elif (i != None) and (noErrors[i] == True):
+                    self.Fvals = np.array(Fvals[i]).reshape(-1, 1)
+                    self.Flist = self.objective_function_evaluation(self.Fvals, self.targets)
+                    self.iter = self.iter + 1
+                    self.record_evaluations([particle], self.Fvals, self.Flist)
+                else: # a failed call can not improve the bests, but the particle still moves
+                    self.Flist = sys.maxsize*np.ones((self.output_size, 1))
+                self.allow_update = 1
+                self.auto_checkpoint()
+                self.step(suppress_output)
+
+        self.allow_update = 0
+
+
+    # ASK/TELL
+    # asynchronous interface for controllers that run the objective function
+    # themselves (e.g. a job scheduler). Results can come back in any order.
+    # Each result updates the bests and moves its particle right away, so fast
+    # evaluations are not held up by the slowest particle of a sweep.
+    # This replaces the step()/call_objective() loop, do not mix the two.
+
+    def ask(self, k=1):
+        # returns up to k (ticket, position) pairs for particles that are
+        # not waiting on a result. Cache hits are answered internally.
+        candidates = []
+        queued = len(self.ask_queue)
+        while (len(candidates) < k) and (queued > 0) \
+            and (self.maxit - self.iter - len(self.tickets) > 0) and not self.complete():
+            queued = queued - 1
+            particle = self.ask_queue.popleft()
+            if not self.Active[particle]:
+                continue
+            ticket = self.next_ticket
+            self.next_ticket = self.next_ticket + 1
+            self.tickets[ticket] = particle
+            if self.Penalized[particle]:
+                self.tell(ticket, None, True)
+                continue
+            if self.cache != None:
+                cached = self.cache.lookup(self.M[particle])
+                if cached is not None:
+                    self.tell(ticket, cached, True)
+                    continue
+            candidates.append((ticket, np.array(self.M[particle])))
+            self.evaluations = self.evaluations + 1
+        return candidates
+
+    def tell(self, ticket, Fvals, ok=True):
+        # Fvals are the raw objective function outputs for the ticket's position.
+        # ok=False reports a failed objective call; the particle moves on without
+        # updating the bests. Returns False for unknown or already answered tickets.
+        particle = self.tickets.pop(ticket, None)
+        if particle == None:
+            self.debug_message_printout("ERROR: unknown ask/tell ticket " + str(ticket))
+            return False
+
+        if self.Penalized[particle]:
+            # left infeasible by the constraint repair, see call_penalty()
+            self.iter = self.iter + 1
+            self.record_evaluations([particle], np.zeros(self.output_size),
+                                    sys.maxsize*np.ones(self.output_size))
+        elif ok == True:
+            self.Fvals = np.array(Fvals).reshape(-1, 1)
+            if self.cache != None:
+                self.cache.store(self.M[particle], self.Fvals)
+            self.Flist = self.objective_function_evaluation(self.Fvals, self.targets)
+            self.iter = self.iter + 1
+            self.record_evaluations([particle], self.Fvals, self.Flist)
+            self.check_global_local(self.Flist, particle)
+
+        if self.Active[particle]:
+            self.update_velocity(particle)
+            self.update_point(particle)
+            self.handle_bounds(particle)
+            if step_event in self.listening:
+                self.emit_step(np.array([particle]))
+        self.ask_queue.append(particle)
+
+        self.tell_count = self.tell_count + 1
+        if self.tell_count >= max(int(np.sum(self.Active)), 1):
+            self.tell_count = 0
+            self.end_of_sweep()
+        if complete_event in self.listening:
+            self.emit_complete()
+        self.auto_checkpoint()
+        return True
+
+
+    # MIGRATION
+    # exchange of solutions between independent swarms, see island_model.py
+
+    def get_emigrants(self, n):
+        # up to n of the best solutions found, as (X, Flist, Fvals). Personal bests
+        # ordered by norm, or in multi-objective mode the least crowded archive
+        # members. Fvals is None in single objective mode
+        if self.multi_objective and (len(self.archive) > 0):
+            order = np.argsort(-self.archive.crowding, kind='stable')[:n]
+            return self.archive.X[order], self.archive.Flist[order], self.archive.Fvals[order]
+        norms = np.linalg.norm(self.F_Pb, axis=1)
+        order = np.argsort(norms, kind='stable')
+        order = order[norms[order] < sys.maxsize][:n] # skip particles never evaluated
+        return self.Pb[order], self.F_Pb[order], None
+
+    def inject_migrants(self, X, Flist, Fvals=None, replace=True):
+        # take in solutions evaluated by another swarm. Gb is updated when a migrant
+        # is better, and in multi-objective mode migrants with Fvals enter the archive.
+        # With replace, the particles with the worst personal bests move to the
+        # migrant positions and adopt them as personal best. Particles waiting on
+        # a result are left alone. Returns the number of particles replaced
+        X = np.atleast_2d(np.array(X, dtype=float))
+        Flist = np.reshape(np.array(Flist, dtype=float), (np.shape(X)[0], self.output_size))
+        if np.shape(X)[0] == 0:
+            return 0
+
+        norms = np.linalg.norm(Flist, axis=1)
+        best = np.argmin(norms)
+        if norms[best] < np.linalg.norm(self.F_Gb):
+            self.F_Gb = np.array([Flist[best]])
+            self.Gb = np.array(X[best])
+            if best_event in self.listening:
+                self.emit(best_event(self.iter, -1, np.array(self.Gb), np.array(self.F_Gb)))
+        if self.multi_objective and (Fvals is not None):
+            self.archive.add(X, Flist, np.reshape(Fvals, np.shape(Flist)))
+        if not replace:
+            return 0
+
+        busy = np.zeros(self.number_of_particles, dtype=bool)
+        if (self.mode == "sequential") and self.allow_update:
+            busy[self.current_particle] = True # its result is not ingested yet
+        busy[list(self.tickets.values())] = True
+        free = np.flatnonzero(np.logical_not(busy) & (self.Active > 0))
+        worst = free[np.argsort(-np.linalg.norm(self.F_Pb[free], axis=1), kind='stable')]
+        n = min(len(worst), np.shape(X)[0])
+        particles = worst[:n]
+        self.M[particles] = X[:n]
+        self.Mlast[particles] = X[:n]
+        self.Pb[particles] = X[:n]
+        self.F_Pb[particles] = Flist[:n]
+        self.V[particles] = 0
+        self.Mfeasible[particles] = X[:n]
+        self.has_feasible[particles] = True
+        self.Penalized[particles] = False
+        self.evaluated[particles] = False # batch mode, the pending result is for the old position
+        self.surrogate_skips[particles] = 0
+        self.update_neighborhoods(particles)
+        return n
+
+
+    # EVENTS
+    # structured records for monitoring, see swarm_events.py. Nothing is built
+    # or formatted unless a subscriber wants that record type
+
+    def subscribe(self, callback, events=None):
+        # callback(record) is called for every record of the listed types.
+        # events: list of record types, e.g. [best_event, complete_event]. None subscribes to all
+        if events == None:
+            events = [evaluation_event, step_event, best_event, sweep_event, complete_event]
+        self.subscribers.append((callback, tuple(events)))
+        self.listening.update(events)
+
+    def unsubscribe(self, callback):
+        self.subscribers = [(c, e) for (c, e) in self.subscribers if c != callback]
+        self.listening = set()
+        for c, events in self.subscribers:
+            self.listening.update(events)
+
+    def emit(self, record):
+        for callback, events in self.subscribers:
+            if isinstance(record, events):
+                callback(record)
+
+    def emit_step(self, particles):
+        self.emit(step_event(self.iter, particles, self.M[particles], self.V[particles], self.delta_t))
+
+    def emit_complete(self):
+        if (not self.completion_emitted) and self.complete():
+            self.completion_emitted = True
+            self.emit(complete_event(self.iter, np.array(self.Gb), np.array(self.F_Gb),
+                                     bool(self.converged()), self.stop_reason))
+
+
+    # CHECKPOINTS
+    # binary snapshot of the full optimizer state, written without pandas.
+    # A swarm built with the same constructor arguments and loaded from a 
+    # checkpoint continues exactly where the saved one stopped, including the 
+    # random number stream. The objective and constraint functions, parent, 
+    # cache, recorder, profiler, and subscribers are runtime objects and are not saved.
+
+    def auto_checkpoint(self):
+        # called after each ingested evaluation. Only two comparisons when
+        # the save is not due
+        if self.checkpoint_path == None:
+            return
+        due = (self.checkpoint_every != None) and \
+            (self.iter - self.checkpoint_iter >= self.checkpoint_every)
+        if (not due) and (self.checkpoint_seconds != None):
+            due = time.monotonic() - self.checkpoint_time >= self.checkpoint_seconds
+        if due:
+            self.save_checkpoint(self.checkpoint_path)
+
+    def save_checkpoint(self, path):
+        # writes to a temporary file in the same directory, then renames it over
+        # 'path', so a crash mid-write never leaves a partial checkpoint behind.
+        # Outstanding ask/tell tickets are saved as queued particles and are
+        # handed out again after loading.
+        rng_state = self.rng.bit_generator.state
+        obj_threshold = self.obj_threshold
+        if obj_threshold is None:
+            obj_threshold = np.zeros((0, 1))
+        state = {
+            'checkpoint_version': 1,
+            'lbound': self.lbound,
+            'ubound': self.ubound,
+            'targets': self.targets,
+            'evaluate_threshold': self.evaluate_threshold,
+            'obj_threshold': obj_threshold,
+            'output_size': self.output_size,
+            'maxit': self.maxit,
+            'E_TOL': self.E_TOL,
+            'iter': self.iter,
+            'current_particle': self.current_particle,
+            'allow_update': self.allow_update,
+            'mode': self.mode,
+            'boundary': self.boundary,
+            'number_decimals': self.number_decimals,
+            'T_MOD': self.T_MOD,
+            'InitDeviation': self.InitDeviation,
+            'deviation': self.deviation,
+            'delta_t': self.delta_t,
+            'M': self.M,
+            'V': self.V,
+            'Active': self.Active,
+            'Gb': self.Gb,
+            'F_Gb': self.F_Gb,
+            'Pb': self.Pb,
+            'F_Pb': self.F_Pb,
+            'weights': self.weights,
+            'Flist': np.array(self.Flist, dtype=float),
+            'Fvals': np.array(self.Fvals, dtype=float),
+            'vlimit': self.vlimit,
+            'Mlast': self.Mlast,
+            'evaluated': self.evaluated,
+            'Mfeasible': self.Mfeasible,
+            'has_feasible': self.has_feasible,
+            'Penalized': self.Penalized,
+            'repair_stats': np.array([self.repair_stats[k] for k in sorted(self.repair_stats)]),
+            'ask_queue': np.array(list(self.tickets.values()) + list(self.ask_queue), dtype=int),
+            'next_ticket': self.next_ticket,
+            'tell_count': self.tell_count,
+            'evaluations': self.evaluations,
+            'elapsed': time.monotonic() - self.start_time,
+            'stall_best': self.stall_best,
+            'stall_sweeps': self.stall_sweeps,
+            'sweep_stop': "" if self.sweep_stop == None else self.sweep_stop,
+            'surrogate_skips': self.surrogate_skips,
+            'surrogate_stats': np.array([self.surrogate_stats[k] for k in sorted(self.surrogate_stats)]),
+            'rng_key': rng_state['state']['key'],
+            'rng_pos': rng_state['state']['pos'],
+            }
+        if self.useSurrogateModel and (len(self.surrogateOptimizer) > 0):
+            state['surrogate_X'] = np.array([p[0] for p in self.surrogateOptimizer.points.values()])
+            state['surrogate_Fvals'] = np.array([p[1] for p in self.surrogateOptimizer.points.values()])
+        if self.neighbors is not None:
+            state['topology'] = self.topology
+            state['neighbors'] = self.neighbors
+        if self.multi_objective and (len(self.archive) > 0):
+            state['archive_X'] = self.archive.X
+            state['archive_Flist'] = self.archive.Flist
+            state['archive_Fvals'] = self.archive.Fvals
+
+        tmp_path = str(path) + ".tmp"
+        with open(tmp_path, 'wb') as f:
+            np.savez(f, **state)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+
+        if self.cache != None: # keep the persistent cache in step with the checkpoint
+            self.cache.flush()
+        if self.recorder != None:
+            self.recorder.flush()
+        self.checkpoint_iter = self.iter
+        self.checkpoint_time = time.monotonic()
+
+    def load_checkpoint(self, path):
+        # restores the state written by save_checkpoint()
+        with np.load(path, allow_pickle=False) as state:
+            self.lbound = state['lbound']
+            self.ubound = state['ubound']
+            self.targets = state['targets']
+            self.evaluate_threshold = bool(state['evaluate_threshold'])
+            self.obj_threshold = state['obj_threshold']
+            if np.size(self.obj_threshold) == 0:
+                self.obj_threshold = None
+            self.output_size = int(state['output_size'])
+            self.maxit = int(state['maxit'])
+            self.E_TOL = float(state['E_TOL'])
+            self.iter = int(state['iter'])
+            self.current_particle = int(state['current_particle'])
+            self.allow_update = int(state['allow_update'])
+            self.mode = str(state['mode'])
+            self.boundary = int(state['boundary'])
+            self.number_decimals = int(state['number_decimals'])
+            self.T_MOD = float(state['T_MOD'])
+            self.InitDeviation = float(state['InitDeviation'])
+            self.deviation = float(state['deviation'])
+            self.delta_t = float(state['delta_t'])
+            self.M = state['M']
+            self.V = state['V']
+            self.Active = state['Active']
+            self.Gb = state['Gb']
+            self.F_Gb = state['F_Gb']
+            self.Pb = state['Pb']
+            self.F_Pb = state['F_Pb']
+            self.weights = state['weights']
+            self.Flist = state['Flist']
+            self.Fvals = state['Fvals']
+            self.vlimit = state['vlimit']
+            self.Mlast = state['Mlast']
+            self.evaluated = state['evaluated']
+            self.Mfeasible = state['Mfeasible']
+            self.has_feasible = state['has_feasible']
+            self.Penalized = state['Penalized']
+            self.repair_stats = dict(zip(sorted(self.repair_stats), state['repair_stats'].tolist()))
+            self.ask_queue = deque(state['ask_queue'].tolist())
+            self.tickets = {} # tickets from before the save are unknown from here on
+            self.next_ticket = int(state['next_ticket'])
+            self.tell_count = int(state['tell_count'])
+            self.evaluations = int(state['evaluations'])
+            self.start_time = time.monotonic() - float(state['elapsed']) # the time budget covers the whole run
+            self.stall_best = float(state['stall_best'])
+            self.stall_sweeps = int(state['stall_sweeps'])
+            self.sweep_stop = str(state['sweep_stop'])
+            if self.sweep_stop == "":
+                self.sweep_stop = None
+            self.surrogate_skips = state['surrogate_skips']
+            self.surrogate_stats = dict(zip(sorted(self.surrogate_stats), state['surrogate_stats'].tolist()))
+            if self.useSurrogateModel:
+                self.surrogateOptimizer.points.clear()
+                if 'surrogate_X' in state:
+                    self.surrogateOptimizer.add(state['surrogate_X'], state['surrogate_Fvals'])
+            self.rng.bit_generator.state = {'bit_generator': 'MT19937',
+                                            'state': {'key': state['rng_key'],
+                                                      'pos': int(state['rng_pos'])}}
+            if 'neighbors' in state:
+                self.topology = str(state['topology'])
+                self.set_neighbors(state['neighbors']) # Nb/F_Nb follow from the restored Pb/F_Pb
+            elif self.neighbors is not None:
+                self.set_neighbors(self.neighbors)
+            if self.multi_objective and ('archive_X' in state):
+                self.archive.X = state['archive_X']
+                self.archive.Flist = state['archive_Flist']
+                self.archive.Fvals = state['archive_Fvals']
+                self.archive.prune()
+        self.number_of_particles = np.shape(self.M)[0]
+        if self.recorder != None: # forget evaluations made after the checkpoint
+            self.recorder.truncate(self.iter)
+        self.checkpoint_iter = self.iter
+        self.checkpoint_time = time.monotonic()
+
 
     def export_swarm(self):
         #These do NOT export.
@@ -444,8 +1665,9 @@ class swarm:
             'current_particle': [self.current_particle],    
             'allow_update': [self.allow_update],
             # optimizer specfic
+            'mode': [self.mode],
             'T_MOD': [self.T_MOD],
-            'init_deviation': [self.init_deviation],    
+            'init_deviation': [self.InitDeviation],    
             'delta_t': [self.delta_t],
 
             # shared format vars for AntennaCAT set
@@ -482,14 +1704,14 @@ class swarm:
         # convergence and step criteria
         self.maxit = int(swarm_export['maxit'][0])                                              
         self.E_TOL = float(swarm_export['E_TOL'][0])                                               
-        self.iter = int(swarm_export['iter'][0])     # NEED 'RESUME' and 'START OVER' options
+        self.iter = int(swarm_export['iter'][0])     # see load_checkpoint() for an exact resume
         self.current_particle = int(swarm_export['current_particle'][0])         
         self.allow_update = int(swarm_export['allow_update'][0])    # BOOL as INT
 
         # optimizer specfic
         # NONE: this is the most stripped down optimizer in the set
         self.T_MOD = float(swarm_export['T_MOD'][0])  
-        self.init_deviation = float(swarm_export['init_deviation'][0])  
+        self.InitDeviation = float(swarm_export['init_deviation'][0])  
         self.delta_t = float(swarm_export['delta_t'][0]) 
 
         # shared format vars for AntennaCAT set
@@ -506,9 +1728,22 @@ class swarm:
         self.Fvals= np.array(swarm_export['Fvals'][0])
         self.vlimit = np.array(swarm_export['vlimit'][0]) # used in initial setup                                               
         self.Mlast= np.array(swarm_export['Mlast'][0])   
+        if np.ndim(self.Mlast) == 1: # older exports only kept the last moved particle
+            self.Mlast = np.tile(self.Mlast, (np.shape(self.M)[0], 1))
+        if 'mode' in swarm_export:
+            self.mode = str(swarm_export['mode'][0])
+        self.evaluated = np.zeros(np.shape(self.M)[0], dtype=bool)
+        self.deviation = self.absolute_mean_deviation_of_particles()
+        self.Mfeasible = 1*self.M
+        self.has_feasible = np.zeros(np.shape(self.M)[0], dtype=bool)
+        self.Penalized = np.zeros(np.shape(self.M)[0], dtype=bool)
+        if self.neighbors is not None:
+            self.set_neighbors(self.neighbors)
 
 
     def get_obj_inputs(self):
+        if self.mode == "batch":
+            return self.M
         return self.M[self.current_particle]
     
     def get_convergence_data(self):
@@ -516,19 +1751,69 @@ class swarm:
         iteration = 1*self.iter
         return iteration, best_eval
         
+    def get_repair_stats(self):
+        # calls: particles sent to the constraint repair
+        # draws: candidate positions sampled
+        # fallbacks: particles still infeasible after repair_attempts rounds
+        # projected/penalized: how the fallbacks were resolved
+        return dict(self.repair_stats)
+
+    def get_surrogate_stats(self):
+        # screened: particles checked against the surrogate
+        # skipped: objective calls saved
+        # forced: calls made only because a particle reached surrogate_max_skips
+        return dict(self.surrogate_stats)
+
+    def get_profile(self):
+        # evaluations: objective evaluations ingested (self.iter)
+        # phases: calls, cumulative seconds, and rows evaluated per phase. Empty without a profiler
+        # repair: constraint repair counters, see get_repair_stats()
+        # cache: cache hit/miss counters, or None without a cache
+        # surrogate: surrogate pre-screening counters, or None without a surrogate
+        profile = {'evaluations': self.iter,
+                   'phases': {},
+                   'repair': self.get_repair_stats(),
+                   'cache': None,
+                   'surrogate': None}
+        if self.profiler != None:
+            profile['phases'] = self.profiler.get_phases()
+        if self.cache != None:
+            profile['cache'] = self.cache.get_stats()
+        if self.useSurrogateModel:
+            profile['surrogate'] = self.get_surrogate_stats()
+        return profile
+
     def get_optimized_soln(self):
         return self.Gb.reshape(-1, 1) #standardization  
     
     def get_optimized_outs(self):
         return self.F_Gb[0] #correction for extra brackets that happen with the math/passing
+
+    def get_pareto_front(self):
+        # multi-objective mode. Returns the archived positions (n, D) and their
+        # raw objective outputs (n, outputs), ordered by the first output
+        if not self.multi_objective:
+            self.debug_message_printout("WARNING: no Pareto archive, multi_objective is off.")
+            return np.zeros((0, np.shape(self.M)[1])), np.zeros((0, self.output_size))
+        X, Fvals, Flist = self.archive.get_front()
+        return X, Fvals
     
-    def absolute_mean_deviation_of_particles(self):
-        mean_data = np.array(np.mean(self.M, axis=0)).reshape(1, -1)
-        abs_data = np.zeros(np.shape(self.M))
-        for i in range(0,self.number_of_particles):
-            abs_data[i] = np.squeeze(np.abs(self.M[i]-mean_data))
+    def initial_deviation(self):
+        # deviation of the starting positions, the reference for delta_t. A design
+        # with no spread (one particle, or every particle on the same point) uses the
+        # deviation of a uniform spread over the bounds instead, (ubound - lbound)/4
+        deviation = self.absolute_mean_deviation_of_particles()
+        if deviation == 0:
+            deviation = np.linalg.norm((self.ubound - self.lbound)/4)
+        if deviation == 0:
+            deviation = 1.0
+        return deviation
 
-        abs_mean_dev = np.linalg.norm(np.mean(abs_data,axis=0))
+    def absolute_mean_deviation_of_particles(self):
+        # one pass over M. Called once per sweep by update_delta_t(),
+        # use self.deviation for the value from the last sweep
+        mean_data = np.mean(self.M, axis=0)
+        abs_mean_dev = np.linalg.norm(np.mean(np.abs(self.M - mean_data), axis=0))
         return abs_mean_dev
 
 
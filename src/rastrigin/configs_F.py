@@ -0,0 +1,36 @@
+#! /usr/bin/python3
+
+##--------------------------------------------------------------------\
+#   pso_python
+#   '.src/rastrigin/configs_F.py'
+#   Constant values for objective function. Formatted for
+#       automating objective function integration
+#
+#   Author(s): Lauren Linkous, Jonathan Lundquist
+#   Last update: October 18, 2026
+##--------------------------------------------------------------------\
+
+
+import sys
+try: # for outside func calls
+    sys.path.insert(0, './pso_python/src/')
+    from rastrigin.func_F import func_F, func_F_batch
+    from rastrigin.constr_F import constr_F, constr_F_batch
+except: # for local
+    from func_F import func_F, func_F_batch
+    from constr_F import constr_F, constr_F_batch
+
+OBJECTIVE_FUNC = func_F
+OBJECTIVE_FUNC_BATCH = func_F_batch   # vectorized, (N, IN_VARS) in, (N, OUT_VARS) out
+CONSTR_FUNC = constr_F
+CONSTR_FUNC_BATCH = constr_F_batch   # vectorized, (N, IN_VARS) in, N booleans out
+OBJECTIVE_FUNC_NAME = "rastrigin.func_F"
+CONSTR_FUNC_NAME = "rastrigin.constr_F"
+
+# problem dependent variables. Change IN_VARS to set the dimensionality
+IN_VARS = 30                # Number of input variables (x-values)
+OUT_VARS = 1                # Number of output variables (y-values)
+LB = [[-5.12]*IN_VARS]      # Lower boundaries
+UB = [[5.12]*IN_VARS]       # Upper boundaries
+TARGETS = [0]               # Target values for output
+GLOBAL_MIN = [[0]*IN_VARS]  # Global minima sample, if they exist. f = 0
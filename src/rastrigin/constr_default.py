@@ -0,0 +1,18 @@
+#! /usr/bin/python3
+
+##--------------------------------------------------------------------\
+#   pso_python
+#   '.src/rastrigin/constr_default.py'
+#   Function for default constraints. Called if user does not pass in
+#       constraints for objective function or problem being optimized.
+#
+#   Author(s): Lauren Linkous, Jonathan Lundquist
+#   Last update: October 18, 2026
+##--------------------------------------------------------------------\
+
+
+
+import numpy as np
+
+def constr_default(X):
+    return True
@@ -0,0 +1,106 @@
+#! /usr/bin/python3
+
+##--------------------------------------------------------------------\
+#   pso_python
+#   './pso_python/src/reference_grid.py'
+#   Ground-truth grids for the graph.py scripts of the problem packages.
+#       The grid is evaluated in chunks with the vectorized objective and
+#       constraint functions, and the result is cached in an '.npz' file
+#       keyed on the problem name, bounds, resolution and function source,
+#       so repeated plots skip the evaluation. pareto_front() filters the
+#       non-dominated points for any number of outputs.
+#
+#   Author(s): Jonathan Lundquist, Lauren Linkous
+#   Last update: October 18, 2026
+##--------------------------------------------------------------------\
+
+
+import numpy as np
+import hashlib
+import inspect
+import os
+from pareto_archive import nondominated_mask
+
+
+def grid_axes(lbound, ubound, resolution):
+    # one np.linspace per input variable. resolution is an int, or one int per variable
+    lbound = np.array(lbound).reshape(-1)
+    ubound = np.array(ubound).reshape(-1)
+    resolution = np.broadcast_to(np.array(resolution, dtype=int), np.shape(lbound))
+    return [np.linspace(lbound[i], ubound[i], resolution[i]) for i in range(0, len(lbound))]
+
+
+def grid_coords(axes, start=0, stop=None):
+    # rows start:stop of the full grid, 'ij' ordered (the last axis varies fastest),
+    # without building the whole grid
+    shape = tuple(len(a) for a in axes)
+    if stop == None:
+        stop = int(np.prod(shape))
+    index = np.unravel_index(np.arange(start, stop), shape)
+    return np.stack([axes[i][index[i]] for i in range(0, len(axes))], axis=-1)
+
+
+def evaluate_grid(func_batch, constr_batch, axes, num_outputs, chunk_size=65536):
+    # returns F (n, num_outputs) with NaN rows where the point is infeasible or the
+    # objective call failed, and the mask of valid rows.
+    # func_batch/constr_batch follow the vectorized contract of particle_swarm.py
+    n = int(np.prod([len(a) for a in axes]))
+    F = np.full((n, num_outputs), np.nan)
+    valid = np.zeros(n, dtype=bool)
+    for start in range(0, n, chunk_size):
+        stop = min(start + chunk_size, n)
+        X = grid_coords(axes, start, stop)
+        feasible = np.array(constr_batch(X), dtype=bool).reshape(-1)
+        rows = np.flatnonzero(feasible)
+        if len(rows) == 0:
+            continue
+        Fvals, noErrors = func_batch(X[rows], num_outputs)
+        rows = rows[np.array(noErrors, dtype=bool).reshape(-1)]
+        F[start + rows] = np.reshape(Fvals, (-1, num_outputs))[np.array(noErrors, dtype=bool).reshape(-1)]
+        valid[start + rows] = True
+    return F, valid
+
+
+def source_hash(func):
+    # changes when the function is edited, so stale caches are not reused
+    try:
+        source = inspect.getsource(func)
+    except (OSError, TypeError):
+        source = getattr(func, '__qualname__', str(func))
+    return hashlib.sha1(source.encode()).hexdigest()
+
+
+def cached_grid(name, func_batch, constr_batch, lbound, ubound, resolution, num_outputs,
+                cache_dir="grid_cache", chunk_size=65536):
+    # returns (axes, F, valid). See evaluate_grid(). The grid is read from
+    # cache_dir when it was computed before with the same inputs
+    axes = grid_axes(lbound, ubound, resolution)
+    key = hashlib.sha1(repr((name,
+                             np.array(lbound, dtype=float).tolist(),
+                             np.array(ubound, dtype=float).tolist(),
+                             [len(a) for a in axes],
+                             int(num_outputs),
+                             source_hash(func_batch),
+                             source_hash(constr_batch))).encode()).hexdigest()[:16]
+    path = os.path.join(cache_dir, name + "_" + key + ".npz")
+
+    if os.path.exists(path):
+        with np.load(path) as cached:
+            return axes, cached['F'], cached['valid']
+
+    F, valid = evaluate_grid(func_batch, constr_batch, axes, num_outputs, chunk_size)
+    os.makedirs(cache_dir, exist_ok=True)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, 'wb') as f:
+        np.savez(f, F=F, valid=valid)
+    os.replace(tmp_path, path)
+    return axes, F, valid
+
+
+def pareto_front(F, minimize=True):
+    # index of the non-dominated rows of F (n, outputs), ordered by the first output
+    F = np.asarray(F)
+    if not minimize:
+        F = -F
+    index = np.flatnonzero(nondominated_mask(F))
+    return index[np.argsort(F[index, 0], kind='stable')]
@@ -0,0 +1,123 @@
+#! /usr/bin/python3
+
+##--------------------------------------------------------------------\
+#   pso_python
+#   './pso_python/src/surrogate_model.py'
+#   Radial basis function surrogate of the objective function, used by
+#       the 'swarm' class in particle_swarm.py to pre-screen moved
+#       particles. Trained on the evaluated (position, Fvals) pairs as
+#       they come in, and refit only when a prediction is needed. A cubic
+#       kernel with a linear tail interpolates every output at once, so
+#       the model has no hyperparameters to tune.
+#
+#   Author(s): Jonathan Lundquist, Lauren Linkous
+#   Last update: October 18, 2026
+##--------------------------------------------------------------------\
+
+
+import numpy as np
+from collections import OrderedDict
+
+
+class rbf_surrogate:
+    # arguments should take the form:
+    # rbf_surrogate(int, int, float)
+    #
+    # max_points: int. training points kept, the oldest are dropped first.
+    #       The fit solves a (max_points + D + 1) square system
+    # min_points: int or None. points needed before predicting. None uses 2*(D + 1)
+    # smoothing: float. added to the kernel diagonal, relative to its largest entry
+
+    def __init__(self, max_points=200, min_points=None, smoothing=10 ** -10):
+        self.max_points = int(max_points)
+        self.min_points = min_points
+        self.smoothing = float(smoothing)
+
+        '''
+        self.points                 : Training set, position bytes: (position, Fvals).
+        self.X                      : Scaled training positions of the last fit.
+        self.weights                : Kernel weights of the last fit, (n, outputs).
+        self.tail                   : Linear tail coefficients of the last fit, (D + 1, outputs).
+        self.offset                 : Position scaling, X_scaled = (X - offset)/scale.
+        self.scale                  : Position scaling.
+        self.stale                  : Training set changed since the last fit.
+        '''
+        self.points = OrderedDict()
+        self.X = None
+        self.weights = None
+        self.tail = None
+        self.offset = None
+        self.scale = None
+        self.stale = True
+
+    def __len__(self):
+        return len(self.points)
+
+    def add(self, X, Fvals):
+        # X is (n, D), Fvals is (n, outputs). Repeated positions keep the newest value
+        X = np.atleast_2d(np.array(X, dtype=float))
+        if np.shape(X)[0] == 0:
+            return
+        Fvals = np.reshape(np.array(Fvals, dtype=float), (np.shape(X)[0], -1))
+        for i in range(0, np.shape(X)[0]):
+            if not np.all(np.isfinite(Fvals[i])):
+                continue
+            key = X[i].tobytes()
+            self.points.pop(key, None)
+            self.points[key] = (X[i].copy(), Fvals[i].copy())
+        while len(self.points) > self.max_points:
+            self.points.popitem(last=False)
+        self.stale = True
+
+    def ready(self):
+        if len(self.points) == 0:
+            return False
+        dims = len(next(iter(self.points.values()))[0])
+        min_points = self.min_points
+        if min_points == None:
+            min_points = 2*(dims + 1)
+        if len(self.points) < max(int(min_points), dims + 2):
+            return False
+        if self.stale:
+            self.fit()
+        return self.weights is not None
+
+    def kernel(self, A, B):
+        # cubic kernel, r**3, between the rows of A and B
+        r = np.sqrt(np.maximum(np.sum(A*A, axis=1)[:, np.newaxis] \
+                               + np.sum(B*B, axis=1)[np.newaxis, :] \
+                               - 2*(A @ B.T), 0))
+        return r*r*r
+
+    def fit(self):
+        X = np.array([p[0] for p in self.points.values()])
+        F = np.array([p[1] for p in self.points.values()])
+        n, dims = np.shape(X)
+        self.offset = np.min(X, axis=0)
+        self.scale = np.max(X, axis=0) - self.offset
+        self.scale[self.scale == 0] = 1
+        X = (X - self.offset)/self.scale
+
+        Phi = self.kernel(X, X)
+        Phi[np.diag_indices(n)] += self.smoothing*max(np.max(Phi), 1)
+        P = np.hstack((np.ones((n, 1)), X))
+        A = np.block([[Phi, P], [P.T, np.zeros((dims + 1, dims + 1))]])
+        rhs = np.vstack((F, np.zeros((dims + 1, np.shape(F)[1]))))
+        try:
+            solution = np.linalg.solve(A, rhs)
+        except np.linalg.LinAlgError: # e.g. every point on a line, least squares still works
+            try:
+                solution = np.linalg.lstsq(A, rhs, rcond=None)[0]
+            except np.linalg.LinAlgError:
+                self.weights = None
+                self.stale = False
+                return
+        self.X = X
+        self.weights = solution[:n]
+        self.tail = solution[n:]
+        self.stale = False
+
+    def predict(self, X):
+        # predicted Fvals, (n, outputs). Call ready() first
+        X = (np.atleast_2d(np.array(X, dtype=float)) - self.offset)/self.scale
+        return self.kernel(X, self.X) @ self.weights + self.tail[0] + X @ self.tail[1:]
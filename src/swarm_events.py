@@ -0,0 +1,122 @@
+#! /usr/bin/python3
+
+##--------------------------------------------------------------------\
+#   pso_python
+#   './pso_python/src/swarm_events.py'
+#   Structured event records emitted by the 'swarm' class in
+#       particle_swarm.py, and two bundled sinks. Records are only built
+#       when something is subscribed, and are only turned into text or
+#       JSON by a sink, so monitoring costs nothing when nothing listens.
+#
+#   Author(s): Jonathan Lundquist, Lauren Linkous
+#   Last update: October 18, 2026
+##--------------------------------------------------------------------\
+
+
+import numpy as np
+from collections import namedtuple
+import json
+
+
+# objective evaluations ingested by the swarm. 'iter' is the iteration of the
+# last row, particles/M/Fvals/Flist hold one row per evaluation
+evaluation_event = namedtuple('evaluation_event', ['iter', 'particles', 'M', 'Fvals', 'Flist'])
+
+# particles moved to new positions (after bounds handling)
+step_event = namedtuple('step_event', ['iter', 'particles', 'M', 'V', 'delta_t'])
+
+# the global best improved. 'particle' is -1 when the new best is a migrant (inject_migrants)
+best_event = namedtuple('best_event', ['iter', 'particle', 'Gb', 'F_Gb'])
+
+# every active particle has moved once, and the time step was adapted
+sweep_event = namedtuple('sweep_event', ['iter', 'delta_t', 'deviation'])
+
+# the swarm completed. 'reason' is the termination rule, see swarm.get_stop_reason(). Emitted once
+complete_event = namedtuple('complete_event', ['iter', 'Gb', 'F_Gb', 'converged', 'reason'])
+
+
+def event_name(record):
+    return type(record).__name__
+
+
+class text_sink:
+    # formats records as the swarm debug messages
+    # print_func: func(str). e.g. print, or a parent debug_message_printout
+    # events: list of record types to keep, e.g. [best_event, complete_event]. None keeps all
+
+    def __init__(self, print_func=print, events=None):
+        self.print_func = print_func
+        self.events = events
+
+    def __call__(self, record):
+        if (self.events != None) and not isinstance(record, tuple(self.events)):
+            return
+        if isinstance(record, step_event):
+            msg = "STEP #" + str(record.iter) + " particles " + str(record.particles) + "\n" + \
+                "Location\n" + str(record.M) + "\n" + \
+                "Velocity\n" + str(record.V) + "\n" + \
+                "Delta T " + str(record.delta_t)
+        elif isinstance(record, evaluation_event):
+            msg = "EVALUATION #" + str(record.iter) + " particles " + str(record.particles) + "\n" + \
+                "Fvals\n" + str(record.Fvals) + "\n" + \
+                "Flist\n" + str(record.Flist)
+        elif isinstance(record, best_event):
+            msg = "NEW GLOBAL BEST #" + str(record.iter) + " particle " + str(record.particle) + "\n" + \
+                "Points\n" + str(record.Gb) + "\n" + \
+                "Norm Flist " + str(np.linalg.norm(record.F_Gb))
+        elif isinstance(record, sweep_event):
+            msg = "SWEEP #" + str(record.iter) + " Delta T " + str(record.delta_t) + \
+                " Absolute mean deviation " + str(record.deviation)
+        elif isinstance(record, complete_event):
+            msg = "\nPoints: \n" + str(record.Gb) + "\n" + \
+                "Iterations: \n" + str(record.iter) + "\n" + \
+                "Flist: \n" + str(record.F_Gb) + "\n" + \
+                "Norm Flist: \n" + str(np.linalg.norm(record.F_Gb)) + "\n" + \
+                "Stop reason: " + str(record.reason) + "\n"
+        else:
+            msg = str(record)
+        self.print_func(msg)
+
+
+class jsonl_sink:
+    # writes one JSON object per record to 'path', with an 'event' field
+    # holding the record type. Arrays are written as nested lists
+    # path: str. output file, appended to
+    # events: list of record types to keep. None keeps all
+    # flush_every: int. file buffer is flushed every this many records
+
+    def __init__(self, path, events=None, flush_every=100):
+        self.path = path
+        self.events = events
+        self.flush_every = int(flush_every)
+        self.count = 0
+        self.file = open(path, 'a')
+
+    def __call__(self, record):
+        if (self.events != None) and not isinstance(record, tuple(self.events)):
+            return
+        row = {'event': event_name(record)}
+        for key, value in record._asdict().items():
+            if isinstance(value, np.ndarray):
+                value = value.tolist()
+            elif isinstance(value, np.generic):
+                value = value.item()
+            row[key] = value
+        self.file.write(json.dumps(row) + "\n")
+        self.count = self.count + 1
+        if self.count % self.flush_every == 0:
+            self.file.flush()
+
+    def close(self):
+        if not self.file.closed:
+            self.file.close()
+
+
+def read_events(path, events=None):
+    # generator over the records of a jsonl_sink file, as dicts.
+    # events: list of event names to keep, e.g. ['best_event']. None keeps all
+    with open(path) as f:
+        for line in f:
+            row = json.loads(line)
+            if (events == None) or (row['event'] in events):
+                yield row
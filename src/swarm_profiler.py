@@ -0,0 +1,117 @@
+#! /usr/bin/python3
+
+##--------------------------------------------------------------------\
+#   pso_python
+#   './pso_python/src/swarm_profiler.py'
+#   Optional per-phase timing for the 'swarm' class in particle_swarm.py.
+#       When a profiler is passed to the swarm, the methods of each phase
+#       are replaced on that swarm instance by timed wrappers that keep
+#       call counts, cumulative wall time, and rows evaluated. A swarm
+#       without a profiler runs the plain methods, so there is no cost
+#       when profiling is off.
+#
+#   Author(s): Jonathan Lundquist, Lauren Linkous
+#   Last update: October 18, 2026
+##--------------------------------------------------------------------\
+
+
+import time
+
+
+# phase name: (swarm methods, index of the argument holding the evaluated rows or None).
+# Phases nest, e.g. 'bounds' includes the 'constraints' calls it makes,
+# and 'step' includes 'velocity', 'position', 'bounds' and 'bests'
+PHASES = {
+    'step': (['step'], None),
+    'call_objective': (['call_objective'], None),
+    'tell': (['tell'], None),
+    'objective': (['call_obj_func'], 0),
+    'objective_parallel': (['evaluate_parallel'], 1),
+    'surrogate': (['surrogate_screen'], 0),
+    'constraints': (['constraint_mask'], 0),
+    'bounds': (['handle_bounds', 'handle_bounds_batch'], None),
+    'velocity': (['update_velocity', 'update_velocity_batch'], None),
+    'position': (['update_point', 'update_point_batch'], None),
+    'bests': (['check_global_local', 'check_global_local_batch'], None),
+    'deviation': (['absolute_mean_deviation_of_particles'], None),
+    'checkpoint': (['save_checkpoint'], None),
+}
+
+
+class swarm_profiler:
+    # arguments should take the form:
+    # swarm_profiler(float, func)
+    #
+    # interval: float or None. seconds between reports while the swarm runs
+    # report_func: func(str) or None. receives the reports. None uses the
+    #       swarm debug_message_printout()
+
+    def __init__(self, interval=None, report_func=None):
+        self.interval = interval
+        self.report_func = report_func
+
+        '''
+        self.phases                 : Per phase counters, {'calls', 'time', 'rows'}.
+        self.start_time             : perf_counter() when the swarm was instrumented.
+        self.next_report            : perf_counter() of the next interval report.
+        self.target                 : The instrumented swarm.
+        '''
+        self.phases = {}
+        for name in PHASES:
+            self.phases[name] = {'calls': 0, 'time': 0.0, 'rows': 0}
+        self.start_time = time.perf_counter()
+        self.next_report = None
+        self.target = None
+
+    def instrument(self, target):
+        # replace the phase methods on 'target' with timed wrappers
+        self.target = target
+        if self.report_func == None:
+            self.report_func = target.debug_message_printout
+        self.start_time = time.perf_counter()
+        if self.interval != None:
+            self.next_report = self.start_time + self.interval
+        for name in PHASES:
+            methods, rows_arg = PHASES[name]
+            for method in methods:
+                setattr(target, method, self.timed(self.phases[name], getattr(target, method), rows_arg))
+
+    def timed(self, stats, method, rows_arg):
+        perf_counter = time.perf_counter
+        def wrapper(*args, **kwargs):
+            start = perf_counter()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                end = perf_counter()
+                stats['calls'] = stats['calls'] + 1
+                stats['time'] = stats['time'] + (end - start)
+                if rows_arg != None:
+                    stats['rows'] = stats['rows'] + len(args[rows_arg])
+                if (self.next_report != None) and (end >= self.next_report):
+                    self.next_report = end + self.interval
+                    self.report()
+        return wrapper
+
+    def get_phases(self):
+        phases = {}
+        for name in self.phases:
+            phases[name] = dict(self.phases[name])
+        return phases
+
+    def report(self):
+        elapsed = time.perf_counter() - self.start_time
+        msg = "\n-----------------------------\n" + \
+            "PROFILE after %.1f s\n" % elapsed + \
+            "%-20s %10s %12s %12s %8s\n" % ("phase", "calls", "total s", "us/call", "share")
+        for name in self.phases:
+            stats = self.phases[name]
+            if stats['calls'] == 0:
+                continue
+            msg = msg + "%-20s %10d %12.4f %12.2f %7.1f%%\n" % (
+                name, stats['calls'], stats['time'], 1e6*stats['time']/stats['calls'],
+                100*stats['time']/max(elapsed, 1e-12))
+        if self.target != None:
+            msg = msg + "evaluations: " + str(self.target.iter) + "\n"
+        msg = msg + "-----------------------------"
+        self.report_func(msg)
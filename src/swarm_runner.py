@@ -0,0 +1,164 @@
+#! /usr/bin/python3
+
+##--------------------------------------------------------------------\
+#   pso_python
+#   './pso_python/src/swarm_runner.py'
+#   Shared helpers for the headless runners (benchmark/run_benchmark.py,
+#       tuning/run_tuning.py and island_model.py): the registry of
+#       problem packages, a parent object that swallows the swarm debug
+#       messages, a swarm factory for a registered problem, and the
+#       controller loop from main_test.py. The scalable problems can be
+#       loaded with any number of input variables.
+#
+#   Author(s): Jonathan Lundquist, Lauren Linkous
+#   Last update: October 18, 2026
+##--------------------------------------------------------------------\
+
+
+import importlib
+import types
+import numpy as np
+import pandas as pd
+from particle_swarm import swarm
+
+
+# problems. 'module' is the configs_F module of a problem package in src/.
+# 'evaluate_threshold' and 'TOL' are passed to the swarm. 'min_dims' marks
+# the scalable problems, see load_problem(), and 'multi_objective' the
+# problems run with the swarm Pareto archive
+PROBLEMS = {
+    'one_dim_x_test': {'module': 'one_dim_x_test.configs_F',
+                       'evaluate_threshold': False,
+                       'TOL': 10 ** -6},
+    'himmelblau': {'module': 'himmelblau.configs_F',
+                   'evaluate_threshold': False,
+                   'TOL': 10 ** -6},
+    'lundquist_3_var': {'module': 'lundquist_3_var.configs_F',
+                        'evaluate_threshold': True,   # thresholds as in main_test.py
+                        'TOL': 10 ** -6},
+    'rastrigin': {'module': 'rastrigin.configs_F',
+                  'evaluate_threshold': False,
+                  'TOL': 10 ** -6,
+                  'min_dims': 1},
+    'rosenbrock': {'module': 'rosenbrock.configs_F',
+                   'evaluate_threshold': False,
+                   'TOL': 10 ** -6,
+                   'min_dims': 2},
+    'ackley': {'module': 'ackley.configs_F',
+               'evaluate_threshold': False,
+               'TOL': 10 ** -6,
+               'min_dims': 1},
+    'griewank': {'module': 'griewank.configs_F',
+                 'evaluate_threshold': False,
+                 'TOL': 10 ** -6,
+                 'min_dims': 1},
+    'zdt1': {'module': 'zdt1.configs_F',
+             'evaluate_threshold': False,
+             'TOL': 10 ** -6,
+             'min_dims': 2,
+             'multi_objective': True},
+    'zdt2': {'module': 'zdt2.configs_F',
+             'evaluate_threshold': False,
+             'TOL': 10 ** -6,
+             'min_dims': 2,
+             'multi_objective': True},
+    'zdt3': {'module': 'zdt3.configs_F',
+             'evaluate_threshold': False,
+             'TOL': 10 ** -6,
+             'min_dims': 2,
+             'multi_objective': True},
+    'dtlz1': {'module': 'dtlz1.configs_F',
+              'evaluate_threshold': False,
+              'TOL': 10 ** -6,
+              'min_dims': 3,                 # OUT_VARS, with K = 1
+              'multi_objective': True},
+    'dtlz2': {'module': 'dtlz2.configs_F',
+              'evaluate_threshold': False,
+              'TOL': 10 ** -6,
+              'min_dims': 3,
+              'multi_objective': True},
+}
+
+
+class quiet_parent:
+    # swallows the swarm debug messages
+    @staticmethod
+    def record_params():
+        pass
+
+    @staticmethod
+    def debug_message_printout(msg):
+        pass
+
+
+def load_problem(name, dims=None):
+    # the configs_F module of a registered problem. For a scalable problem,
+    # 'dims' sets the number of input variables. The returned copy of the
+    # constants has LB, UB and GLOBAL_MIN resized, and K for the DTLZ problems.
+    # The bounds and GLOBAL_MIN of these problems are the same in every dimension
+    settings = PROBLEMS[name]
+    func_configs = importlib.import_module(settings['module'])
+    if (dims == None) or (int(dims) == func_configs.IN_VARS):
+        return func_configs
+    dims = int(dims)
+    if settings.get('min_dims') == None:
+        raise ValueError("problem '" + name + "' has a fixed number of inputs, " + \
+                         str(func_configs.IN_VARS))
+    if dims < settings['min_dims']:
+        raise ValueError("problem '" + name + "' needs at least " + \
+                         str(settings['min_dims']) + " inputs")
+
+    problem = types.SimpleNamespace(**{k: getattr(func_configs, k) for k in dir(func_configs) if k.isupper()})
+    problem.IN_VARS = dims
+    problem.LB = [[func_configs.LB[0][0]]*dims]
+    problem.UB = [[func_configs.UB[0][0]]*dims]
+    problem.GLOBAL_MIN = [[func_configs.GLOBAL_MIN[0][0]]*dims]
+    if hasattr(func_configs, 'K'): # IN_VARS = OUT_VARS + K - 1
+        problem.K = dims - func_configs.OUT_VARS + 1
+    return problem
+
+
+def problem_swarm(name, params, maxit, mode="sequential", seed=None, decimal_limit=5,
+                  batch_funcs=True, dims=None, **kwargs):
+    # swarm on a registered problem. 'params' holds the opt_df values
+    # (NO_OF_PARTICLES, T_MOD, BOUNDARY, WEIGHTS, VLIM). batch_funcs uses the
+    # vectorized functions in batch mode, dims sets the inputs of a scalable
+    # problem. Other keyword arguments go to the swarm
+    settings = PROBLEMS[name]
+    func_configs = load_problem(name, dims)
+    func_F = func_configs.OBJECTIVE_FUNC
+    constr_F = func_configs.CONSTR_FUNC
+    if (mode == "batch") and batch_funcs:
+        func_F = func_configs.OBJECTIVE_FUNC_BATCH
+        constr_F = func_configs.CONSTR_FUNC_BATCH
+
+    opt_df = pd.DataFrame({'NO_OF_PARTICLES': [params['NO_OF_PARTICLES']],
+                           'T_MOD': [params['T_MOD']],
+                           'BOUNDARY': [params['BOUNDARY']],
+                           'WEIGHTS': [params['WEIGHTS']],
+                           'VLIM': [params['VLIM']]})
+    kwargs.setdefault('parent', quiet_parent)
+    kwargs.setdefault('multi_objective', settings.get('multi_objective', False))
+    return swarm(func_configs.LB, func_configs.UB, func_configs.TARGETS,
+                 settings['TOL'], maxit,
+                 func_F, constr_F,
+                 opt_df,
+                 evaluate_threshold=settings['evaluate_threshold'],
+                 obj_threshold=np.ones_like(func_configs.TARGETS),
+                 decimal_limit=decimal_limit,
+                 mode=mode,
+                 seed=seed,
+                 **kwargs)
+
+
+def run_swarm(myOptimizer, until_iter=None):
+    # the loop from main_test.py, optionally paused once 'until_iter' evaluations
+    # are made. Stops early if the invisible boundary has deactivated every
+    # particle, which would otherwise never complete
+    while not myOptimizer.complete():
+        if (until_iter != None) and (myOptimizer.iter >= until_iter):
+            break
+        myOptimizer.step(True)
+        myOptimizer.call_objective(True)
+        if not np.any(myOptimizer.Active):
+            break
@@ -0,0 +1,90 @@
+#! /usr/bin/python3
+
+##--------------------------------------------------------------------\
+#   pso_python
+#   './pso_python/src/tests/conftest.py'
+#   Shared fixtures for the pytest suite. Swarms are built on the
+#       bundled problems with a fixed seed, and debug messages are
+#       collected instead of printed.
+#
+#       cd src
+#       python -m pytest tests
+#
+#   Author(s): Jonathan Lundquist, Lauren Linkous
+#   Last update: October 18, 2026
+##--------------------------------------------------------------------\
+
+
+import os
+import sys
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import importlib
+import numpy as np
+import pandas as pd
+import pytest
+from particle_swarm import swarm
+
+
+class message_parent:
+    # collects the swarm debug messages
+    def __init__(self):
+        self.messages = []
+
+    def record_params(self):
+        pass
+
+    def debug_message_printout(self, msg):
+        self.messages.append(msg)
+
+
+def opt_df(N=9, boundary=1, weights=[[0.5, 0.7, 0.78]], vlim=1, t_mod=0.65):
+    return pd.DataFrame({'NO_OF_PARTICLES': [N],
+                         'T_MOD': [t_mod],
+                         'BOUNDARY': [boundary],
+                         'WEIGHTS': [weights],
+                         'VLIM': [vlim]})
+
+
+def build_swarm(problem="himmelblau", N=9, maxit=800, boundary=1, E_TOL=10 ** -18,
+                batch_funcs=False, parent=None, **kwargs):
+    # swarm on a bundled problem. batch_funcs uses the vectorized functions
+    func_configs = importlib.import_module(problem + ".configs_F")
+    func_F = func_configs.OBJECTIVE_FUNC
+    constr_F = func_configs.CONSTR_FUNC
+    if batch_funcs:
+        func_F = func_configs.OBJECTIVE_FUNC_BATCH
+        constr_F = func_configs.CONSTR_FUNC_BATCH
+    if parent == None:
+        parent = message_parent()
+    kwargs.setdefault('seed', 3)
+    kwargs.setdefault('decimal_limit', 5)
+    return swarm(func_configs.LB, func_configs.UB, func_configs.TARGETS, E_TOL, maxit,
+                 func_F, constr_F,
+                 opt_df(N, boundary),
+                 parent=parent,
+                 **kwargs)
+
+
+def run_swarm(myOptimizer, stop=None):
+    # the main_test.py loop, optionally paused once 'stop' evaluations are made
+    while not myOptimizer.complete():
+        myOptimizer.step(True)
+        myOptimizer.call_objective(True)
+        if (stop != None) and (myOptimizer.iter >= stop):
+            return
+
+
+@pytest.fixture
+def parent():
+    return message_parent()
+
+
+@pytest.fixture
+def make_swarm():
+    return build_swarm
+
+
+@pytest.fixture
+def drive():
+    return run_swarm
@@ -0,0 +1,80 @@
+#! /usr/bin/python3
+
+##--------------------------------------------------------------------\
+#   pso_python
+#   './pso_python/src/tests/test_checkpoint.py'
+#   Tests for save_checkpoint() and load_checkpoint(). A run paused
+#       after an automatic checkpoint and resumed in a new swarm must
+#       finish exactly as the uninterrupted run.
+#
+#   Author(s): Jonathan Lundquist, Lauren Linkous
+#   Last update: October 18, 2026
+##--------------------------------------------------------------------\
+
+
+import os
+import numpy as np
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+
+
+def assert_same_run(a, b):
+    assert a.iter == b.iter
+    assert a.evaluations == b.evaluations
+    assert np.array_equal(a.M, b.M)
+    assert np.array_equal(a.V, b.V)
+    assert np.array_equal(a.Pb, b.Pb)
+    assert np.array_equal(a.Gb, b.Gb)
+    assert np.array_equal(a.F_Gb, b.F_Gb)
+
+
+@pytest.mark.parametrize("problem", ["himmelblau", "lundquist_3_var"])
+@pytest.mark.parametrize("mode", ["sequential", "batch"])
+def test_exact_resume(problem, mode, make_swarm, drive, tmp_path):
+    path = str(tmp_path / "swarm.npz")
+    full = make_swarm(problem, mode=mode)
+    drive(full)
+
+    # stopped between checkpoints, the resumed run repeats the evaluations since the last one
+    paused = make_swarm(problem, mode=mode, checkpoint_path=path, checkpoint_every=50)
+    drive(paused, stop=333)
+    assert os.path.exists(path)
+    assert 0 < paused.checkpoint_iter <= 333
+
+    resumed = make_swarm(problem, mode=mode)
+    resumed.load_checkpoint(path)
+    assert resumed.iter == paused.checkpoint_iter
+    drive(resumed)
+    assert_same_run(full, resumed)
+    assert resumed.get_stop_reason() == full.get_stop_reason()
+
+
+def test_resume_in_parallel(make_swarm, drive, tmp_path):
+    path = str(tmp_path / "swarm.npz")
+    full = make_swarm()
+    full.run_parallel(ThreadPoolExecutor(2))
+
+    paused = make_swarm(checkpoint_path=path, checkpoint_every=100)
+    drive(paused, stop=250)
+    resumed = make_swarm()
+    resumed.load_checkpoint(path)
+    resumed.run_parallel(ThreadPoolExecutor(2))
+    assert resumed.iter == full.iter
+    assert np.array_equal(resumed.Gb, full.Gb)
+
+
+def test_explicit_save_and_load(make_swarm, drive, tmp_path):
+    path = str(tmp_path / "swarm.npz")
+    full = make_swarm(mode="batch")
+    drive(full)
+
+    paused = make_swarm(mode="batch")
+    drive(paused, stop=180)
+    paused.save_checkpoint(path)
+    # the write goes through a temporary file that is renamed into place
+    assert os.listdir(str(tmp_path)) == ["swarm.npz"]
+    resumed = make_swarm(mode="batch")
+    resumed.load_checkpoint(path)
+    assert resumed.iter == paused.iter
+    drive(resumed)
+    assert_same_run(full, resumed)
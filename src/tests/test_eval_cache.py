@@ -0,0 +1,87 @@
+#! /usr/bin/python3
+
+##--------------------------------------------------------------------\
+#   pso_python
+#   './pso_python/src/tests/test_eval_cache.py'
+#   Tests for the objective call cache in eval_cache.py: repeat hits,
+#       LRU eviction, the sqlite store, and swarm runs that must match
+#       the uncached run while making fewer objective calls.
+#
+#   Author(s): Jonathan Lundquist, Lauren Linkous
+#   Last update: October 18, 2026
+##--------------------------------------------------------------------\
+
+
+import numpy as np
+import pytest
+from eval_cache import eval_cache
+
+
+def test_repeat_lookup_hits():
+    cache = eval_cache(decimals=3)
+    assert cache.lookup([1.0, 2.0]) is None
+    cache.store([1.0, 2.0], [5.0])
+    # rounding to 'decimals' and -0.0 map to the same key
+    assert np.array_equal(cache.lookup([1.0001, 2.0]), [5.0])
+    assert np.array_equal(cache.lookup(np.array([[1.0], [2.0]])), [5.0])
+    cache.store([0.0, 1.0], [7.0])
+    assert np.array_equal(cache.lookup([-0.0, 1.0]), [7.0])
+    stats = cache.get_stats()
+    assert (stats['hits'], stats['misses'], stats['size']) == (3, 1, 2)
+    assert stats['hit_rate'] == 0.75
+
+
+def test_lru_eviction():
+    cache = eval_cache(max_size=2)
+    cache.store([1.0], [1.0])
+    cache.store([2.0], [2.0])
+    cache.lookup([1.0]) # [2.0] is now the least recently used
+    cache.store([3.0], [3.0])
+    assert cache.lookup([2.0]) is None
+    assert np.array_equal(cache.lookup([1.0]), [1.0])
+    assert np.array_equal(cache.lookup([3.0]), [3.0])
+    assert cache.get_stats()['evictions'] == 1
+    assert len(cache.entries) == 2
+
+
+def test_sqlite_keeps_evicted_and_closed_entries(tmp_path):
+    path = str(tmp_path / "cache.db")
+    cache = eval_cache(max_size=1, path=path, commit_every=1000)
+    cache.store([1.0, 2.0], [3.0, 4.0])
+    cache.store([5.0, 6.0], [7.0, 8.0])
+    # evicted from memory, answered from disk
+    assert np.array_equal(cache.lookup([1.0, 2.0]), [3.0, 4.0])
+    cache.close()
+
+    cache = eval_cache(path=path)
+    assert np.array_equal(cache.lookup([5.0, 6.0]), [7.0, 8.0])
+    assert np.array_equal(cache.lookup([1.0, 2.0]), [3.0, 4.0])
+    assert cache.get_stats()['misses'] == 0
+    cache.close()
+
+
+@pytest.mark.parametrize("mode", ["sequential", "batch"])
+def test_swarm_cache_hits_match_uncached_run(mode, make_swarm, drive, tmp_path):
+    plain = make_swarm(mode=mode)
+    drive(plain)
+
+    path = str(tmp_path / "cache.db")
+    cache = eval_cache(path=path)
+    cached = make_swarm(mode=mode, cache=cache)
+    drive(cached)
+    cache.close()
+    stats = cache.get_stats()
+    assert stats['hits'] > 0
+    assert cached.evaluations == stats['misses'] < plain.evaluations
+    assert cached.iter == plain.iter
+    assert np.array_equal(cached.Gb, plain.Gb)
+    assert np.array_equal(cached.F_Gb, plain.F_Gb)
+
+    # a second run on the same file repeats every position, no objective calls
+    cache = eval_cache(path=path)
+    repeat = make_swarm(mode=mode, cache=cache)
+    drive(repeat)
+    cache.close()
+    assert repeat.evaluations == 0
+    assert cache.get_stats()['hit_rate'] == 1.0
+    assert np.array_equal(repeat.Gb, plain.Gb)
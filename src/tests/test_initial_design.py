@@ -0,0 +1,55 @@
+#! /usr/bin/python3
+
+##--------------------------------------------------------------------\
+#   pso_python
+#   './pso_python/src/tests/test_initial_design.py'
+#   Initial designs: built-in designs stay in bounds, user designs are
+#       checked and clipped, and a design without spread still gives a
+#       usable time step.
+#
+#   Author(s): Jonathan Lundquist, Lauren Linkous
+#   Last update: October 18, 2026
+##--------------------------------------------------------------------\
+
+
+import numpy as np
+import pytest
+
+
+@pytest.mark.parametrize("design", ["uniform", "lhs", "halton", "sobol"])
+def test_designs_in_bounds(make_swarm, design):
+    s = make_swarm(N=20, initial_design=design)
+    assert np.shape(s.M) == (20, 2)
+    assert np.all((s.M >= s.lbound) & (s.M <= s.ubound))
+
+
+def test_zero_spread_design(make_swarm, drive):
+    # every particle on one point. InitDeviation is 0 without the fallback
+    s = make_swarm(N=9, initial_design=np.ones((9, 2)))
+    assert s.InitDeviation > 0
+    assert np.isfinite(s.delta_t) and (s.delta_t > 0)
+    drive(s, stop=100)
+    assert s.absolute_mean_deviation_of_particles() > 0
+
+
+def test_single_particle(make_swarm, drive):
+    s = make_swarm(N=1)
+    assert s.InitDeviation > 0
+    drive(s, stop=20)
+    assert s.iter == 20
+
+
+def test_design_clipped_to_bounds(make_swarm, parent):
+    design = np.array([[-10.0, 0.0], [10.0, 2.5]] + [[1.0, 1.0]]*7)
+    s = make_swarm(N=9, initial_design=design, parent=parent)
+    assert np.all((s.M >= s.lbound) & (s.M <= s.ubound))
+    assert np.array_equal(s.M[0], [-5, 0]) and np.array_equal(s.M[1], [5, 2.5])
+    assert any("outside the bounds" in m for m in parent.messages)
+
+
+@pytest.mark.parametrize("design", [np.ones((3, 2)), np.ones((9, 3)), [[1, 2], [3]], np.full((9, 2), np.nan)])
+def test_invalid_design_falls_back(make_swarm, parent, design):
+    s = make_swarm(N=9, initial_design=design, parent=parent)
+    assert np.shape(s.M) == (9, 2)
+    assert np.all((s.M >= s.lbound) & (s.M <= s.ubound))
+    assert any("Defaulting to uniform" in m for m in parent.messages)
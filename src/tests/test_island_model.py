@@ -0,0 +1,41 @@
+#! /usr/bin/python3
+
+##--------------------------------------------------------------------\
+#   pso_python
+#   './pso_python/src/tests/test_island_model.py'
+#   Tests for island_model.py. Epochs are synchronized, so worker
+#       processes and in-process islands must give the same run.
+#
+#   Author(s): Jonathan Lundquist, Lauren Linkous
+#   Last update: October 18, 2026
+##--------------------------------------------------------------------\
+
+
+import numpy as np
+import pandas as pd
+import pytest
+import himmelblau.configs_F as func_configs
+from island_model import island_model
+
+
+@pytest.mark.parametrize("migration", ["particles", "best"])
+@pytest.mark.parametrize("topology", ["ring", "full"])
+def test_processes_match_in_process(topology, migration):
+    opt_df = pd.DataFrame({'NO_OF_PARTICLES': [9], 'T_MOD': [0.65], 'BOUNDARY': [1],
+                           'WEIGHTS': [[[0.5, 0.7, 0.78]]], 'VLIM': [1]})
+    swarm_args = (func_configs.LB, func_configs.UB, func_configs.TARGETS, 10 ** -18, 600,
+                  func_configs.OBJECTIVE_FUNC, func_configs.CONSTR_FUNC, opt_df)
+    results = []
+    for processes in [False, True]:
+        model = island_model(swarm_args, {'seed': 5, 'decimal_limit': 5}, islands=3,
+                             migration_interval=100, topology=topology, migration=migration,
+                             migrants=2, processes=processes)
+        results.append(model.run())
+    local, parallel = results
+    assert parallel['islands'] == local['islands']
+    assert np.array_equal(parallel['Gb'], local['Gb'])
+    assert parallel['epochs'] == local['epochs'] == 6
+    assert parallel['evaluations'] == 3*600
+    # the reported best is the best over all islands
+    assert parallel['islands'][parallel['island']]['best_eval'] == \
+        min(r['best_eval'] for r in parallel['islands'])
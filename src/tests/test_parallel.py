@@ -0,0 +1,72 @@
+#! /usr/bin/python3
+
+##--------------------------------------------------------------------\
+#   pso_python
+#   './pso_python/src/tests/test_parallel.py'
+#   Tests for run_parallel(). Results are applied in particle order,
+#       so the evaluations must match the controller loop for any
+#       executor and number of workers. run_parallel() also applies
+#       the last evaluations, which the controller loop stops before.
+#
+#   Author(s): Jonathan Lundquist, Lauren Linkous
+#   Last update: October 18, 2026
+##--------------------------------------------------------------------\
+
+
+import numpy as np
+import pytest
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from swarm_events import evaluation_event
+
+
+def evaluations(myOptimizer):
+    # (particle, position, Fvals) of every ingested evaluation, in order
+    rows = []
+    def record(event):
+        for i in range(0, len(event.particles)):
+            rows.append((int(event.particles[i]), tuple(event.M[i]), tuple(event.Fvals[i])))
+    myOptimizer.subscribe(record, [evaluation_event])
+    return rows
+
+
+@pytest.mark.parametrize("problem", ["himmelblau", "lundquist_3_var"])
+@pytest.mark.parametrize("mode", ["sequential", "batch"])
+def test_parallel_matches_loop(problem, mode, make_swarm, drive):
+    loop = make_swarm(problem, mode=mode)
+    expected = evaluations(loop)
+    drive(loop)
+    for workers in [1, 3]:
+        parallel = make_swarm(problem, mode=mode)
+        rows = evaluations(parallel)
+        parallel.run_parallel(ThreadPoolExecutor(workers))
+        assert parallel.iter == loop.iter
+        assert parallel.evaluations == loop.evaluations
+        assert rows == expected
+        assert np.linalg.norm(parallel.F_Gb) <= np.linalg.norm(loop.F_Gb)
+
+
+def test_process_pool(make_swarm, drive):
+    loop = make_swarm(maxit=200)
+    expected = evaluations(loop)
+    drive(loop)
+    parallel = make_swarm(maxit=200)
+    rows = evaluations(parallel)
+    with ProcessPoolExecutor(2) as executor:
+        parallel.run_parallel(executor)
+    assert parallel.iter == loop.iter
+    assert rows == expected
+
+
+def test_failed_calls_are_reported(make_swarm):
+    myOptimizer = make_swarm(maxit=100)
+    obj_func = myOptimizer.obj_func
+    def failing(X, NO_OF_OUTS):
+        if X[0] > 4:
+            raise ValueError("out of range")
+        return obj_func(X, NO_OF_OUTS)
+    myOptimizer.obj_func = failing
+    myOptimizer.run_parallel(ThreadPoolExecutor(2))
+    assert myOptimizer.complete()
+    # failed calls are not iterations, but they were made
+    assert myOptimizer.evaluations > myOptimizer.iter
+    assert any("out of range" in msg for msg in myOptimizer.parent.messages)
@@ -0,0 +1,117 @@
+#! /usr/bin/python3
+
+##--------------------------------------------------------------------\
+#   pso_python
+#   './pso_python/src/tests/test_pareto_archive.py'
+#   Tests for the multi-objective archive in pareto_archive.py:
+#       dominance, insertion of single and batched candidates, and
+#       crowding distance pruning of a full archive.
+#
+#   Author(s): Jonathan Lundquist, Lauren Linkous
+#   Last update: October 18, 2026
+##--------------------------------------------------------------------\
+
+
+import numpy as np
+import pytest
+from pareto_archive import pareto_archive, dominates, nondominated_mask, crowding_distance
+
+
+def brute_force_mask(F):
+    # rows that no other row dominates, one pair at a time
+    n = len(F)
+    return np.array([not any(dominates(F[j], F[i]) for j in range(n)) for i in range(n)])
+
+
+@pytest.mark.parametrize("outputs", [2, 3])
+def test_nondominated_mask(outputs):
+    rng = np.random.default_rng(0)
+    # rounded values give ties and repeated rows
+    F = np.round(rng.random((300, outputs)), 1)
+    assert np.array_equal(nondominated_mask(F, chunk_size=16), brute_force_mask(F))
+    assert not np.any(nondominated_mask(np.zeros((0, outputs))))
+
+
+def test_crowding_distance():
+    F = np.array([[0.0, 4.0], [1.0, 2.0], [3.0, 1.0], [4.0, 0.0]])
+    distance = crowding_distance(F)
+    assert np.all(np.isinf(distance[[0, 3]]))
+    assert distance[1] == pytest.approx(3/4 + 3/4)
+    assert distance[2] == pytest.approx(3/4 + 2/4)
+    assert np.all(np.isinf(crowding_distance(F[:2])))
+
+
+def test_single_insertion():
+    archive = pareto_archive(max_size=10)
+    assert archive.add([[0.0]], [[2.0, 2.0]], [[2.0, 2.0]]) == 1
+    # dominated, and repeated positions are rejected
+    assert archive.add([[1.0]], [[3.0, 2.0]], [[3.0, 2.0]]) == 0
+    assert archive.add([[0.0]], [[1.0, 1.0]], [[1.0, 1.0]]) == 0
+    # a trade-off is kept alongside
+    assert archive.add([[2.0]], [[1.0, 3.0]], [[1.0, 3.0]]) == 1
+    assert len(archive) == 2
+    # a dominating candidate replaces the members it dominates
+    assert archive.add([[3.0]], [[1.0, 1.0]], [[1.0, 1.0]]) == 1
+    assert len(archive) == 1
+    X, Fvals, Flist = archive.get_front()
+    assert np.array_equal(X, [[3.0]])
+    assert np.array_equal(Flist, [[1.0, 1.0]])
+
+
+def test_batch_insertion_matches_single():
+    rng = np.random.default_rng(1)
+    X = rng.random((200, 2))
+    F = rng.random((200, 2))
+    single = pareto_archive(max_size=1000)
+    for i in range(0, len(X)):
+        single.add(X[[i]], F[[i]], F[[i]])
+    batch = pareto_archive(max_size=1000)
+    assert batch.add(X[:50], F[:50], F[:50]) > 0
+    batch.add(X[50:], F[50:], F[50:])
+    front = nondominated_mask(F)
+    for archive in [single, batch]:
+        order = np.lexsort(archive.X.T)
+        assert np.array_equal(archive.X[order], X[front][np.lexsort(X[front].T)])
+
+
+def test_crowding_pruning():
+    # a front of 21 points, crowded at one end
+    t = np.concatenate((np.linspace(0, 0.1, 11), np.linspace(0.2, 1, 10)))
+    F = np.column_stack((t, 1 - t))
+    archive = pareto_archive(max_size=8)
+    archive.add(t[:, np.newaxis], F, F)
+    assert len(archive) == 8
+    assert np.all(nondominated_mask(archive.Flist))
+    # the extremes are never pruned, the crowded end is thinned first
+    assert 0.0 in archive.X and 1.0 in archive.X
+    kept = archive.X[:, 0]
+    assert np.sum(kept <= 0.1) < np.sum(kept >= 0.2)
+    assert np.array_equal(archive.crowding, crowding_distance(archive.Flist))
+
+    # one at a time insertion prunes to the same size
+    single = pareto_archive(max_size=8)
+    for i in range(0, len(t)):
+        single.add(t[[i], np.newaxis], F[[i]], F[[i]])
+    assert len(single) == 8
+    assert 0.0 in single.X and 1.0 in single.X
+
+
+def test_select_leaders():
+    t = np.linspace(0, 1, 6)
+    F = np.column_stack((t, 1 - t))
+    archive = pareto_archive(max_size=10)
+    archive.add(t[:, np.newaxis], F, F)
+    leaders = archive.select_leaders(np.random.default_rng(0), 50)
+    assert np.shape(leaders) == (50, 1)
+    assert np.all(np.isin(leaders, archive.X))
+
+
+@pytest.mark.parametrize("mode", ["sequential", "batch"])
+def test_swarm_archive_is_a_bounded_front(mode, make_swarm, drive):
+    myOptimizer = make_swarm("lundquist_3_var", mode=mode, maxit=600,
+                             multi_objective=True, archive_size=20)
+    drive(myOptimizer)
+    archive = myOptimizer.archive
+    assert 2 <= len(archive) <= 20
+    assert np.all(nondominated_mask(archive.Flist))
+    assert len(np.unique(archive.X, axis=0)) == len(archive)
@@ -0,0 +1,56 @@
+#! /usr/bin/python3
+
+##--------------------------------------------------------------------\
+#   pso_python
+#   './pso_python/src/tests/test_profiler.py'
+#   Tests for swarm_profiler.py. The phase counters must match the
+#       calls the swarm really makes, whichever path makes them.
+#
+#   Author(s): Jonathan Lundquist, Lauren Linkous
+#   Last update: October 18, 2026
+##--------------------------------------------------------------------\
+
+
+import pytest
+from swarm_profiler import swarm_profiler
+
+
+def counted_constraints(myOptimizer):
+    # wrap the constraint function to count the rows it checks
+    rows = [0]
+    constr_func = myOptimizer.constr_func
+    vectorized = getattr(constr_func, 'vectorized', False) == True
+    def wrapper(X):
+        if vectorized:
+            rows[0] = rows[0] + len(X)
+        else:
+            rows[0] = rows[0] + 1
+        return constr_func(X)
+    wrapper.vectorized = vectorized
+    myOptimizer.constr_func = wrapper
+    return rows
+
+
+@pytest.mark.parametrize("mode,batch_funcs", [("sequential", False), ("batch", False), ("batch", True)])
+@pytest.mark.parametrize("boundary", [1, 2, 3, 4])
+def test_constraint_checks_are_counted(mode, batch_funcs, boundary, make_swarm, drive):
+    profiler = swarm_profiler()
+    myOptimizer = make_swarm("lundquist_3_var", maxit=500, boundary=boundary, mode=mode,
+                             batch_funcs=batch_funcs, profiler=profiler)
+    rows = counted_constraints(myOptimizer)
+    drive(myOptimizer)
+    phases = profiler.get_phases()
+    assert rows[0] > 0
+    assert phases['constraints']['rows'] == rows[0]
+    if not batch_funcs:
+        assert phases['constraints']['calls'] <= rows[0]
+    assert phases['objective']['rows'] == myOptimizer.evaluations
+
+
+def test_profiled_run_matches_plain_run(make_swarm, drive):
+    plain = make_swarm("lundquist_3_var", maxit=500)
+    drive(plain)
+    profiled = make_swarm("lundquist_3_var", maxit=500, profiler=swarm_profiler())
+    drive(profiled)
+    assert profiled.iter == plain.iter
+    assert (profiled.Gb == plain.Gb).all()
@@ -0,0 +1,128 @@
+#! /usr/bin/python3
+
+##--------------------------------------------------------------------\
+#   pso_python
+#   './pso_python/src/tests/test_runners.py'
+#   Tests for the shared runner helpers in swarm_runner.py, the
+#       benchmark case matrix, and resuming a tuning results file cut
+#       short by an interruption.
+#
+#   Author(s): Jonathan Lundquist, Lauren Linkous
+#   Last update: October 18, 2026
+##--------------------------------------------------------------------\
+
+
+import os
+import sys
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'tuning'))
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'benchmark'))
+
+import csv
+import numpy as np
+import pytest
+import swarm_runner as runner
+import run_tuning
+import run_benchmark
+
+
+PARAMS = {'NO_OF_PARTICLES': 9, 'T_MOD': 0.65, 'BOUNDARY': 1, 'WEIGHTS': [[0.5, 0.7, 0.78]], 'VLIM': 1}
+
+
+@pytest.mark.parametrize("name", list(runner.PROBLEMS))
+def test_registered_problems_run(name):
+    myOptimizer = runner.problem_swarm(name, PARAMS, 90, mode="batch", seed=1)
+    assert myOptimizer.parent == runner.quiet_parent
+    runner.run_swarm(myOptimizer)
+    assert myOptimizer.complete()
+    assert np.shape(myOptimizer.M)[1] == runner.load_problem(name).IN_VARS
+
+
+@pytest.mark.parametrize("name", [n for n in runner.PROBLEMS if runner.PROBLEMS[n].get('min_dims') != None])
+def test_scalable_problem_dims(name):
+    for dims in [runner.PROBLEMS[name]['min_dims'], 10, 60]:
+        func_configs = runner.load_problem(name, dims)
+        assert func_configs.IN_VARS == dims
+        assert np.shape(func_configs.LB) == np.shape(func_configs.UB) == (1, dims)
+        # the optimum sample is on the front in every dimension
+        F, noErrors = func_configs.OBJECTIVE_FUNC_BATCH(np.array(func_configs.GLOBAL_MIN), func_configs.OUT_VARS)
+        f, noError = func_configs.OBJECTIVE_FUNC(np.array(func_configs.GLOBAL_MIN[0]), func_configs.OUT_VARS)
+        assert np.all(noErrors) and noError
+        assert np.allclose(F[0], f)
+        assert np.allclose(F[0], runner.load_problem(name).OBJECTIVE_FUNC(
+            np.array(runner.load_problem(name).GLOBAL_MIN[0]), func_configs.OUT_VARS)[0])
+        myOptimizer = runner.problem_swarm(name, PARAMS, 45, mode="batch", seed=1, dims=dims)
+        assert np.shape(myOptimizer.M) == (9, dims)
+    with pytest.raises(ValueError):
+        runner.load_problem(name, runner.PROBLEMS[name]['min_dims'] - 1)
+
+
+def test_fixed_problem_dims():
+    assert runner.load_problem('himmelblau', 2).IN_VARS == 2
+    with pytest.raises(ValueError):
+        runner.load_problem('himmelblau', 10)
+
+
+@pytest.mark.parametrize("mode", ["sequential", "batch"])
+def test_run_swarm_pauses(mode):
+    full = runner.problem_swarm('himmelblau', PARAMS, 400, mode=mode, seed=1)
+    runner.run_swarm(full)
+    paused = runner.problem_swarm('himmelblau', PARAMS, 400, mode=mode, seed=1)
+    runner.run_swarm(paused, until_iter=100)
+    assert 100 <= paused.iter < 100 + 9
+    runner.run_swarm(paused)
+    assert paused.iter == full.iter
+    assert np.array_equal(paused.Gb, full.Gb)
+
+
+def test_benchmark_cases():
+    cases = run_benchmark.build_cases(['himmelblau', 'rastrigin'], ["sequential", "batch"], [10, 2000],
+                                      [1], [1], [10, 100])
+    # only the scalable problem runs at each dimension, and large sequential cases are skipped
+    assert [(c['problem'], c['dims'], c['mode'], c['particles']) for c in cases] == [
+        ('himmelblau', None, 'sequential', 10), ('himmelblau', None, 'batch', 10),
+        ('himmelblau', None, 'batch', 2000),
+        ('rastrigin', 10, 'sequential', 10), ('rastrigin', 10, 'batch', 10), ('rastrigin', 10, 'batch', 2000),
+        ('rastrigin', 100, 'sequential', 10), ('rastrigin', 100, 'batch', 10), ('rastrigin', 100, 'batch', 2000)]
+    # keys of the bundled problems are unchanged, so older baselines still compare
+    assert run_benchmark.case_key(cases[0]) == "himmelblau/sequential/N10/B1/S1"
+    assert run_benchmark.case_key(cases[-1]) == "rastrigin/D100/batch/N2000/B1/S1"
+
+
+def test_expensive_benchmark_cases():
+    cases = run_benchmark.build_cases(['zdt1'], ["sequential", "batch", "parallel"], [10],
+                                      [1], [1], [20], 0.0005)
+    results = [run_benchmark.run_case(case, measure_memory=False, repeats=1) for case in cases]
+    assert [r['key'] for r in results] == ["zdt1/D20/%s/N10/B1/S1/T0.0005" % mode
+                                           for mode in ["sequential", "batch", "parallel"]]
+    for r in results:
+        assert r['dimensions'] == 20
+    # every call sleeps, only the thread pool overlaps them
+    assert min(results[0]['time_per_iteration'], results[1]['time_per_iteration']) >= 0.0005
+    # the parallel case makes the evaluations of the sequential loop
+    assert results[2]['iterations'] == results[0]['iterations']
+    assert results[2]['final_eval'] <= results[0]['final_eval']
+
+
+def test_resume_drops_partial_row(tmp_path):
+    path = str(tmp_path / "results.csv")
+    tasks = run_tuning.build_tasks(['one_dim_x_test'], {'NO_OF_PARTICLES': [5], 'T_MOD': [0.65],
+                                                        'BOUNDARY': [1], 'WEIGHTS': [[[0.5, 0.7, 0.78]]],
+                                                        'VLIM': [1]}, 3)
+    rows = [run_tuning.run_task(t, maxit=50) for t in tasks]
+    with open(path, 'w', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=run_tuning.RESULT_FIELDS)
+        writer.writeheader()
+        writer.writerows(rows[:2])
+    with open(path, 'rb') as f:
+        data = f.read()
+    with open(path, 'wb') as f: # the second row was cut short
+        f.write(data[:-20])
+
+    run_tuning.truncate_partial_row(path)
+    assert run_tuning.completed_runs(path) == {('one_dim_x_test', tasks[0]['config'], 0)}
+    with open(path, 'a', newline='') as f:
+        csv.DictWriter(f, fieldnames=run_tuning.RESULT_FIELDS).writerows(rows[1:])
+    with open(path, newline='') as f:
+        resumed = list(csv.DictReader(f))
+    assert [int(r['repeat']) for r in resumed] == [0, 1, 2]
+    assert all(None not in r for r in resumed)
@@ -0,0 +1,98 @@
+#! /usr/bin/python3
+
+##--------------------------------------------------------------------\
+#   pso_python
+#   './pso_python/src/tests/test_stopping_rules.py'
+#   Stopping rules: evaluation and time budgets, stagnation, diversity,
+#       and the reason reported by get_stop_reason().
+#
+#   Author(s): Jonathan Lundquist, Lauren Linkous
+#   Last update: October 18, 2026
+##--------------------------------------------------------------------\
+
+
+import numpy as np
+import pytest
+from swarm_events import sweep_event
+
+
+@pytest.mark.parametrize("mode", ["sequential", "batch"])
+def test_max_evals(make_swarm, drive, mode):
+    s = make_swarm(mode=mode, max_evals=50)
+    drive(s)
+    assert s.get_stop_reason() == "max_evals"
+    assert s.evaluations >= 50
+    assert s.evaluations < 50 + s.number_of_particles # batch mode stops at the end of a sweep
+
+
+@pytest.mark.parametrize("mode", ["sequential", "batch"])
+def test_max_time(make_swarm, drive, mode):
+    s = make_swarm(mode=mode, maxit=10 ** 9, max_time=0.05)
+    drive(s)
+    assert s.get_stop_reason() == "max_time"
+
+
+def test_maxit_and_converged(make_swarm, drive):
+    s = make_swarm(maxit=100)
+    drive(s)
+    assert s.get_stop_reason() == "maxit"
+    assert s.iter == 100
+    s = make_swarm(maxit=10 ** 5, E_TOL=10 ** -3, seed=4)
+    drive(s)
+    assert s.get_stop_reason() == "converged"
+
+
+def test_not_complete_has_no_reason(make_swarm):
+    s = make_swarm()
+    assert s.get_stop_reason() == None
+
+
+def test_stagnation_counter_resets_on_improvement(make_swarm):
+    # sweeps that keep improving never count as stalled
+    s = make_swarm(stagnation_sweeps=3)
+    for best in [22.6, 15.0, 9.0, 5.0, 2.39, 1.0]:
+        s.F_Gb = np.array([[best]])
+        s.check_sweep_rules()
+        assert s.stall_sweeps == 0
+        assert s.sweep_stop == None
+    # then stalls: stops after exactly stagnation_sweeps sweeps
+    for i in range(0, 3):
+        s.check_sweep_rules()
+    assert s.sweep_stop == "stagnation"
+
+
+@pytest.mark.parametrize("mode", ["sequential", "batch"])
+def test_improving_run_does_not_stop_early(make_swarm, drive, mode):
+    # norm(F_Gb) at the end of every sweep. The run may only stop on stagnation
+    # after stagnation_sweeps sweeps in a row without improvement
+    s = make_swarm(mode=mode, maxit=10 ** 5, stagnation_sweeps=5)
+    history = []
+    s.subscribe(lambda record: history.append(np.linalg.norm(s.F_Gb)), [sweep_event])
+    drive(s)
+    assert s.get_stop_reason() == "stagnation"
+    assert len(history) > 5
+    stalled = 0
+    for i in range(1, len(history)):
+        stalled = 0 if history[i] < history[i - 1] else stalled + 1
+        if i < len(history) - 1:
+            assert stalled < 5
+    assert history[-1] == history[-6]
+
+
+def test_diversity(make_swarm, drive):
+    s = make_swarm(maxit=10 ** 5, min_deviation=0.2, seed=4)
+    drive(s)
+    assert s.get_stop_reason() == "diversity"
+    assert s.deviation < 0.2*s.InitDeviation
+
+
+def test_stopping_state_in_checkpoint(make_swarm, drive, tmp_path):
+    path = str(tmp_path / "stop.npz")
+    s = make_swarm(mode="batch", stagnation_sweeps=5, max_evals=500)
+    drive(s, stop=100)
+    s.save_checkpoint(path)
+    resumed = make_swarm(mode="batch", stagnation_sweeps=5, max_evals=500)
+    resumed.load_checkpoint(path)
+    assert resumed.evaluations == s.evaluations
+    assert resumed.stall_sweeps == s.stall_sweeps
+    assert resumed.stall_best == s.stall_best
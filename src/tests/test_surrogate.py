@@ -0,0 +1,87 @@
+#! /usr/bin/python3
+
+##--------------------------------------------------------------------\
+#   pso_python
+#   './pso_python/src/tests/test_surrogate.py'
+#   Tests for the surrogate pre-screening. Skipped particles must not
+#       count as iterations, so maxit still bounds the real objective
+#       calls, and surrogate_max_skips must force a call.
+#
+#   Author(s): Jonathan Lundquist, Lauren Linkous
+#   Last update: October 18, 2026
+##--------------------------------------------------------------------\
+
+
+import numpy as np
+import pytest
+from surrogate_model import rbf_surrogate
+
+
+def counted(myOptimizer):
+    # wrap the objective function to count the real calls
+    calls = [0]
+    obj_func = myOptimizer.obj_func
+    def wrapper(X, NO_OF_OUTS):
+        calls[0] = calls[0] + 1
+        return obj_func(X, NO_OF_OUTS)
+    myOptimizer.obj_func = wrapper
+    return calls
+
+
+def test_rbf_surrogate_interpolates():
+    rng = np.random.default_rng(0)
+    model = rbf_surrogate(min_points=5)
+    X = rng.uniform(-5, 5, (44, 2))
+    F = np.column_stack((np.sum(X**2, axis=1), X[:, 0]))
+    model.add(X[:4], F[:4])
+    assert not model.ready()
+    model.add(X[4:], F[4:])
+    assert model.ready()
+    assert np.allclose(model.predict(X), F, atol=1e-6)
+    # non-finite outputs are not training points, and the oldest points are dropped
+    model.add([[0.5, 0.5]], [[np.inf, 0.0]])
+    assert len(model) == 44
+    model = rbf_surrogate(max_points=10)
+    model.add(X, F)
+    assert len(model) == 10
+
+
+@pytest.mark.parametrize("mode", ["sequential", "batch"])
+def test_skips_do_not_count_against_maxit(mode, make_swarm):
+    myOptimizer = make_swarm(mode=mode, surrogate=rbf_surrogate(), surrogate_max_skips=2)
+    calls = counted(myOptimizer)
+    while not myOptimizer.complete():
+        myOptimizer.step(True)
+        myOptimizer.call_objective(True)
+        assert np.max(myOptimizer.surrogate_skips) <= 2
+    stats = myOptimizer.get_surrogate_stats()
+    assert myOptimizer.get_stop_reason() == "maxit"
+    assert stats['skipped'] > 0
+    assert stats['forced'] > 0
+    # every iteration is a real objective call, skips are on top of them
+    assert myOptimizer.iter == myOptimizer.evaluations == calls[0] == 800
+    assert stats['screened'] > stats['skipped']
+
+
+@pytest.mark.parametrize("mode", ["sequential", "batch"])
+def test_no_skips_allowed_matches_plain_run(mode, make_swarm, drive):
+    plain = make_swarm(mode=mode)
+    drive(plain)
+    screened = make_swarm(mode=mode, surrogate=rbf_surrogate(), surrogate_max_skips=0)
+    drive(screened)
+    stats = screened.get_surrogate_stats()
+    assert stats['skipped'] == 0
+    assert stats['forced'] > 0
+    assert screened.iter == plain.iter
+    assert np.array_equal(screened.Gb, plain.Gb)
+
+
+@pytest.mark.parametrize("mode", ["sequential", "batch"])
+def test_skips_with_max_evals(mode, make_swarm, drive):
+    myOptimizer = make_swarm(mode=mode, surrogate=rbf_surrogate(), max_evals=400)
+    calls = counted(myOptimizer)
+    drive(myOptimizer)
+    assert myOptimizer.get_stop_reason() == "max_evals"
+    assert myOptimizer.evaluations == calls[0]
+    assert 400 <= calls[0] < 400 + myOptimizer.number_of_particles
+    assert myOptimizer.get_surrogate_stats()['skipped'] > 0
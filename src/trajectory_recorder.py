@@ -0,0 +1,181 @@
+#! /usr/bin/python3
+
+##--------------------------------------------------------------------\
+#   pso_python
+#   './pso_python/src/trajectory_recorder.py'
+#   Opt-in history of every objective evaluation ingested by the swarm.
+#       Rows (iteration, particle, position, raw Fvals, Flist) are
+#       collected in a preallocated buffer and written out as fixed size
+#       '.npy' segments, so memory use does not grow with the run length.
+#       read_trajectory() streams the segments back memory-mapped, one
+#       chunk at a time.
+#
+#   Author(s): Jonathan Lundquist, Lauren Linkous
+#   Last update: October 18, 2026
+##--------------------------------------------------------------------\
+
+
+import numpy as np
+import glob
+import os
+
+
+SEGMENT_PATTERN = "segment_%06d.npy"
+
+
+class trajectory_recorder:
+    # arguments should take the form:
+    # trajectory_recorder(str, int)
+    #
+    # directory: str. folder for the segment files. Created if it does not exist.
+    #       An existing history in the folder is appended to.
+    # chunk_size: int. rows per segment file
+
+    def __init__(self, directory, chunk_size=65536):
+        self.directory = directory
+        self.chunk_size = int(chunk_size)
+
+        '''
+        self.buffer                 : Rows of the segment being filled. Allocated on the first record.
+        self.count                  : Number of rows used in self.buffer.
+        self.segment                : Index of the segment being filled.
+        self.rows_written           : Rows in the completed segments.
+        '''
+        self.buffer = None
+        self.count = 0
+        self.segment = 0
+        self.rows_written = 0
+
+        os.makedirs(self.directory, exist_ok=True)
+        segments = segment_files(self.directory)
+        if len(segments) > 0:
+            # continue an existing history, refilling its last segment if it was partial
+            last = np.load(segments[-1])
+            self.segment = len(segments) - 1
+            self.rows_written = self.segment*self.chunk_size
+            if len(last) < self.chunk_size:
+                self.buffer = np.zeros(self.chunk_size, dtype=last.dtype)
+                self.buffer[:len(last)] = last
+                self.count = len(last)
+            else:
+                self.segment = self.segment + 1
+                self.rows_written = self.rows_written + len(last)
+
+    def allocate(self, num_dims, output_size):
+        dtype = np.dtype([('iter', np.int64),
+                          ('particle', np.int32),
+                          ('X', np.float64, (num_dims,)),
+                          ('Fvals', np.float64, (output_size,)),
+                          ('Flist', np.float64, (output_size,))])
+        self.buffer = np.zeros(self.chunk_size, dtype=dtype)
+        self.count = 0
+
+    def record(self, last_iter, particles, X, Fvals, Flist):
+        # append one row per particle. The rows are numbered so that the
+        # last one has iteration 'last_iter'. X is (n, D), Fvals and Flist
+        # are (n, outputs)
+        n = len(particles)
+        if n == 0:
+            return
+        if self.buffer is None:
+            self.allocate(np.shape(X)[1], np.shape(Fvals)[1])
+        if n == 1: # sequential and ask/tell modes, one row per call
+            self.buffer[self.count] = (last_iter, particles[0], X[0], Fvals[0], Flist[0])
+            self.count = self.count + 1
+            if self.count == self.chunk_size:
+                self.end_segment()
+            return
+        iters = np.arange(last_iter - n + 1, last_iter + 1)
+
+        start = 0
+        while start < n:
+            take = min(n - start, self.chunk_size - self.count)
+            rows = self.buffer[self.count:self.count + take]
+            rows['iter'] = iters[start:start + take]
+            rows['particle'] = particles[start:start + take]
+            rows['X'] = X[start:start + take]
+            rows['Fvals'] = Fvals[start:start + take]
+            rows['Flist'] = Flist[start:start + take]
+            self.count = self.count + take
+            start = start + take
+            if self.count == self.chunk_size:
+                self.end_segment()
+
+    def end_segment(self):
+        self.write_segment()
+        self.segment = self.segment + 1
+        self.rows_written = self.rows_written + self.count
+        self.count = 0
+
+    def write_segment(self):
+        # written under a temporary name and renamed, so readers never
+        # see a partial file
+        path = os.path.join(self.directory, SEGMENT_PATTERN % self.segment)
+        tmp_path = path + ".tmp"
+        with open(tmp_path, 'wb') as f:
+            np.save(f, self.buffer[:self.count])
+        os.replace(tmp_path, path)
+
+    def flush(self):
+        # write out the partial segment. It is rewritten as it fills up
+        if (self.buffer is not None) and (self.count > 0):
+            self.write_segment()
+
+    def truncate(self, last_iter):
+        # drop the rows recorded after iteration 'last_iter'. Used when the
+        # swarm is resumed from a checkpoint older than the history
+        self.flush()
+        segments = segment_files(self.directory)
+        while len(segments) > 0:
+            rows = np.load(segments[-1])
+            keep = rows[rows['iter'] <= last_iter]
+            if len(keep) > 0 or len(segments) == 1:
+                break
+            os.remove(segments.pop())
+        if len(segments) == 0:
+            self.buffer = None
+            self.count = 0
+            self.segment = 0
+            self.rows_written = 0
+            return
+
+        self.segment = len(segments) - 1
+        self.rows_written = self.segment*self.chunk_size
+        self.buffer = np.zeros(self.chunk_size, dtype=keep.dtype)
+        self.buffer[:len(keep)] = keep
+        self.count = len(keep)
+        if self.count > 0:
+            self.write_segment()
+        else:
+            os.remove(segments[-1])
+
+    def close(self):
+        self.flush()
+
+    def __len__(self):
+        return self.rows_written + self.count
+
+
+def segment_files(directory):
+    return sorted(glob.glob(os.path.join(directory, "segment_*.npy")))
+
+
+def read_trajectory(directory, fields=None):
+    # generator over the recorded history, one memory-mapped segment at a time.
+    # fields: optional list of field names, e.g. ['iter', 'Flist']
+    # usage:
+    #   for rows in read_trajectory('history'):
+    #       best = np.min(np.linalg.norm(rows['Flist'], axis=1))
+    for path in segment_files(directory):
+        rows = np.load(path, mmap_mode='r')
+        if fields != None:
+            rows = rows[fields]
+        yield rows
+
+
+def trajectory_length(directory):
+    # number of recorded rows, from the segment headers only
+    length = 0
+    for path in segment_files(directory):
+        length = length + len(np.load(path, mmap_mode='r'))
+    return length
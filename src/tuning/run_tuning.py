@@ -0,0 +1,190 @@
+#! /usr/bin/python3
+
+##--------------------------------------------------------------------\
+#   pso_python
+#   './pso_python/src/tuning/run_tuning.py'
+#   Parameter tuning for the 'swarm' class in particle_swarm.py. Runs
+#       every configuration of the search space in tuning_configs.py
+#       on every problem, REPEATS times with fixed seeds, across a
+#       process pool. Each finished run is appended to a CSV results
+#       file right away, and runs already in that file are skipped, so
+#       an interrupted sweep resumes where it stopped. The report ranks
+#       configurations by success rate, then by the median evaluations
+#       to tolerance, with IQRs of evaluations and wall time.
+#
+#       python tuning/run_tuning.py --results tuning.csv --report tuning_report.csv
+#
+#   Author(s): Jonathan Lundquist, Lauren Linkous
+#   Last update: October 18, 2026
+##--------------------------------------------------------------------\
+
+
+import os
+import sys
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import argparse
+import csv
+import itertools
+import json
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import numpy as np
+import pandas as pd
+import swarm_runner as runner
+import tuning_configs as tc
+
+
+RESULT_FIELDS = ['problem', 'config', 'NO_OF_PARTICLES', 'T_MOD', 'BOUNDARY', 'WEIGHTS', 'VLIM',
+                 'repeat', 'seed', 'iterations', 'best_eval', 'converged', 'evals_to_tol', 'wall_time']
+
+
+def build_tasks(problems, space, repeats, base_seed=tc.BASE_SEED):
+    # one task per problem, configuration and repeat. 'config' is a stable
+    # JSON key of the opt_df values, used to group repeats and to resume
+    names = list(space)
+    tasks = []
+    for problem in problems:
+        for values in itertools.product(*[space[n] for n in names]):
+            params = dict(zip(names, values))
+            config = json.dumps(params, sort_keys=True)
+            for repeat in range(0, repeats):
+                tasks.append({'problem': problem, 'config': config, 'params': params,
+                              'repeat': repeat, 'seed': base_seed + repeat})
+    return tasks
+
+
+def run_task(task, maxit=tc.MAXIT, mode=tc.MODE):
+    # one seeded run, with the loop from main_test.py
+    params = task['params']
+    start = time.perf_counter()
+    myOptimizer = runner.problem_swarm(task['problem'], params, maxit,
+                                       mode=mode, seed=task['seed'],
+                                       decimal_limit=tc.DECIMAL_LIMIT)
+    runner.run_swarm(myOptimizer)
+    wall_time = time.perf_counter() - start
+
+    iterations, best_eval = myOptimizer.get_convergence_data()
+    converged = bool(myOptimizer.converged())
+    row = {'problem': task['problem'], 'config': task['config']}
+    for name in ['NO_OF_PARTICLES', 'T_MOD', 'BOUNDARY', 'VLIM']:
+        row[name] = params[name]
+    row['WEIGHTS'] = json.dumps(params['WEIGHTS'])
+    row.update({'repeat': task['repeat'],
+                'seed': task['seed'],
+                'iterations': int(iterations),
+                'best_eval': float(best_eval),
+                'converged': converged,
+                'evals_to_tol': int(iterations) if converged else '',
+                'wall_time': wall_time})
+    return row
+
+
+def truncate_partial_row(path):
+    # drops a last row cut short by an interrupted write, so that rows
+    # appended on resume start on a new line and the file stays valid CSV
+    if not os.path.exists(path):
+        return
+    with open(path, 'rb+') as f:
+        data = f.read()
+        end = data.rfind(b"\n") + 1
+        if end < len(data):
+            f.truncate(end)
+
+
+def completed_runs(path):
+    # (problem, config, repeat) of the runs already in the results file
+    done = set()
+    if not os.path.exists(path):
+        return done
+    with open(path, newline='') as f:
+        for row in csv.DictReader(f):
+            try:
+                float(row['wall_time'])
+                done.add((row['problem'], row['config'], int(row['repeat'])))
+            except (TypeError, ValueError):
+                continue
+    return done
+
+
+def run_sweep(tasks, path, workers=tc.WORKERS, verbose=True):
+    # runs the tasks missing from 'path' and appends each row as it finishes.
+    # A row cut short by an interrupted sweep is removed first, and run again
+    truncate_partial_row(path)
+    done = completed_runs(path)
+    pending = [t for t in tasks if (t['problem'], t['config'], t['repeat']) not in done]
+    if verbose:
+        print("%d runs, %d already in %s" % (len(tasks), len(tasks) - len(pending), path))
+    if len(pending) == 0:
+        return
+
+    new_file = (not os.path.exists(path)) or (os.path.getsize(path) == 0)
+    with open(path, 'a', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=RESULT_FIELDS)
+        if new_file:
+            writer.writeheader()
+        with ProcessPoolExecutor(workers) as executor:
+            futures = [executor.submit(run_task, t) for t in pending]
+            count = 0
+            for future in as_completed(futures):
+                row = future.result()
+                writer.writerow(row)
+                f.flush()
+                count = count + 1
+                if verbose and ((count % 50 == 0) or (count == len(pending))):
+                    print("[%d/%d] runs finished" % (count, len(pending)))
+
+
+def iqr(values):
+    values = values.dropna()
+    if len(values) == 0:
+        return np.nan
+    return float(np.percentile(values, 75) - np.percentile(values, 25))
+
+
+def summarize(results):
+    # one row per problem and configuration, ranked within each problem by
+    # success rate, then median evaluations to tolerance, then median wall time.
+    # Evaluation statistics are over the converged runs only
+    results = results.dropna(subset=['wall_time']).copy() # rows cut short by an interrupted write
+    results['evals_to_tol'] = pd.to_numeric(results['evals_to_tol'], errors='coerce')
+    results['converged'] = results['converged'].astype(str) == 'True'
+    groups = results.groupby(['problem', 'config'])
+    summary = groups[['NO_OF_PARTICLES', 'T_MOD', 'BOUNDARY', 'WEIGHTS', 'VLIM']].first()
+    summary['runs'] = groups.size()
+    summary['success_rate'] = groups['converged'].mean()
+    summary['median_evals'] = groups['evals_to_tol'].median()
+    summary['iqr_evals'] = groups['evals_to_tol'].agg(iqr)
+    summary['median_wall_time'] = groups['wall_time'].median()
+    summary['iqr_wall_time'] = groups['wall_time'].agg(iqr)
+    summary['median_best_eval'] = groups['best_eval'].median()
+    summary = summary.reset_index().sort_values(
+        ['problem', 'success_rate', 'median_evals', 'median_wall_time'],
+        ascending=[True, False, True, True], na_position='last')
+    summary['rank'] = summary.groupby('problem').cumcount() + 1
+    return summary.drop(columns='config').reset_index(drop=True)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="pso_python parameter tuning")
+    parser.add_argument('--results', default='tuning_results.csv', help="per run results, resumed if it exists")
+    parser.add_argument('--report', default='tuning_report.csv', help="ranked summary")
+    parser.add_argument('--problems', nargs='+', default=tc.PROBLEMS, help="problems to run")
+    parser.add_argument('--repeats', type=int, default=tc.REPEATS, help="seeded runs per configuration")
+    parser.add_argument('--workers', type=int, default=tc.WORKERS, help="process pool size")
+    parser.add_argument('--quick', action='store_true', help="use QUICK_SPACE")
+    parser.add_argument('--top', type=int, default=tc.TOP, help="configurations printed per problem")
+    args = parser.parse_args()
+
+    space = tc.QUICK_SPACE if args.quick else tc.SEARCH_SPACE
+    tasks = build_tasks(args.problems, space, args.repeats)
+    run_sweep(tasks, args.results, args.workers)
+
+    summary = summarize(pd.read_csv(args.results, on_bad_lines='skip'))
+    summary.to_csv(args.report, index=False)
+    print("report written to " + args.report)
+    with pd.option_context('display.width', 200, 'display.max_columns', None):
+        for problem, rows in summary.groupby('problem'):
+            print("\n" + problem)
+            print(rows.head(args.top).to_string(index=False))
@@ -0,0 +1,44 @@
+#! /usr/bin/python3
+
+##--------------------------------------------------------------------\
+#   pso_python
+#   './pso_python/src/tuning/tuning_configs.py'
+#   Search space for run_tuning.py. Every combination of the opt_df
+#       values below is one configuration, and each configuration is
+#       run REPEATS times on every problem with the seeds
+#       BASE_SEED, BASE_SEED + 1, ... so that configurations are
+#       compared on the same random streams.
+#
+#   Author(s): Jonathan Lundquist, Lauren Linkous
+#   Last update: October 18, 2026
+##--------------------------------------------------------------------\
+
+
+# problems, by name in the PROBLEMS registry of swarm_runner.py
+PROBLEMS = ['one_dim_x_test', 'himmelblau', 'lundquist_3_var']
+
+# opt_df values to search
+SEARCH_SPACE = {
+    'NO_OF_PARTICLES': [10, 20, 40],
+    'T_MOD': [0.5, 0.65, 0.8],
+    'BOUNDARY': [1, 2, 3, 4],   # 1 = random, 2 = reflecting, 3 = absorbing, 4 = invisible
+    'WEIGHTS': [[[0.5, 0.7, 0.78]], [[0.7, 0.5, 0.5]], [[0.4, 1.0, 1.0]]],
+    'VLIM': [0.5, 1, 2],
+}
+
+# --quick search space
+QUICK_SPACE = {
+    'NO_OF_PARTICLES': [10, 20],
+    'T_MOD': [0.65],
+    'BOUNDARY': [1, 2],
+    'WEIGHTS': [[[0.5, 0.7, 0.78]]],
+    'VLIM': [1],
+}
+
+REPEATS = 5                    # seeded runs per configuration and problem
+BASE_SEED = 1
+MAXIT = 5000                   # objective evaluations per run
+MODE = "batch"                 # swarm mode, batch uses OBJECTIVE_FUNC_BATCH/CONSTR_FUNC_BATCH
+DECIMAL_LIMIT = 5
+WORKERS = None                 # process pool size, None uses one per core
+TOP = 10                       # configurations printed per problem
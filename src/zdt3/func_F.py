@@ -0,0 +1,47 @@
+#! /usr/bin/python3
+
+##--------------------------------------------------------------------\
+#   pso_python
+#   '.src/zdt3/func_F.py'
+#   ZDT3 test problem, N-dimensional, 2 objectives. Disconnected Pareto
+#       front, reached when x_2..x_n = 0. f_2 goes below 0.
+#       func_F takes one position, func_F_batch an (N, IN_VARS) array
+#
+#   Author(s): Lauren Linkous, Jonathan Lundquist
+#   Last update: October 18, 2026
+##--------------------------------------------------------------------\
+
+import numpy as np
+
+def func_F(X, NO_OF_OUTS=2):
+    F = np.zeros((NO_OF_OUTS))
+    noErrors = True
+    try:
+        x = np.array(X, dtype=float).reshape(-1)
+        g = 1 + 9*np.sum(x[1:])/(len(x) - 1)
+        F[0] = x[0]
+        F[1] = g*(1 - np.sqrt(x[0]/g) - (x[0]/g)*np.sin(10*np.pi*x[0]))
+    except:
+        noErrors = False
+
+    return F, noErrors
+
+
+def func_F_batch(X, NO_OF_OUTS=2):
+    # vectorized objective. X is (N, IN_VARS), F is (N, NO_OF_OUTS)
+    # noErrors is a per-row flag so one bad row does not discard the batch
+    X = np.atleast_2d(X)
+    F = np.zeros((np.shape(X)[0], NO_OF_OUTS))
+    noErrors = np.zeros(np.shape(X)[0], dtype=bool)
+    try:
+        with np.errstate(all='ignore'):
+            g = 1 + 9*np.sum(X[:, 1:], axis=1)/(np.shape(X)[1] - 1)
+            F[:, 0] = X[:, 0]
+            F[:, 1] = g*(1 - np.sqrt(X[:, 0]/g) - (X[:, 0]/g)*np.sin(10*np.pi*X[:, 0]))
+        noErrors = np.all(np.isfinite(F), axis=1)
+    except:
+        pass
+
+    return F, noErrors
+
+func_F_batch.vectorized = True